@@ -14,6 +14,8 @@ class Aircraft(GameObject.GameObject):
     """
     This is a base class for all moving objects in the game
     """
+    __slots__ = ('max_speed', 'initial_location', 'current_health')
+
     def __init__(self, location, owner, aircraft_id, unique_id, max_speed, initial_location, health):
         """
         :param location: the aircraft's location
@@ -33,66 +35,9 @@ class Aircraft(GameObject.GameObject):
         """
         GameObject.GameObject.__init__(self, location, owner, aircraft_id, unique_id)
 
-        self.__max_speed = max_speed
-        self.__initial_location = initial_location
-        self.__current_health = health
-
-    @property
-    def max_speed(self):
-        """
-        Gets the aircraft's max speed.
-
-        :return: The max_speed.
-        :rtype: int
-        """
-        return self.__max_speed
-
-    @max_speed.setter
-    def max_speed(self, value):
-        """
-        This property sets the new max_speed.
-
-        :param value: The new max_speed.
-        :type value: int
-        """
-        self.__max_speed = value
-
-    @property
-    def initial_location(self):
-        """
-        Gets the aircraft's initial location.
-
-        :return: The initial_location.
-        :rtype: LocationClass.Location
-        """
-        return self.__initial_location
-
-    @initial_location.setter
-    def initial_location(self, value):
-        """
-        This property sets the new initial_location.
-
-        :param value: The new initial_location.
-        :type value: LocationClass.Location
-        """
-        self.__initial_location = value
-
-    @property
-    def current_health(self):
-        """
-        Gets the aircraft's current health
-
-        :return: the aircraft's current health
-        :rtype: int
-        """
-        return self.__current_health
-
-    @current_health.setter
-    def current_health(self, value):
-        """
-        Sets the aircraft's current health
-
-        :param value: the new current health
-        :type value: int
-        """
-        self.__current_health = value
+        self.max_speed = max_speed
+        """:type : int"""
+        self.initial_location = initial_location
+        """:type : LocationClass.Location"""
+        self.current_health = health
+        """:type : int"""
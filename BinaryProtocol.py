@@ -0,0 +1,376 @@
+"""
+This module holds the length-prefixed binary framing, an optional alternative to the newline delimited json.
+
+Every frame is a 4 byte big-endian payload length followed by the payload. The first byte of the payload is the
+message kind. Turns and bot orders are packed with the fixed struct layouts below, any other message (setup, turn_delta
+or anything the layouts can't express) is sent as a json payload inside the frame.
+"""
+import json
+import os
+import struct
+
+try:
+    import msvcrt  # only exists on windows, where streams translate new lines unless told otherwise
+except ImportError:
+    msvcrt = None
+
+# message kinds
+JSON_MESSAGE = 0
+TURN_MESSAGE = 1
+BOT_ORDERS_MESSAGE = 2
+
+# order kinds
+MOVE_ORDER = 0
+ATTACK_ORDER = 1
+
+FRAME_HEADER = struct.Struct(b'!I')  # payload length
+MESSAGE_KIND = struct.Struct(b'!B')
+COUNT = struct.Struct(b'!I')  # number of records in a section
+
+PLAYER = struct.Struct(b'!hi')  # id, score
+# id, unique_id, row, col, owner, initial row, initial col, attack_range, max_speed, current_health
+PIRATE = struct.Struct(b'!iihhbhhhhh')
+# id, unique_id, row, col, owner, initial row, initial col, attack_range, max_speed, turns_to_revive
+DEAD_PIRATE = struct.Struct(b'!iihhbhhhhh')
+# id, unique_id, row, col, owner, initial row, initial col, max_speed, current_health, value
+DRONE = struct.Struct(b'!iihhbhhhhh')
+# id, unique_id, row, col, owner, control_range, turns_to_drone_creation
+ISLAND = struct.Struct(b'!iihhbhh')
+# id, unique_id, row, col, owner, unload_range, value_multiplier
+CITY = struct.Struct(b'!iihhbhh')
+
+# crashed
+BOT_ORDERS = struct.Struct(b'!?')
+# order kind, acting_aircraft, then the destination (row, col) for a move or the target unique id and 0 for an attack
+ORDER = struct.Struct(b'!Biii')
+MESSAGE_LENGTH = struct.Struct(b'!I')
+
+
+def _pack_players(records):
+    return [PLAYER.pack(record['id'], record['score']) for record in records]
+
+
+def _unpack_players(values):
+    return [{'id': player_id, 'score': score} for player_id, score in values]
+
+
+def _pack_pirates(records):
+    pack = PIRATE.pack
+    return [pack(record['id'], record['unique_id'], record['location'][0], record['location'][1], record['owner'],
+                 record['initial_location'][0], record['initial_location'][1], record['attack_range'],
+                 record['max_speed'], record['current_health']) for record in records]
+
+
+def _unpack_pirates(values):
+    return [{'id': pirate_id, 'unique_id': unique_id, 'location': [row, col], 'owner': owner,
+             'initial_location': [initial_row, initial_col], 'attack_range': attack_range, 'max_speed': max_speed,
+             'current_health': current_health}
+            for (pirate_id, unique_id, row, col, owner, initial_row, initial_col, attack_range, max_speed,
+                 current_health) in values]
+
+
+def _pack_dead_pirates(records):
+    pack = DEAD_PIRATE.pack
+    return [pack(record['id'], record['unique_id'], record['location'][0], record['location'][1], record['owner'],
+                 record['initial_location'][0], record['initial_location'][1], record['attack_range'],
+                 record['max_speed'], record['turns_to_revive']) for record in records]
+
+
+def _unpack_dead_pirates(values):
+    return [{'id': pirate_id, 'unique_id': unique_id, 'location': [row, col], 'owner': owner,
+             'initial_location': [initial_row, initial_col], 'attack_range': attack_range, 'max_speed': max_speed,
+             'turns_to_revive': turns_to_revive}
+            for (pirate_id, unique_id, row, col, owner, initial_row, initial_col, attack_range, max_speed,
+                 turns_to_revive) in values]
+
+
+def _pack_drones(records):
+    pack = DRONE.pack
+    return [pack(record['id'], record['unique_id'], record['location'][0], record['location'][1], record['owner'],
+                 record['initial_location'][0], record['initial_location'][1], record['max_speed'],
+                 record['current_health'], record['value']) for record in records]
+
+
+def _unpack_drones(values):
+    return [{'id': drone_id, 'unique_id': unique_id, 'location': [row, col], 'owner': owner,
+             'initial_location': [initial_row, initial_col], 'max_speed': max_speed, 'current_health': current_health,
+             'value': value}
+            for (drone_id, unique_id, row, col, owner, initial_row, initial_col, max_speed, current_health,
+                 value) in values]
+
+
+def _pack_islands(records):
+    pack = ISLAND.pack
+    return [pack(record['id'], record['unique_id'], record['location'][0], record['location'][1], record['owner'],
+                 record['control_range'], record['turns_to_drone_creation']) for record in records]
+
+
+def _unpack_islands(values):
+    return [{'id': island_id, 'unique_id': unique_id, 'location': [row, col], 'owner': owner,
+             'control_range': control_range, 'turns_to_drone_creation': turns_to_drone_creation}
+            for island_id, unique_id, row, col, owner, control_range, turns_to_drone_creation in values]
+
+
+def _pack_cities(records):
+    pack = CITY.pack
+    return [pack(record['id'], record['unique_id'], record['location'][0], record['location'][1], record['owner'],
+                 record['unload_range'], record['value_multiplier']) for record in records]
+
+
+def _unpack_cities(values):
+    return [{'id': city_id, 'unique_id': unique_id, 'location': [row, col], 'owner': owner,
+             'unload_range': unload_range, 'value_multiplier': value_multiplier}
+            for city_id, unique_id, row, col, owner, unload_range, value_multiplier in values]
+
+
+# the sections of a turn message in the order they are packed, with their record layout
+TURN_SECTIONS = (
+    ('players', PLAYER, _pack_players, _unpack_players),
+    ('pirates', PIRATE, _pack_pirates, _unpack_pirates),
+    ('dead_pirates', DEAD_PIRATE, _pack_dead_pirates, _unpack_dead_pirates),
+    ('drones', DRONE, _pack_drones, _unpack_drones),
+    ('islands', ISLAND, _pack_islands, _unpack_islands),
+    ('cities', CITY, _pack_cities, _unpack_cities),
+)
+
+
+def _format_turn(data):
+    """
+    Packs the sections of a turn message.
+
+    :param data: the data of the turn message.
+    :type data: dict[unicode, list[dict[unicode, any]]]
+    :return: the packed payload parts.
+    :rtype: list[str]
+    """
+    parts = [MESSAGE_KIND.pack(TURN_MESSAGE)]
+    for section, _, pack_records, _ in TURN_SECTIONS:
+        records = data[section]
+        parts.append(COUNT.pack(len(records)))
+        parts.extend(pack_records(records))
+    return parts
+
+
+def _format_bot_orders(message):
+    """
+    Packs a bot orders message.
+
+    :param message: the bot orders message.
+    :type message: dict[unicode, any]
+    :return: the packed payload parts.
+    :rtype: list[str]
+    """
+    orders = message['data']['orders']
+    debug_messages = message['data']['debug_messages']
+    parts = [MESSAGE_KIND.pack(BOT_ORDERS_MESSAGE), BOT_ORDERS.pack(message['crashed']), COUNT.pack(len(orders))]
+    for order in orders:
+        if not isinstance(order, dict):
+            # already in the compact positional form of OrderBuffer
+            if order[0] == MOVE_ORDER:
+                parts.append(ORDER.pack(MOVE_ORDER, order[1], order[2], order[3]))
+            else:
+                parts.append(ORDER.pack(ATTACK_ORDER, order[1], order[2], 0))
+        elif order['order_type'] == 'move':
+            row, col = order['order_args']['destination']
+            parts.append(ORDER.pack(MOVE_ORDER, order['acting_aircraft'], row, col))
+        else:
+            parts.append(ORDER.pack(ATTACK_ORDER, order['acting_aircraft'], order['order_args']['target'], 0))
+    parts.append(COUNT.pack(len(debug_messages)))
+    for debug_message in debug_messages:
+        # debug messages are base64 encoded, so they are always ascii
+        text = debug_message['message'].encode('ascii')
+        parts.append(MESSAGE_LENGTH.pack(len(text)))
+        parts.append(text)
+    return parts
+
+
+def format_frame(message):
+    """
+    This function formats a message as a single length-prefixed binary frame.
+
+    Turns and bot orders are packed with the fixed layouts of this module, any other message is sent as json.
+
+    :param message: the message to format, a dictionary with 'type' and 'data'.
+    :type message: dict[unicode, any]
+    :return: the formatted frame.
+    :rtype: str
+    """
+    message_type = message.get('type')
+    # the layouts hold only the standard keys, so messages with extra keys (like a protocol ack) fall back to json
+    if message_type == 'turn' and set(message.keys()) == {'type', 'data'}:
+        parts = _format_turn(message['data'])
+    elif message_type == 'bot_orders' and set(message.keys()) == {'type', 'data', 'crashed'}:
+        parts = _format_bot_orders(message)
+    else:
+        parts = [MESSAGE_KIND.pack(JSON_MESSAGE), json.dumps(message)]
+    payload = b''.join(parts)
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+def _parse_records(payload, offset, layout, count):
+    """
+    Unpacks count records of the given layout from the payload.
+
+    :return: the unpacked values of each record, and the offset after them.
+    :rtype: (list[tuple], int)
+    """
+    unpack_from = layout.unpack_from
+    size = layout.size
+    values = [unpack_from(payload, offset + index * size) for index in xrange(count)]
+    return values, offset + count * size
+
+
+def _always_received(size):
+    """
+    The default for the ensure argument of the parse functions, when the whole payload is already in memory.
+    """
+    return True
+
+
+def _require(ensure, size):
+    """
+    Makes sure size bytes of the payload were received before unpacking them.
+
+    :raise struct.error: if the stream ended before them.
+    """
+    if not ensure(size):
+        raise struct.error('The stream ended in the middle of a frame.')
+
+
+def _parse_turn(payload, offset, ensure=_always_received):
+    """
+    Unpacks the sections of a turn message. Each section is unpacked as soon as its bytes were received.
+
+    :return: the turn message.
+    :rtype: dict[unicode, any]
+    """
+    data = {}
+    for section, layout, _, unpack_records in TURN_SECTIONS:
+        _require(ensure, offset + COUNT.size)
+        count, = COUNT.unpack_from(payload, offset)
+        offset += COUNT.size
+        _require(ensure, offset + count * layout.size)
+        values, offset = _parse_records(payload, offset, layout, count)
+        data[section] = unpack_records(values)
+    return {'type': 'turn', 'data': data}
+
+
+def _parse_bot_orders(payload, offset):
+    """
+    Unpacks a bot orders message.
+
+    :return: the bot orders message.
+    :rtype: dict[unicode, any]
+    """
+    crashed, = BOT_ORDERS.unpack_from(payload, offset)
+    offset += BOT_ORDERS.size
+    count, = COUNT.unpack_from(payload, offset)
+    values, offset = _parse_records(payload, offset + COUNT.size, ORDER, count)
+    orders = []
+    for order_kind, acting_aircraft, first, second in values:
+        if order_kind == MOVE_ORDER:
+            orders.append({'type': 'order', 'order_type': 'move', 'acting_aircraft': acting_aircraft,
+                           'order_args': {'destination': [first, second]}})
+        else:
+            orders.append({'type': 'order', 'order_type': 'attack', 'acting_aircraft': acting_aircraft,
+                           'order_args': {'target': first}})
+    count, = COUNT.unpack_from(payload, offset)
+    offset += COUNT.size
+    debug_messages = []
+    for _ in xrange(count):
+        length, = MESSAGE_LENGTH.unpack_from(payload, offset)
+        offset += MESSAGE_LENGTH.size
+        debug_messages.append({'type': 'message', 'message': str(payload[offset:offset + length])})
+        offset += length
+    return {'type': 'bot_orders', 'data': {'orders': orders, 'debug_messages': debug_messages}, 'crashed': crashed}
+
+
+def _parse_payload(payload, start, end, ensure=_always_received):
+    """
+    Parses the payload found at payload[start:end].
+
+    :raise struct.error: if the payload is incorrect or the stream ended before it.
+    """
+    message_kind, = MESSAGE_KIND.unpack_from(payload, start)
+    if message_kind == TURN_MESSAGE:
+        # the turn is the only big message, it is decoded while the rest of it is still arriving
+        return _parse_turn(payload, start + MESSAGE_KIND.size, ensure)
+    _require(ensure, end)
+    if message_kind == BOT_ORDERS_MESSAGE:
+        return _parse_bot_orders(payload, start + MESSAGE_KIND.size)
+    return json.loads(str(payload[start + MESSAGE_KIND.size:end]))
+
+
+def parse_frame(payload):
+    """
+    This turns the payload of a binary frame into the same dictionary the json would have given.
+
+    :param payload: the payload of the frame, without the length prefix.
+    :type payload: str | bytearray
+    :return: the message dictionary. Or an empty dictionary if the payload is incorrect.
+    :rtype: dict
+    """
+    # the payload might be incorrect so try and catch is used, the same way parse_data does.
+    try:
+        return _parse_payload(payload, 0, len(payload))
+    except (struct.error, ValueError, TypeError):
+        return dict()
+
+
+def read_frame(in_stream):
+    """
+    Reads a single frame from the stream and parses it.
+
+    :param in_stream: the stream to read from, opened in binary mode.
+    :type in_stream: file
+    :return: the message dictionary. Or an empty dictionary if the stream ended or the frame is incorrect.
+    :rtype: dict
+    """
+    header = in_stream.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return dict()
+    length, = FRAME_HEADER.unpack(header)
+    payload = in_stream.read(length)
+    if len(payload) < length:
+        return dict()
+    return parse_frame(payload)
+
+
+def read_buffered_frame(reader):
+    """
+    Reads a single frame with a FrameReader, decoding it straight from the reader's buffer.
+
+    :param reader: the reader to read the frame with.
+    :type reader: FrameReader.FrameReader
+    :return: the message dictionary. Or an empty dictionary if the stream ended or the frame is incorrect. A frame
+      that the end of the stream cut short is dropped, so the reader is at its end after it.
+    :rtype: dict
+    """
+    reader.begin_frame()
+    if not reader.ensure(FRAME_HEADER.size + MESSAGE_KIND.size):
+        reader.discard()
+        return dict()
+    buffer = reader.buffer
+    length, = FRAME_HEADER.unpack_from(buffer, 0)
+    frame_end = FRAME_HEADER.size + length
+    try:
+        message = _parse_payload(buffer, FRAME_HEADER.size, frame_end, reader.ensure)
+    except (struct.error, ValueError, TypeError):
+        message = dict()
+    # skip whatever is left of an incorrect frame, so the next frame is read from the right place
+    if not reader.ensure(frame_end):
+        reader.discard()
+        return dict()
+    reader.consume(frame_end)
+    return message
+
+
+def set_binary_mode(stream):
+    """
+    Makes sure the stream doesn't translate new lines, which only happens on windows.
+
+    :param stream: the stream to switch to binary mode.
+    :type stream: file
+    """
+    if msvcrt is not None:
+        msvcrt.setmode(stream.fileno(), os.O_BINARY)
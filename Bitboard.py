@@ -0,0 +1,207 @@
+"""
+This module encodes sets of map cells as the bits of python ints, for fast unions, intersections and counts.
+
+Python ints have no size limit and their bitwise operators run over whole machine words, so the same masks serve
+large maps as well, without a separate bytearray layout.
+"""
+
+# enable type hinting without causing a real circular imports loop
+# WARNING: THIS DOES NOT ACTUALLY IMPORT THESE CLASSES. EVER!
+if __name__ == '__main__':
+    import MapObject
+
+from LocationClass import Location
+
+
+class Bitboard(object):
+    """
+    The layout of the cells of a map in the bits of an int, and the masks of the shapes used by the game.
+
+    A mask is a plain int with a bit for every cell in the set, so masks are combined with the int operators: | for the
+    union, & for the intersection and & ~ for the difference. The rows are padded with empty cells on every side, so a
+    diamond mask made once for a radius is moved anywhere on the map with a single shift, and the cells that fall off
+    the map are cleared with a single & of the map mask.
+    """
+    def __init__(self, row_count, col_count, max_radius):
+        """
+        :param row_count: the number of rows in the map.
+        :type row_count: int
+        :param col_count: the number of cols in the map.
+        :type col_count: int
+        :param max_radius: the largest radius of the diamonds, which is the padding around the map. It is clamped to
+          the largest distance on the map, which is enough for a diamond of any radius around a cell of the map.
+        :type max_radius: int
+        """
+        self.row_count = row_count
+        """:type : int"""
+        self.col_count = col_count
+        """:type : int"""
+        # a diamond of this radius around any cell of the map already covers the whole map
+        self.__full_radius = max(0, row_count + col_count - 2)
+        """:type : int"""
+        self.max_radius = min(max_radius, self.__full_radius)
+        """:type : int"""
+        # the number of bits of each padded row
+        self.__stride = col_count + 2 * self.max_radius
+        """:type : int"""
+        row_mask = ((1 << col_count) - 1) << self.max_radius
+        board_mask = 0
+        for row in xrange(row_count):
+            board_mask |= row_mask << ((row + self.max_radius) * self.__stride)
+        # the mask of all the cells of the map
+        self.board_mask = board_mask
+        """:type : int"""
+        # the diamonds by their radius, centered on the cell at (0, 0), before clearing the cells off the map
+        self.__diamonds = {}
+        """:type : dict[int, int]"""
+
+    def __get_bit(self, row, col):
+        """
+        Gets the index of the bit of a cell.
+
+        :rtype: int
+        """
+        return (row + self.max_radius) * self.__stride + col + self.max_radius
+
+    def fits(self, radius):
+        """
+        Gets whether the diamonds of a radius around the cells of the map fit in the padding of the bitboard.
+
+        :param radius: the radius.
+        :type radius: int
+        :rtype: bool
+        """
+        return radius <= self.max_radius or self.max_radius == self.__full_radius
+
+    def cell_mask(self, row, col):
+        """
+        Gets the mask of a single cell.
+
+        :param row: the row of the cell.
+        :type row: int
+        :param col: the col of the cell.
+        :type col: int
+        :return: the mask, 0 if the cell is not on the map.
+        :rtype: int
+        """
+        if 0 <= row < self.row_count and 0 <= col < self.col_count:
+            return 1 << self.__get_bit(row, col)
+        return 0
+
+    def cells_mask(self, map_objects):
+        """
+        Gets the mask of the cells of map objects.
+
+        :param map_objects: the map objects.
+        :type map_objects: list[MapObject.MapObject]
+        :rtype: int
+        """
+        mask = 0
+        for map_object in map_objects:
+            location = map_object.get_location()
+            mask |= self.cell_mask(location.row, location.col)
+        return mask
+
+    def diamond_mask(self, row, col, radius):
+        """
+        Gets the mask of the cells within a manhattan range of a cell.
+
+        :param row: the row of the center.
+        :type row: int
+        :param col: the col of the center.
+        :type col: int
+        :param radius: the range, which should fit in the padding, see :func:`fits`. Around a cell of the map, a range
+          past the largest distance on the map is the same as that distance.
+        :type radius: int
+        :return: the mask.
+        :rtype: int
+        """
+        if radius < 0:
+            return 0
+        if radius > self.__full_radius and 0 <= row < self.row_count and 0 <= col < self.col_count:
+            radius = self.__full_radius
+        if radius > self.max_radius:
+            raise ValueError('Radius {radius} is larger than the max radius {max_radius} of the bitboard.'.format(
+                radius=radius, max_radius=self.max_radius))
+        diamond = self.__diamonds.get(radius)
+        if diamond is None:
+            diamond = self.__diamonds[radius] = self.__make_diamond(radius)
+        # the diamond is centered on (0, 0), which is the bit of the cell plus the padding of the row above it
+        shift = row * self.__stride + col
+        if shift >= 0:
+            return (diamond << shift) & self.board_mask
+        return (diamond >> -shift) & self.board_mask
+
+    def __make_diamond(self, radius):
+        """
+        Makes the diamond of a radius centered on the cell at (0, 0), keeping the cells in the padding.
+
+        :rtype: int
+        """
+        diamond = 0
+        for row_offset in xrange(-radius, radius + 1):
+            width = radius - abs(row_offset)
+            first_bit = self.__get_bit(row_offset, -width)
+            diamond |= ((1 << (2 * width + 1)) - 1) << first_bit
+        return diamond
+
+    def cover_mask(self, map_objects, radius):
+        """
+        Gets the union of the diamonds around map objects, e.g. the cells covered by the attacks of pirates.
+
+        :param map_objects: the map objects in the centers.
+        :type map_objects: list[MapObject.MapObject]
+        :param radius: the range, either the same for all the objects or a function from an object to its range.
+        :type radius: int | (MapObject.MapObject) -> int
+        :rtype: int
+        """
+        mask = 0
+        for map_object in map_objects:
+            location = map_object.get_location()
+            mask |= self.diamond_mask(location.row, location.col, radius if isinstance(radius, (int, long)) else
+                                      radius(map_object))
+        return mask
+
+    def contains(self, mask, row, col):
+        """
+        Gets whether a cell is in a mask.
+
+        :param mask: the mask.
+        :type mask: int
+        :param row: the row of the cell.
+        :type row: int
+        :param col: the col of the cell.
+        :type col: int
+        :rtype: bool
+        """
+        return bool(mask & self.cell_mask(row, col))
+
+    @staticmethod
+    def count(mask):
+        """
+        Gets the number of cells in a mask.
+
+        :param mask: the mask.
+        :type mask: int
+        :rtype: int
+        """
+        return bin(mask).count('1')
+
+    def get_locations(self, mask):
+        """
+        Gets the locations of the cells in a mask.
+
+        :param mask: the mask.
+        :type mask: int
+        :return: the locations, ordered by row and then by col.
+        :rtype: list[Location]
+        """
+        stride = self.__stride
+        padding = self.max_radius
+        locations = []
+        while mask:
+            lowest = mask & -mask
+            bit = lowest.bit_length() - 1
+            locations.append(Location(bit // stride - padding, bit % stride - padding))
+            mask ^= lowest
+        return locations
@@ -16,6 +16,8 @@ class BaseCity(GameObject.GameObject):
     This is the base city class, should be inherited from in the engine and the runner.
     Cities are used by players to generate points by sending there drones
     """
+    __slots__ = ('unload_range', 'value_multiplier')
+
     def __init__(self, location, city_id, unique_id, unload_range, value_multiplier=1, owner=None):
         """
         :param location: the city's location
@@ -34,8 +36,10 @@ class BaseCity(GameObject.GameObject):
         """
         GameObject.GameObject.__init__(self, location, owner, city_id, unique_id)
 
-        self.__unload_range = unload_range
-        self.__value_multiplier = value_multiplier
+        self.unload_range = unload_range
+        """:type : int"""
+        self.value_multiplier = value_multiplier
+        """:type : int"""
 
     def in_unload_range(self, map_object):
         """
@@ -47,43 +51,3 @@ class BaseCity(GameObject.GameObject):
         :rtype: bool
         """
         return self.in_range(map_object, self.unload_range)
-
-    @property
-    def unload_range(self):
-        """
-        Gets the city's unload range.
-
-        :return: The city's unload range.
-        :rtype: int
-        """
-        return self.__unload_range
-
-    @unload_range.setter
-    def unload_range(self, value):
-        """
-        Sets the city's unload range
-
-        :param value: The new unload range.
-        :type value: int
-        """
-        self.__unload_range = value
-
-    @property
-    def value_multiplier(self):
-        """
-        Gets the city's value multiplier.
-
-        :return: The value_multiplier.
-        :rtype: int
-        """
-        return self.__value_multiplier
-
-    @value_multiplier.setter
-    def value_multiplier(self, value):
-        """
-        This property sets the new value_multiplier.
-
-        :param value: The new value_multiplier.
-        :type value: int
-        """
-        self.__value_multiplier = value
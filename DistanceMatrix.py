@@ -0,0 +1,146 @@
+"""
+This module computes the distances between every pair of objects of two sets at once.
+"""
+from array import array
+from itertools import izip
+
+try:
+    import numpy
+except ImportError:
+    # the matrices fall back to plain arrays
+    numpy = None
+
+# enable type hinting without causing a real circular imports loop
+# WARNING: THIS DOES NOT ACTUALLY IMPORT THESE CLASSES. EVER!
+if __name__ == '__main__':
+    import MapObject
+
+
+class Matrix(object):
+    """
+    A compact row major matrix in a single array, used when NumPy is not installed. It is indexed like a NumPy matrix:
+    matrix[i, j] is a single value and matrix[i] is a row.
+    """
+    def __init__(self, row_count, col_count, values):
+        """
+        :param row_count: the number of rows.
+        :type row_count: int
+        :param col_count: the number of cols.
+        :type col_count: int
+        :param values: the values, row after row.
+        :type values: array
+        """
+        self.shape = (row_count, col_count)
+        """:type : (int, int)"""
+        self.values = values
+        """:type : array"""
+
+    def __getitem__(self, index):
+        row_count, col_count = self.shape
+        if isinstance(index, tuple):
+            row, col = index
+            return self.values[_check_index(row, row_count) * col_count + _check_index(col, col_count)]
+        row = _check_index(index, row_count)
+        return self.values[row * col_count:(row + 1) * col_count]
+
+    def __len__(self):
+        return self.shape[0]
+
+    def tolist(self):
+        """
+        Gets the matrix as a list of rows.
+
+        :rtype: list[list[int]]
+        """
+        return [self[row].tolist() for row in xrange(self.shape[0])]
+
+    def __repr__(self):
+        return 'Matrix({rows})'.format(rows=self.tolist())
+
+
+def _check_index(index, size):
+    """
+    Checks an index of a matrix dimension, counting negative indexes from the end like NumPy does.
+
+    :param index: the index.
+    :type index: int
+    :param size: the size of the dimension.
+    :type size: int
+    :return: the index, from the start.
+    :rtype: int
+    :raises IndexError: if the index is out of the dimension.
+    """
+    checked_index = index + size if index < 0 else index
+    if not 0 <= checked_index < size:
+        raise IndexError('Index {index} is out of bounds for a dimension of size {size}.'.format(index=index,
+                                                                                                  size=size))
+    return checked_index
+
+
+def _get_coordinates(map_objects):
+    """
+    Gets the rows and the cols of the locations of map objects.
+
+    :type map_objects: list[MapObject.MapObject]
+    :rtype: (list[int], list[int])
+    """
+    locations = [map_object.get_location() for map_object in map_objects]
+    return [location.row for location in locations], [location.col for location in locations]
+
+
+def distance_matrix(sources, targets):
+    """
+    Computes the manhattan distance between every source and every target.
+
+    :param sources: the map objects of the rows.
+    :type sources: list[MapObject.MapObject]
+    :param targets: the map objects of the cols.
+    :type targets: list[MapObject.MapObject]
+    :return: the distances, matrix[i, j] is the distance between sources[i] and targets[j]. A NumPy array when NumPy is
+      installed, a :class:`Matrix` otherwise.
+    :rtype: numpy.ndarray | Matrix
+    """
+    source_rows, source_cols = _get_coordinates(sources)
+    target_rows, target_cols = _get_coordinates(targets)
+    if numpy is not None:
+        source_rows = numpy.array(source_rows, dtype=numpy.int32)[:, None]
+        source_cols = numpy.array(source_cols, dtype=numpy.int32)[:, None]
+        return (numpy.abs(source_rows - numpy.array(target_rows, dtype=numpy.int32)) +
+                numpy.abs(source_cols - numpy.array(target_cols, dtype=numpy.int32)))
+
+    target_coordinates = zip(target_rows, target_cols)
+    values = array('i')
+    for source_row, source_col in izip(source_rows, source_cols):
+        values.extend([abs(source_row - target_row) + abs(source_col - target_col)
+                       for target_row, target_col in target_coordinates])
+    return Matrix(len(sources), len(targets), values)
+
+
+def in_range_matrix(sources, targets, manhattan_range):
+    """
+    Computes whether every target is within range of every source.
+
+    :param sources: the map objects of the rows.
+    :type sources: list[MapObject.MapObject]
+    :param targets: the map objects of the cols.
+    :type targets: list[MapObject.MapObject]
+    :param manhattan_range: the range, either the same for all the sources or a list with the range of each source.
+    :type manhattan_range: int | list[int]
+    :return: matrix[i, j] is whether targets[j] is within range of sources[i]. A NumPy bool array when NumPy is
+      installed, a :class:`Matrix` of 0 and 1 otherwise.
+    :rtype: numpy.ndarray | Matrix
+    """
+    distances = distance_matrix(sources, targets)
+    if numpy is not None:
+        if isinstance(manhattan_range, (int, long)):
+            return distances <= manhattan_range
+        return distances <= numpy.array(manhattan_range, dtype=numpy.int32)[:, None]
+
+    if isinstance(manhattan_range, (int, long)):
+        manhattan_range = [manhattan_range] * len(sources)
+    col_count = len(targets)
+    values = distances.values
+    in_range = array('b')
+    for row, source_range in enumerate(manhattan_range):
+        in_range.extend([distance <= source_range for distance in values[row * col_count:(row + 1) * col_count]])
+    return Matrix(len(sources), col_count, in_range)
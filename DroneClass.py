@@ -16,6 +16,8 @@ class BaseDrone(Aircraft.Aircraft):
     Drones are used by players to generate points. Drones are made in islands, and once they arrive in a city they
     generate points for their owner.
     """
+    __slots__ = ('value',)
+
     def __init__(self, location, owner, drone_id, unique_id, max_speed, initial_location, health, value):
         """
         :param location: the drone's location
@@ -37,25 +39,6 @@ class BaseDrone(Aircraft.Aircraft):
         """
         Aircraft.Aircraft.__init__(self, location, owner, drone_id, unique_id, max_speed, initial_location, health)
 
-        self.__value = value
+        # the drone's value, in points
+        self.value = value
         """:type : int"""
-
-    @property
-    def value(self):
-        """
-        Gets the drone's value (in points).
-
-        :return: The value.
-        :rtype: int
-        """
-        return self.__value
-
-    @value.setter
-    def value(self, value):
-        """
-        This property sets the drone's value.
-
-        :param value: The drone's new value.
-        :type value: int
-        """
-        self.__value = value
@@ -0,0 +1,186 @@
+"""
+This module finds what changed in the game between consecutive turns, as a list of events.
+"""
+from IslandClass import BaseIsland
+from DroneClass import BaseDrone
+
+# enable type hinting without causing a real circular imports loop
+# WARNING: THIS DOES NOT ACTUALLY IMPORT THESE CLASSES. EVER!
+if __name__ == '__main__':
+    import GameObject
+    import PlayerClass
+    import CityClass
+    import LocationClass
+
+# the event types
+SPAWNED = 'spawned'
+DIED = 'died'
+REVIVED = 'revived'
+MOVED = 'moved'
+DAMAGED = 'damaged'
+ISLAND_CAPTURED = 'island_captured'
+DRONE_DELIVERED = 'drone_delivered'
+EVENT_TYPES = (SPAWNED, DIED, REVIVED, MOVED, DAMAGED, ISLAND_CAPTURED, DRONE_DELIVERED)
+
+
+class Event(object):
+    """
+    A single change to a game object between the previous turn and the current turn.
+
+    The meaning of before and after depends on the type of the event:
+        * spawned - None and the location of the new pirate or drone.
+        * died - the last location of the pirate or drone and None.
+        * revived - None and the location the pirate revived at.
+        * moved - the previous and the current location.
+        * damaged - the previous and the current health.
+        * island_captured - the previous and the current owner of the island.
+        * drone_delivered - the last location of the drone and the city it was unloaded at.
+    """
+    __slots__ = ('type', 'game_object', 'before', 'after')
+
+    def __init__(self, event_type, game_object, before, after):
+        """
+        :param event_type: the type of the event, one of EVENT_TYPES.
+        :type event_type: str
+        :param game_object: the object that changed. Objects that are gone keep the fields they had in their last turn.
+        :type game_object: GameObject.GameObject
+        :param before: the value before the change.
+        :type before: any
+        :param after: the value after the change.
+        :type after: any
+        """
+        self.type = event_type
+        """:type : str"""
+        self.game_object = game_object
+        """:type : GameObject.GameObject"""
+        self.before = before
+        """:type : any"""
+        self.after = after
+        """:type : any"""
+
+    def __repr__(self):
+        # repr is defined and not str because it works when printing lists, and undefined str is always equal to repr.
+        return '{{Event {type} {object}: {before} -> {after}}}'.format(type=self.type, object=self.game_object,
+                                                                       before=self.before, after=self.after)
+
+
+class EventTracker(object):
+    """
+    Keeps a snapshot of the fields of every object that the events are about, and compares each turn to the snapshot of
+    the previous turn by unique id.
+    """
+    def __init__(self):
+        # unique id to (object, alive, location, health, owner), in the order the objects were seen
+        self.__snapshot = None
+        """:type : dict[int, (GameObject.GameObject, bool, LocationClass.Location, int, PlayerClass.BasePlayer)]"""
+        self.__order = []
+        """:type : list[int]"""
+        # player id to score
+        self.__scores = {}
+        """:type : dict[int, int]"""
+        # the cities of the previous turn, to tell a delivered drone from a dead one
+        self.__cities = []
+        """:type : list[CityClass.BaseCity]"""
+
+    def update(self, players, islands, cities):
+        """
+        Takes the snapshot of the current turn, and finds the events since the previous snapshot.
+
+        :param players: all the players, with their pirates and drones.
+        :type players: list[PlayerClass.BasePlayer]
+        :param islands: all the islands.
+        :type islands: list[GameObject.GameObject]
+        :param cities: all the cities.
+        :type cities: list[CityClass.BaseCity]
+        :return: the events, none on the first snapshot.
+        :rtype: list[Event]
+        """
+        snapshot = {}
+        order = []
+        for player in players:
+            for pirate in player.all_pirates:
+                snapshot[pirate.unique_id] = (pirate, pirate.turns_to_revive == 0, pirate.location,
+                                              pirate.current_health, pirate.owner)
+                order.append(pirate.unique_id)
+            for drone in player.living_drones:
+                snapshot[drone.unique_id] = (drone, True, drone.location, drone.current_health, drone.owner)
+                order.append(drone.unique_id)
+        for island in islands:
+            snapshot[island.unique_id] = (island, True, island.location, 0, island.owner)
+            order.append(island.unique_id)
+
+        previous = self.__snapshot
+        previous_order = self.__order
+        previous_scores = self.__scores
+        previous_cities = self.__cities
+        self.__snapshot = snapshot
+        self.__order = order
+        self.__scores = dict((player.id, player.score) for player in players)
+        self.__cities = list(cities)
+        if previous is None:
+            return []
+
+        events = []
+        for unique_id in order:
+            game_object, alive, location, health, owner = snapshot[unique_id]
+            old = previous.get(unique_id)
+            if old is None:
+                if alive:
+                    events.append(Event(SPAWNED, game_object, None, location))
+                continue
+            _, was_alive, old_location, old_health, old_owner = old
+            if isinstance(game_object, BaseIsland):
+                if owner is not old_owner:
+                    events.append(Event(ISLAND_CAPTURED, game_object, old_owner, owner))
+            elif was_alive and not alive:
+                events.append(Event(DIED, game_object, old_location, None))
+            elif alive and not was_alive:
+                events.append(Event(REVIVED, game_object, None, location))
+            elif alive:
+                # locations are interned, so a location that didn't change is the same object
+                if location is not old_location:
+                    events.append(Event(MOVED, game_object, old_location, location))
+                if health < old_health:
+                    events.append(Event(DAMAGED, game_object, old_health, health))
+
+        # only drones disappear, either killed or unloaded at a city
+        for unique_id in previous_order:
+            if unique_id in snapshot:
+                continue
+            game_object, _, old_location, _, owner = previous[unique_id]
+            if not isinstance(game_object, BaseDrone):
+                continue
+            city = None
+            if self.__scores.get(owner.id, 0) > previous_scores.get(owner.id, 0):
+                city = self.__find_unload_city(game_object, old_location, previous_cities)
+            if city is not None:
+                events.append(Event(DRONE_DELIVERED, game_object, old_location, city))
+            else:
+                events.append(Event(DIED, game_object, old_location, None))
+        return events
+
+    @staticmethod
+    def __find_unload_city(drone, location, cities):
+        """
+        Finds the city a drone that is gone was unloaded at. The engine doesn't report deliveries, so a drone counts as
+        delivered when its owner scored this turn and it could reach the unload range of one of its owner's cities.
+
+        :param drone: the drone that is gone.
+        :type drone: BaseDrone
+        :param location: the drone's last location.
+        :type location: LocationClass.Location
+        :param cities: the cities of the previous turn.
+        :type cities: list[CityClass.BaseCity]
+        :return: the nearest city the drone could be unloaded at, or None.
+        :rtype: CityClass.BaseCity | None
+        """
+        best_city = None
+        best_distance = None
+        for city in cities:
+            if city.owner is not drone.owner:
+                continue
+            distance = city.distance(location)
+            if distance <= city.unload_range + drone.max_speed and (best_distance is None or distance < best_distance):
+                best_city = city
+                best_distance = distance
+        return best_city
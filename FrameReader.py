@@ -0,0 +1,156 @@
+"""
+This module holds the buffered reader the runner uses to receive frames from the engine.
+"""
+import io
+
+import BinaryProtocol
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class FrameReader(object):
+    """
+    Reads frames from the raw file descriptor of a stream in big chunks, into a single reusable buffer.
+
+    The current frame always starts at the beginning of the buffer, so decoders can unpack from the buffer directly
+    with absolute offsets and call :func:`ensure` only for the bytes they are about to decode. This lets the first
+    sections of a large frame be decoded while the rest of it is still arriving.
+    """
+    def __init__(self, in_stream, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        :param in_stream: the stream to read from. Nothing else should read from it once the reader is created.
+        :type in_stream: file
+        :param chunk_size: the initial size of the buffer, and the least amount of free space to read into.
+        :type chunk_size: int
+        """
+        BinaryProtocol.set_binary_mode(in_stream)
+        self.__file = io.FileIO(in_stream.fileno(), 'r', closefd=False)
+        """:type : io.FileIO"""
+        self.__chunk_size = chunk_size
+        """:type : int"""
+        self.__buffer = bytearray(chunk_size)
+        """:type : bytearray"""
+        # the received bytes that were not consumed yet are buffer[start:end]
+        self.__start = 0
+        """:type : int"""
+        self.__end = 0
+        """:type : int"""
+        # how far the current line was already searched for a new line, relative to start
+        self.__scanned = 0
+        """:type : int"""
+        self.__eof = False
+        """:type : bool"""
+
+    @property
+    def buffer(self):
+        """
+        Gets the buffer, which starts with the current frame after :func:`begin_frame`.
+
+        .. warning::
+            Only the bytes promised by :func:`ensure` are valid, and the buffer is reused for the next frames.
+
+        :return: the buffer.
+        :rtype: bytearray
+        """
+        return self.__buffer
+
+    @property
+    def at_eof(self):
+        """
+        Gets whether the stream ended and every byte received from it was consumed.
+
+        :return: whether the stream ended.
+        :rtype: bool
+        """
+        return self.__eof and self.__start == self.__end
+
+    def begin_frame(self):
+        """
+        Moves the unconsumed bytes to the beginning of the buffer, so the next frame starts at offset 0.
+        """
+        if self.__start == 0:
+            return
+        remaining = self.__end - self.__start
+        if remaining:
+            # same length slice assignment never resizes the buffer, the slice is copied first since they may overlap
+            self.__buffer[0:remaining] = self.__buffer[self.__start:self.__end]
+        self.__start = 0
+        self.__end = remaining
+
+    def ensure(self, size):
+        """
+        Makes sure at least size bytes from the beginning of the current frame were received, reading more as needed.
+
+        :param size: the number of bytes needed, counted from the beginning of the buffer.
+        :type size: int
+        :return: whether the bytes are available, False if the stream ended before them.
+        :rtype: bool
+        """
+        while self.__end - self.__start < size:
+            if not self.__fill(self.__start + size):
+                return False
+        return True
+
+    def consume(self, size):
+        """
+        Marks the first size bytes of the current frame as used.
+
+        :param size: the number of bytes to consume.
+        :type size: int
+        """
+        self.__start += size
+        self.__scanned = 0
+        if self.__start == self.__end:
+            # nothing left, the next read can start from the beginning of the buffer without copying
+            self.__start = self.__end = 0
+
+    def discard(self):
+        """
+        Drops every received byte that was not consumed yet, e.g. a frame that the end of the stream cut short.
+        """
+        self.consume(self.__end - self.__start)
+
+    def read_line(self):
+        """
+        Reads a single line.
+
+        :return: the line without the new line char, or an empty string if the stream ended.
+        :rtype: str
+        """
+        while True:
+            new_line = self.__buffer.find(b'\n', self.__start + self.__scanned, self.__end)
+            if new_line != -1:
+                break
+            self.__scanned = self.__end - self.__start
+            if not self.__fill(self.__end + 1):
+                # the stream ended, return whatever is left of the last line
+                new_line = self.__end
+                break
+        line = memoryview(self.__buffer)[self.__start:new_line].tobytes()
+        self.consume(min(new_line + 1, self.__end) - self.__start)
+        return line
+
+    def __fill(self, needed_end):
+        """
+        Reads the next chunk from the stream, making room for at least needed_end bytes in the buffer.
+
+        :param needed_end: the buffer offset that should fit in the buffer after reading.
+        :type needed_end: int
+        :return: whether anything was read, False if the stream ended.
+        :rtype: bool
+        """
+        if self.__eof:
+            return False
+        if self.__start:
+            # a frame always starts at 0 after begin_frame, so only a partial line can be moved back here
+            needed_end -= self.__start
+            self.begin_frame()
+        free_needed = max(needed_end - self.__end, self.__chunk_size)
+        if len(self.__buffer) - self.__end < free_needed:
+            self.__buffer.extend(bytearray(self.__end + free_needed - len(self.__buffer)))
+        read_count = self.__file.readinto(memoryview(self.__buffer)[self.__end:])
+        if not read_count:
+            self.__eof = True
+            return False
+        self.__end += read_count
+        return True
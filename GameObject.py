@@ -14,6 +14,10 @@ class GameObject(MapObject.MapObject):
     """
     This is a base class for all interactable objects with a location in the game map
     """
+    # the fields are stored directly in the instance. The runner classes add a dictionary for the bots' own attributes,
+    # and __weakref__ lets bots keep caches of game objects in weak dictionaries.
+    __slots__ = ('location', 'owner', 'id', 'unique_id', '__weakref__')
+
     def __init__(self, location, owner, object_id, unique_id):
         """
         :param location: the object's location
@@ -27,70 +31,14 @@ class GameObject(MapObject.MapObject):
         """
         MapObject.MapObject.__init__(self)
 
-        self.__location = location
-        self.__owner = owner
-        self.__id = object_id
+        self.location = location
+        """:type : LocationClass.Location"""
+        self.owner = owner
+        """:type : PlayerClass.BasePlayer"""
+        self.id = object_id
+        """:type : int"""
         self.unique_id = unique_id
-
-    @property
-    def location(self):
-        """
-        Gets the object's location.
-
-        :return: The location.
-        :rtype: LocationClass.Location
-        """
-        return self.__location
-
-    @location.setter
-    def location(self, value):
-        """
-        This property sets the new location.
-
-        :param value: The new location.
-        :type value: LocationClass.Location
-        """
-        self.__location = value
-
-    @property
-    def owner(self):
-        """
-        Gets the object's owner.
-
-        :return: The owner.
-        :rtype: PlayerClass.BasePlayer
-        """
-        return self.__owner
-
-    @owner.setter
-    def owner(self, value):
-        """
-        This property sets the new owner.
-
-        :param value: The new owner.
-        :type value: PlayerClass.BasePlayer
-        """
-        self.__owner = value
-
-    @property
-    def id(self):
-        """
-        Gets the object's id.
-
-        :return: The id.
-        :rtype: int
-        """
-        return self.__id
-
-    @id.setter
-    def id(self, value):
-        """
-        This property sets the new id.
-
-        :param value: The new id.
-        :type value: int
-        """
-        self.__id = value
+        """:type : int"""
 
     @property
     def type(self):
@@ -0,0 +1,120 @@
+"""
+This module counts, for every cell of the map, the pirates that can attack it next turn.
+"""
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    # the grids fall back to plain arrays
+    numpy = None
+
+from DistanceMatrix import Matrix
+
+# enable type hinting without causing a real circular imports loop
+# WARNING: THIS DOES NOT ACTUALLY IMPORT THESE CLASSES. EVER!
+if __name__ == '__main__':
+    import MapObject
+    import PirateClass
+
+
+def reach_grid(row_count, col_count, pirates):
+    """
+    Counts the pirates that can attack each cell next turn, i.e. the pirates within their max speed plus their attack
+    range of the cell.
+
+    The diamond of each pirate is added a row span at a time into a grid of differences, where a span only touches its
+    first cell and the cell after its last. A single running sum over each row then turns the differences into counts,
+    so the cost is the number of rows of the diamonds plus the number of cells, instead of their product.
+
+    :param row_count: the number of rows in the map.
+    :type row_count: int
+    :param col_count: the number of cols in the map.
+    :type col_count: int
+    :param pirates: the pirates.
+    :type pirates: list[PirateClass.BasePirate]
+    :return: the counts, grid[row, col] is the count of the cell. A NumPy array when NumPy is installed, a
+      :class:`DistanceMatrix.Matrix` otherwise.
+    :rtype: numpy.ndarray | Matrix
+    """
+    # the spans of all the diamonds as (row, first col, col after the last), clipped to the map
+    span_rows = []
+    span_starts = []
+    span_ends = []
+    for pirate in pirates:
+        location = pirate.location
+        reach = pirate.attack_range + pirate.max_speed
+        for row in xrange(max(0, location.row - reach), min(row_count - 1, location.row + reach) + 1):
+            width = reach - abs(row - location.row)
+            start = max(0, location.col - width)
+            end = min(col_count - 1, location.col + width)
+            if start <= end:
+                span_rows.append(row)
+                span_starts.append(start)
+                span_ends.append(end + 1)
+
+    # each row has an extra col for the differences of the spans that end on the last col
+    if numpy is not None:
+        differences = numpy.zeros((row_count, col_count + 1), dtype=numpy.int32)
+        span_rows = numpy.array(span_rows, dtype=numpy.intp)
+        numpy.add.at(differences, (span_rows, numpy.array(span_starts, dtype=numpy.intp)), 1)
+        numpy.add.at(differences, (span_rows, numpy.array(span_ends, dtype=numpy.intp)), -1)
+        return numpy.cumsum(differences, axis=1, dtype=numpy.int32)[:, :col_count]
+
+    stride = col_count + 1
+    differences = array('i', [0]) * (row_count * stride)
+    for row, start, end in zip(span_rows, span_starts, span_ends):
+        differences[row * stride + start] += 1
+        differences[row * stride + end] -= 1
+    values = array('i')
+    for row in xrange(row_count):
+        total = 0
+        for index in xrange(row * stride, row * stride + col_count):
+            total += differences[index]
+            values.append(total)
+    return Matrix(row_count, col_count, values)
+
+
+class InfluenceMap(object):
+    """
+    The threat and the support of every cell of the map for the next turn. The threat of a cell is the number of enemy
+    pirates that can reach it with an attack, and the support is the same for my pirates. Each pirate attacks once a
+    turn, so the threat is also the most damage the enemy can deal on the cell.
+    """
+    def __init__(self, row_count, col_count, enemy_pirates, my_pirates):
+        """
+        :param row_count: the number of rows in the map.
+        :type row_count: int
+        :param col_count: the number of cols in the map.
+        :type col_count: int
+        :param enemy_pirates: the living enemy pirates.
+        :type enemy_pirates: list[PirateClass.BasePirate]
+        :param my_pirates: my living pirates.
+        :type my_pirates: list[PirateClass.BasePirate]
+        """
+        self.threat = reach_grid(row_count, col_count, enemy_pirates)
+        """:type : numpy.ndarray | Matrix"""
+        self.support = reach_grid(row_count, col_count, my_pirates)
+        """:type : numpy.ndarray | Matrix"""
+
+    def get_threat(self, map_object):
+        """
+        Gets the number of enemy pirates that can attack the cell of a map object next turn.
+
+        :param map_object: the map object, which must be on the map.
+        :type map_object: MapObject.MapObject
+        :rtype: int
+        """
+        location = map_object.get_location()
+        return int(self.threat[location.row, location.col])
+
+    def get_support(self, map_object):
+        """
+        Gets the number of my pirates that can attack the cell of a map object next turn.
+
+        :param map_object: the map object, which must be on the map.
+        :type map_object: MapObject.MapObject
+        :rtype: int
+        """
+        location = map_object.get_location()
+        return int(self.support[location.row, location.col])
@@ -16,6 +16,8 @@ class BaseIsland(GameObject.GameObject):
     This is the base island class, should be inherited from in the engine and the runner.
     Islands are captured by a player, and generate drones for that player over time.
     """
+    __slots__ = ('control_range', 'turns_to_drone_creation')
+
     def __init__(self, location, island_id, unique_id, control_range, turns_to_drone_creation=0,
                  owner=None):
         """
@@ -34,8 +36,11 @@ class BaseIsland(GameObject.GameObject):
         """
         GameObject.GameObject.__init__(self, location, owner, island_id, unique_id)
 
-        self.__control_range = control_range
-        self.__turns_to_drone_creation = turns_to_drone_creation
+        self.control_range = control_range
+        """:type : int"""
+        # the number of turns left before the island creates a new drone
+        self.turns_to_drone_creation = turns_to_drone_creation
+        """:type : int"""
 
     def in_control_range(self, map_object):
         """
@@ -47,43 +52,3 @@ class BaseIsland(GameObject.GameObject):
         :rtype: bool
         """
         return self.in_range(map_object, self.control_range)
-
-    @property
-    def control_range(self):
-        """
-        Gets the island's control range.
-
-        :return: The island's control range.
-        :rtype: int
-        """
-        return self.__control_range
-
-    @control_range.setter
-    def control_range(self, value):
-        """
-        Sets the island's control range.
-
-        :param value: The new control range.
-        :type value: int
-        """
-        self.__control_range = value
-
-    @property
-    def turns_to_drone_creation(self):
-        """
-        Gets the number of turns left before this island creates a new drone.
-
-        :return: The number of turns left before the island creates a new drone.
-        :rtype: int
-        """
-        return self.__turns_to_drone_creation
-
-    @turns_to_drone_creation.setter
-    def turns_to_drone_creation(self, value):
-        """
-        This property Sets the number of turns left before this island creates a new drone.
-
-        :param value: The new turns to drone creation.
-        :type value: int
-        """
-        self.__turns_to_drone_creation = value
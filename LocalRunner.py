@@ -0,0 +1,121 @@
+"""
+This module drives bots in the same process as the harness, with no serialization in between.
+
+The harness hands the same dictionaries the engine would send straight to :class:`LocalRunner`, which calls the
+runner's setup, update, do_turn and finish turn steps directly and returns the orders.
+"""
+import Pirates
+
+
+class LocalRunner(object):
+    """
+    Runs a single bot for a single player, in process.
+    """
+    def __init__(self, bot, module_name='bot'):
+        """
+        :param bot: the bot, either an object or module with a do_turn function, or the path of the bot file or the
+          bot directory.
+        :type bot: unicode | module | any
+        :param module_name: the name to load the bot module as, when given a path. Each bot in the same process needs
+          its own name.
+        :type module_name: str
+        """
+        if isinstance(bot, basestring):
+            # noinspection PyProtectedMember
+            bot = Pirates._BotController(Pirates._add_bot_to_path(bot), module_name)
+        self.__bot = bot
+        self.__game = Pirates.PirateGame(None)
+        """:type : Pirates.PirateGame"""
+        self.__last_reply = None
+        """:type : dict[str | unicode, any]"""
+
+    @property
+    def game(self):
+        """
+        Gets the game object the bot plays with.
+
+        :return: the game.
+        :rtype: Pirates.PirateGame
+        """
+        return self.__game
+
+    @property
+    def last_reply(self):
+        """
+        Gets the last reply, with the orders, the debug messages and whether the bot crashed.
+
+        :return: the last reply.
+        :rtype: dict[str | unicode, any]
+        """
+        return self.__last_reply
+
+    def send(self, message, decoded=False):
+        """
+        Handles a message the way the runner handles it when it is received from the engine.
+
+        .. warning::
+            The dictionaries are used as they are and not copied. The setup data is consumed, and with turn_delta the
+            records are kept and patched by the next turns.
+
+        :param message: the message, with its type and data.
+        :type message: dict[str | unicode, any]
+        :param decoded: Whether the sections of a turn already hold game objects instead of records.
+        :type decoded: bool
+        :return: the reply.
+        :rtype: dict[str | unicode, any]
+        """
+        game = self.__game
+        try:
+            # noinspection PyProtectedMember
+            self.__last_reply = game._handle_message(self.__bot, message, decoded)
+        except:
+            # noinspection PyProtectedMember
+            self.__last_reply = game._finish_turn(True)
+            raise
+        return self.__last_reply
+
+    def setup(self, data):
+        """
+        Sets the game up.
+
+        :param data: the setup data.
+        :type data: dict[str | unicode, any]
+        """
+        self.send({'type': 'setup', 'data': dict(data)})
+
+    def turn(self, data, decoded=False):
+        """
+        Plays a single turn.
+
+        :param data: the turn data, a dictionary of all the sections of a turn.
+        :type data: dict[str | unicode, any]
+        :param decoded: Whether the sections already hold game objects instead of records. The objects must be owned
+          by the players of :attr:`game`.
+        :type decoded: bool
+        :return: the orders the bot gave.
+        :rtype: list[dict[str | unicode, any]]
+        """
+        return self.send({'type': 'turn', 'data': data}, decoded)['data']['orders']
+
+
+def run_local_match(bots, engine):
+    """
+    Plays a match between bots in process, with the harness's engine.
+
+    :param bots: the bots, in the order of the players' ids. Each is whatever :class:`LocalRunner` takes.
+    :type bots: list
+    :param engine: the engine, with these methods:
+        * get_setup(player_id) - the setup data for the player.
+        * get_turn(player_id) - the turn data for the player.
+        * play_turn(orders) - plays a turn with the orders of all the players, a list in the order of their ids.
+        * is_over() - whether the match ended.
+    :type engine: any
+    :return: the runners of the bots, in the order of the players' ids.
+    :rtype: list[LocalRunner]
+    """
+    runners = [LocalRunner(bot, 'bot{player_id}'.format(player_id=player_id)) for player_id, bot in enumerate(bots)]
+    for player_id, runner in enumerate(runners):
+        runner.setup(engine.get_setup(player_id))
+    while not engine.is_over():
+        engine.play_turn([runner.turn(engine.get_turn(player_id)) for player_id, runner in enumerate(runners)])
+    return runners
@@ -3,79 +3,118 @@ This class contains the most basic Location class, both the engine PythonRunner
 """
 import MapObject
 
+# the col count used for the hash of new locations before the map size is known
+DEFAULT_COL_COUNT = 100
+
 
 class Location(MapObject.MapObject):
     """
     This is the most basic Location class, both the engine and the runner use it.
+
+    Locations are immutable and interned: there is a single Location object for each (row, col) of the map, so creating
+    a location that already exists doesn't allocate anything and the same cell can be compared with is. To move a
+    location, create a new one with :func:`replace` or with Location(row, col), instead of setting its row or col.
     """
-    def __init__(self, row, col):
+    # no per instance dictionary, the row, col and hash are stored directly in the instance
+    __slots__ = ('row', 'col', '_hash')
+
+    # the interned locations, by (class, row, col). They are kept for the match, see set_map_size, so the same
+    # (row, col) is always the same object, with the same hash.
+    __locations = {}
+    """:type : dict[(type, int, int), Location]"""
+    # the width of the hash of new locations, the hash of a location on the map is unique while this is at least the
+    # map's col count
+    __hash_col_count = DEFAULT_COL_COUNT
+    """:type : int"""
+
+    def __new__(cls, row, col):
         """
-        Creates a new instance of the Location class.
+        Gets the location of the given row and col, creating it the first time it is used.
 
         :param row: the row of the location
         :type row: int
         :param col: the col of the location
         :type col: int
+        :rtype: Location
         """
-        self.__row = row
-        """:type : int"""
-        self.__col = col
-        """:type : int"""
-
-        MapObject.MapObject.__init__(self)
+        try:
+            return Location.__locations[cls, row, col]
+        except KeyError:
+            pass
+        location = MapObject.MapObject.__new__(cls)
+        # the setters are blocked, so the fields are set through object
+        # the row of the location (x value)
+        object.__setattr__(location, 'row', row)
+        # the col of the location (y value)
+        object.__setattr__(location, 'col', col)
+        object.__setattr__(location, '_hash', row * Location.__hash_col_count + col)
+        Location.__locations[cls, row, col] = location
+        return location
+
+    @staticmethod
+    def set_map_size(row_count, col_count):
+        """
+        Starts the locations of a new match: sizes the hash to the map, so that no two locations on the map collide.
+        Called when the game is set up.
+
+        The locations that were already created get the new hash as well, so they still hash like the new locations of
+        the same cell. Those on the map stay interned, and the rest are dropped, so the table never holds more than
+        the cells of the map of the current match. Sets and dicts of locations made before this call have to be made
+        again.
+
+        :param row_count: the number of rows in the map
+        :type row_count: int
+        :param col_count: the number of cols in the map
+        :type col_count: int
+        """
+        Location.__hash_col_count = col_count
+        locations = {}
+        for key, location in Location.__locations.iteritems():
+            _, row, col = key
+            object.__setattr__(location, '_hash', row * col_count + col)
+            if 0 <= row < row_count and 0 <= col < col_count:
+                locations[key] = location
+        Location.__locations = locations
 
     @property
-    def row(self):
-        """
-        Gets the row of the location ( x value).
-
-        :return: The row.
-        :rtype: int
-        """
-        return self.__row
-
-    @row.setter
-    def row(self, value):
-        """
-        This property sets the new row.
-
-        :param value: The new row.
-        :type value: int
+    def as_tuple(self):
         """
-        self.__row = value
+        Gets the location as a (row, col) tuple
 
-    @property
-    def col(self):
+        :return: the location as a (row, col) tuple
+        :type: (int, int)
         """
-        Gets the col of the location ( y value).
+        return self.row, self.col
 
-        :return: The col.
-        :rtype: int
+    def replace(self, row=None, col=None):
         """
-        return self.__col
+        Gets the location with the given row and/or col instead of this location's.
+        This replaces setting the row or col of a location, which are immutable.
 
-    @col.setter
-    def col(self, value):
+        :param row: the new row, or None to keep this location's row
+        :type row: int | None
+        :param col: the new col, or None to keep this location's col
+        :type col: int | None
+        :return: the location with the new row and col
+        :rtype: Location
         """
-        This property sets the new col.
+        return Location(self.row if row is None else row, self.col if col is None else col)
 
-        :param value: The new col.
-        :type value: int
-        """
-        self.__col = value
+    def __setattr__(self, name, value):
+        raise AttributeError('Locations are immutable, use location.replace(row=..., col=...) or Location(row, col) to '
+                             'get the location with a new {name}'.format(name=name))
 
-    @property
-    def as_tuple(self):
-        """
-        Gets the location as a (row, col) tuple
+    def __delattr__(self, name):
+        raise AttributeError('Locations are immutable')
 
-        :return: the location as a (row, col) tuple
-        :type: (int, int)
-        """
-        return self.row, self.col
+    def __reduce__(self):
+        # copies and unpickled locations go through __new__ as well, so they are interned
+        return type(self), (self.row, self.col)
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        if isinstance(other, Location):
+            return self.row == other.row and self.col == other.col
+        return False
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -86,15 +125,13 @@ class Location(MapObject.MapObject):
 
     def __hash__(self):
         """
-        Returns a hash code for the location.
-
-        .. warning::
-            This forces the map to be smaller than 100 rows.
+        Returns a hash code for the location. Locations on the map never collide once the map size is set with
+        :func:`set_map_size`.
 
         :return: A hash code for the location
         :rtype: int
         """
-        return self.col * 100 + self.row
+        return self._hash
 
     def get_location(self):
         """
@@ -14,6 +14,8 @@ class MapObject(object):
     This is a base class for all objects with a location in the game map
     """
     __metaclass__ = ABCMeta
+    # subclasses define their own slots, so no map object has a per instance dictionary
+    __slots__ = ()
 
     @abstractmethod
     def get_location(self):
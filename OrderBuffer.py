@@ -0,0 +1,116 @@
+"""
+This module holds the buffer of the orders the bot gives during a turn.
+"""
+import BinaryProtocol
+
+
+class OrderBuffer(object):
+    """
+    Holds at most one order for each aircraft, keyed by its unique id. The last order given to an aircraft replaces any
+    order given to it before in the same turn, and keeps the place of the first one.
+
+    Orders are kept in the compact positional form [order kind, acting aircraft, args...], using the order kinds of
+    :mod:`BinaryProtocol`: [MOVE_ORDER, acting_aircraft, row, col] or [ATTACK_ORDER, acting_aircraft, target].
+    """
+    def __init__(self):
+        self.__orders = {}
+        """:type : dict[int, list[int]]"""
+        # the unique ids of the acting aircrafts, in the order they first got an order
+        self.__acting_aircrafts = []
+        """:type : list[int]"""
+
+    def move(self, acting_aircraft, row, col):
+        """
+        Orders an aircraft to move.
+
+        :param acting_aircraft: the unique id of the aircraft.
+        :type acting_aircraft: int
+        :param row: the row of the destination.
+        :type row: int
+        :param col: the col of the destination.
+        :type col: int
+        """
+        self.__set(acting_aircraft, [BinaryProtocol.MOVE_ORDER, acting_aircraft, row, col])
+
+    def attack(self, acting_aircraft, target):
+        """
+        Orders a pirate to attack.
+
+        :param acting_aircraft: the unique id of the attacking pirate.
+        :type acting_aircraft: int
+        :param target: the unique id of the target.
+        :type target: int
+        """
+        self.__set(acting_aircraft, [BinaryProtocol.ATTACK_ORDER, acting_aircraft, target])
+
+    def __set(self, acting_aircraft, order):
+        if acting_aircraft not in self.__orders:
+            self.__acting_aircrafts.append(acting_aircraft)
+        self.__orders[acting_aircraft] = order
+
+    def discard(self, acting_aircraft):
+        """
+        Removes the order given to an aircraft, if it got one. An order it gets later in the turn is sent after the
+        orders of the other aircrafts.
+
+        :param acting_aircraft: the unique id of the aircraft.
+        :type acting_aircraft: int
+        """
+        if self.__orders.pop(acting_aircraft, None) is not None:
+            self.__acting_aircrafts.remove(acting_aircraft)
+
+    def clear(self):
+        """
+        Removes all the orders, for the next turn.
+        """
+        self.__orders = {}
+        self.__acting_aircrafts = []
+
+    def __len__(self):
+        return len(self.__acting_aircrafts)
+
+    def get(self, acting_aircraft):
+        """
+        Gets the order given to an aircraft.
+
+        :param acting_aircraft: the unique id of the aircraft.
+        :type acting_aircraft: int
+        :return: the order in its compact form, or None if the aircraft has no order.
+        :rtype: list[int] | None
+        """
+        return self.__orders.get(acting_aircraft)
+
+    def compact_records(self):
+        """
+        Gets the orders in their compact positional form.
+
+        :return: the orders, in the order the aircrafts first got them.
+        :rtype: list[list[int]]
+        """
+        orders = self.__orders
+        return [orders[acting_aircraft] for acting_aircraft in self.__acting_aircrafts]
+
+    def records(self):
+        """
+        Gets the orders as the dictionaries the engine expects by default.
+
+        :return: the orders, in the order the aircrafts first got them.
+        :rtype: list[dict[str | unicode, any]]
+        """
+        return [expand_order(order) for order in self.compact_records()]
+
+
+def expand_order(order):
+    """
+    Turns an order from its compact positional form into the default dictionary form.
+
+    :param order: the order in its compact form.
+    :type order: list[int]
+    :return: the order dictionary.
+    :rtype: dict[str | unicode, any]
+    """
+    if order[0] == BinaryProtocol.MOVE_ORDER:
+        return {'type': 'order', 'order_type': 'move', 'acting_aircraft': order[1],
+                'order_args': {'destination': (order[2], order[3])}}
+    return {'type': 'order', 'order_type': 'attack', 'acting_aircraft': order[1],
+            'order_args': {'target': order[2]}}
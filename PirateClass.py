@@ -16,6 +16,8 @@ class BasePirate(Aircraft.Aircraft):
     """
     This is the most basic Pirate class, both the engine Pirate class and the PythonRunner Pirate class inherit from it.
     """
+    __slots__ = ('turns_to_revive', 'attack_range')
+
     def __init__(self, location, owner, pirate_id, unique_id, max_speed, initial_location, health, attack_range):
         """
         :param location: the location of the pirate
@@ -37,10 +39,10 @@ class BasePirate(Aircraft.Aircraft):
         """
         Aircraft.Aircraft.__init__(self, location, owner, pirate_id, unique_id, max_speed, initial_location, health)
 
-        # turns until the pirate respawn
-        self.__turns_to_revive = 0
+        # turns until the pirate respawn, 0 if it's alive
+        self.turns_to_revive = 0
         """:type : int"""
-        self.__attack_range = attack_range
+        self.attack_range = attack_range
         """:type : int"""
 
     def in_attack_range(self, map_object):
@@ -61,44 +63,4 @@ class BasePirate(Aircraft.Aircraft):
         :return: Whether the pirate is alive.
         :rtype: bool
         """
-        return self.__turns_to_revive == 0
-
-    @property
-    def turns_to_revive(self):
-        """
-        Gets the number of turns left for he pirate to revive. 0 if it's alive.
-
-        :return: The turns_to_revive.
-        :rtype: int
-        """
-        return self.__turns_to_revive
-
-    @turns_to_revive.setter
-    def turns_to_revive(self, value):
-        """
-        This property sets the new turns_to_revive.
-
-        :param value: The new turns_to_revive.
-        :type value: int
-        """
-        self.__turns_to_revive = value
-
-    @property
-    def attack_range(self):
-        """
-        Gets the attack range of the pirate.
-
-        :return: The pirate's attack range.
-        :rtype: int
-        """
-        return self.__attack_range
-
-    @attack_range.setter
-    def attack_range(self, value):
-        """
-        This property sets the pirate's attack range.
-
-        :param value: The new attack range.
-        :type value: int
-        """
-        self.__attack_range = value
+        return self.turns_to_revive == 0
@@ -18,12 +18,38 @@ from LocationClass import Location
 from Aircraft import Aircraft
 from MapObject import MapObject
 from GameObject import GameObject
+import BinaryProtocol
+from FrameReader import FrameReader
+from OrderBuffer import OrderBuffer
+from UnitTable import UnitTable
+from TurnCache import TurnCache, per_turn_cache, per_turn_list_cache
+from EventTracker import EventTracker, Event
+from TrajectoryHistory import TrajectoryHistory
+from Timeline import Timeline
+from SpatialIndex import SpatialIndex
+import DistanceMatrix
+from Bitboard import Bitboard
+from InfluenceMap import InfluenceMap
+from Router import Router, DEFAULT_DANGER_PENALTY
 
 import json  # Used for serializing the data communication.
+from itertools import izip
 
 
 DEFAULT_BOT_FILE = 'MyBot.py'
 
+# The command line option that makes the runner serve many games over the same pipe.
+MULTIPLEX_OPTION = 'multiplex'
+
+# The sections of a full turn, players first.
+STATE_SECTIONS = ('players', 'pirates', 'dead_pirates', 'drones', 'islands', 'cities')
+# The sections of game objects, which can be built lazily.
+LAZY_SECTIONS = STATE_SECTIONS[1:]
+# The record fields that only the records of a section have, dropped from a record that moves to another section.
+SECTION_ONLY_FIELDS = {'pirates': ('current_health',), 'dead_pirates': ('turns_to_revive',)}
+# The player list that the aircrafts of each section are in, see PirateGame.__update_player_lists.
+SECTION_PLAYER_LISTS = {'pirates': 'living_pirates', 'drones': 'living_drones'}
+
 
 def format_data(data, prettify=False):
     """
@@ -46,7 +72,7 @@ def format_data(data, prettify=False):
         return data_str + '\n'
 
 
-def parse_data(data_str):
+def parse_data(data_str, object_hook=None):
     """
     This turns the received data into a dictionary or list using json.
 
@@ -56,13 +82,31 @@ def parse_data(data_str):
 
     :param data_str: The input data to un format.
     :type data_str: str
+    :param object_hook: Called with every json object as soon as it is parsed, its result is used instead of the
+      dictionary. Default is None, which keeps the dictionaries.
+    :type object_hook: ((dict) -> any) | None
     :return: A json dictionary of the data. Or an empty dictionary if none was received.
     :rtype: dict
+    :raises: any error of the object hook, which is an error in the message and not a missing message.
     """
+    hook_errors = []
+    if object_hook is not None:
+        parse_object = object_hook
+
+        def object_hook(value):
+            try:
+                return parse_object(value)
+            except (ValueError, TypeError):
+                hook_errors.append(sys.exc_info())
+                raise
+
     # Json data might be incorrect so try and catch is used.
     try:
-        return json.loads(data_str)
+        return json.loads(data_str, object_hook=object_hook)
     except (ValueError, TypeError):
+        if hook_errors:
+            error_type, error, error_traceback = hook_errors[0]
+            raise error_type, error, error_traceback
         return dict()
 
 
@@ -72,6 +116,9 @@ class PirateGame(object):
 
     :param out_stream: the output stream to send the data to at the end of the turn
     :type out_stream: file | None
+    :param game_id: the id to tag every reply with, when many games share the same pipe. Default is None, for a runner
+      that serves a single game.
+    :type game_id: any
 
     .. note::
         The most important api is:
@@ -82,9 +129,13 @@ class PirateGame(object):
             * :func:`get_all_islands`
             * :func:`get_my_living_drones`
             * :func:`get_my_cities`
+
+    .. note::
+        The getters of pirates, drones, islands and cities build their lists once per turn, and every call gets a new
+        copy of the list. See :func:`TurnCache.per_turn_cache`, which bots can use for their own helpers.
     """
 
-    def __init__(self, out_stream):
+    def __init__(self, out_stream, game_id=None):
         # generic game settings
         self.__max_turn_time = 0
         """:type : int"""
@@ -147,9 +198,56 @@ class PirateGame(object):
         self.__neutral = Player(player_id=-1, bot_name='neutral')
         """:type : Player"""
 
-        # The orders the bot wants to run.
-        self._orders = []
-        """:type : list[dict[str | unicode, any]]"""
+        # every game object of the current turn by its unique id, objects are kept and updated between turns
+        self.__registry = {}
+        """:type : dict[int, GameObject]"""
+        # whether the objects of a section are built only when a getter needs them, see set_lazy_sections
+        self.__lazy_sections = False
+        """:type : bool"""
+        # the sections of the current turn that were not built yet, to their records and whether they are decoded
+        self.__pending_sections = {}
+        """:type : dict[str | unicode, (list, bool)]"""
+        # the unique ids of the objects each lazy section had when it was last built
+        self.__section_ids = {}
+        """:type : dict[str | unicode, collections.Set[int]]"""
+        # the aircrafts of each section when it was last built by unique id, to find the ones that joined or left it
+        self.__section_members = {}
+        """:type : dict[str | unicode, dict[int, Aircraft]]"""
+        # the owner whose list each aircraft is in and the object in the list, by (list name, unique id)
+        self.__listed = {}
+        """:type : dict[(str, int), (Player, Aircraft)]"""
+        # the pirates and drones of the current turn by (owner id, id)
+        self.__pirates_by_id = {}
+        """:type : dict[(int, int), Pirate]"""
+        self.__drones_by_id = {}
+        """:type : dict[(int, int), Drone]"""
+        # finds the changes between turns, only once the bot asked for the events
+        self.__event_tracker = None
+        """:type : EventTracker"""
+        self.__events = ()
+        """:type : tuple[Event]"""
+        # the recent locations and health of the living aircrafts, only kept once the bot asked for them
+        self.__history = None
+        """:type : TrajectoryHistory"""
+        # the future drone creations and pirate revives, only kept once the bot asked for them
+        self.__timeline = None
+        """:type : Timeline"""
+        # the results of the per turn cached functions, dropped at the beginning of every turn
+        self.__turn_cache = TurnCache()
+        """:type : TurnCache"""
+        # the columnar table of the living aircrafts, only kept up to date once the bot asked for it
+        self.__unit_table = None
+        """:type : UnitTable"""
+        # the bit layout of the map, made on the first request for a mask
+        self.__bitboard = None
+        """:type : Bitboard"""
+        # the masks of the islands and cities by their unique id, which never change since they never move
+        self.__static_masks = {}
+        """:type : dict[int, int]"""
+
+        # The orders the bot wants to run, at most one for each aircraft.
+        self._orders = OrderBuffer()
+        """:type : OrderBuffer"""
         # The debug messages the bot wants to send.
         self.__debug_messages = []
         """:type : list[dict[str | unicode, str]]"""
@@ -158,8 +256,33 @@ class PirateGame(object):
         self._initiated = False
         """:type : bool"""
 
+        # protocol features negotiated with the engine during setup
+        self.__turn_delta = False
+        """:type : bool"""
+        # whether messages are sent as binary frames instead of json lines, see BinaryProtocol
+        self._binary_frames = False
+        """:type : bool"""
+        # whether orders are sent in their compact positional form instead of dictionaries
+        self.__compact_orders = False
+        """:type : bool"""
+        # whether json turns are turned into game objects while parsing them, without building the dictionaries first
+        self._single_pass_decode = True
+        """:type : bool"""
+        # binary frames are used only after the reply to the setup message, which the engine expects as json
+        self.__switch_to_binary_frames = False
+        """:type : bool"""
+        # the accepted features, sent back once with the reply to the setup message
+        self.__protocol_ack = None
+        """:type : dict[str | unicode, any] | None"""
+        # the raw records of the last turn, patched by turn_delta messages
+        self.__delta_records = {}
+        """:type : dict[str | unicode, dict[int, dict[str | unicode, any]]]"""
+        self.__delta_players = []
+        """:type : list[dict[str | unicode, int]]"""
+
         # save the output stream to which we should send data at the end of the turn
         self.__out_stream = out_stream
+        self.__game_id = game_id
 
     def _setup(self, data):
         """
@@ -200,10 +323,14 @@ class PirateGame(object):
         # this attributes are used to create the all_players list later, and not saved in the runner object itself
         bot_names = data.pop('bot_names')
         my_id = int(data.pop('player_id'))
+        # the protocol offer is optional, older engines don't send it
+        self.__negotiate_protocol(data.pop('protocol', None))
 
         for key, value in data.iteritems():
             setattr(self, conversion_dictionary[key], value)
 
+        Location.set_map_size(self.__row_count, self.__col_count)
+
         for player_id in xrange(self.__num_players):
             player = Player(player_id, bot_names[player_id])
             self.__all_players.append(player)
@@ -214,39 +341,160 @@ class PirateGame(object):
         # Make sure the runner knows it has been initiated.
         self._initiated = True
 
-    def _update(self, data):
+    def __negotiate_protocol(self, offered):
+        """
+        Accepts the protocol features offered by the engine in the setup message.
+        Unknown features are ignored, so the engine keeps using the default protocol for them.
+
+        :param offered: the features the engine offers, e.g. {'turn_delta': True, 'compact_orders': True,
+          'codec': 'binary'}. None if nothing was offered.
+        :type offered: dict[unicode, any] | None
+        """
+        if offered is None:
+            return
+        accepted = {}
+        if offered.get('turn_delta'):
+            self.__turn_delta = True
+            accepted['turn_delta'] = True
+        if offered.get('compact_orders'):
+            self.__compact_orders = True
+            accepted['compact_orders'] = True
+        if 'codec' in offered:
+            # json stays the default for any codec the runner doesn't know, and for games that share a pipe
+            if offered['codec'] == 'binary' and self.__game_id is None:
+                self.__switch_to_binary_frames = True
+                accepted['codec'] = 'binary'
+            else:
+                accepted['codec'] = 'json'
+        self.__protocol_ack = accepted
+
+    def _update(self, data, decoded=False):
         """
         This method updates the state of the game objects.
 
         :param data: The data to update from, should be data dictionary from the engine.
         :type data: dict[unicode, any]
+        :param decoded: Whether the data was parsed with the object hook of :func:`_get_object_hook`.
+        :type decoded: bool
         """
         # start timer
         self.__turn_start_time = time.time()
 
-        expected = ['players',
-                    'pirates',
-                    'dead_pirates',
-                    'drones',
-                    'islands',
-                    'cities'
-                    ]
-
         # Check that all expected keys are here.
-        for expected_key in expected:
+        for expected_key in STATE_SECTIONS:
             if expected_key not in data.keys():
                 raise ValueError('Expected key {key} missing from json data dictionary.'.format(key=expected_key))
 
-        self.__all_islands = []
-        self.__all_cities = []
-        self._orders = []
+        # a full state resets the records that the next turn_delta messages are applied to
+        if self.__turn_delta:
+            self.__delta_players = data['players']
+            self.__delta_records = {}
+            for section in STATE_SECTIONS[1:]:
+                self.__delta_records[section] = dict((record['unique_id'], record) for record in data[section])
+
+        self.__update_state(data, decoded)
+
+    def _update_delta(self, data):
+        """
+        This method patches the records of the previous turn with a turn_delta message, and updates the state of the
+        game objects from the result.
+
+        The delta holds only what differs from the previous turn, all keys are optional:
+            * players - the players list, as in a full turn.
+            * created - section name to a list of full records of objects that didn't exist in the previous turn.
+            * changed - section name to a list of partial records, each with its unique_id and the changed fields.
+              A record listed under another section than before is moved to it (a pirate that died or revived), and
+              loses the fields that only the records of its previous section have, see SECTION_ONLY_FIELDS.
+            * removed - a list of unique ids of objects that no longer exist.
+
+        :param data: The delta to apply, should be data dictionary from the engine.
+        :type data: dict[unicode, any]
+        """
+        # start timer
+        self.__turn_start_time = time.time()
+
+        if not self.__turn_delta:
+            raise ValueError('Got a turn_delta message without negotiating turn_delta in setup.')
+        if not self.__delta_records:
+            raise ValueError('Got a turn_delta message before any full turn.')
+
+        records = self.__delta_records
+        for key in data.keys():
+            if key not in ('players', 'created', 'changed', 'removed'):
+                raise ValueError('Unrecognized key "{key}" in the turn_delta dict.'.format(key=key))
+
+        if 'players' in data:
+            self.__delta_players = data['players']
+
+        for unique_id in data.get('removed', []):
+            for section_records in records.itervalues():
+                if section_records.pop(unique_id, None) is not None:
+                    break
+
+        for section, created in data.get('created', {}).iteritems():
+            if section not in records:
+                raise ValueError('Unrecognized section "{key}" in the turn_delta dict.'.format(key=section))
+            section_records = records[section]
+            for record in created:
+                section_records[record['unique_id']] = record
+
+        for section, changed in data.get('changed', {}).iteritems():
+            if section not in records:
+                raise ValueError('Unrecognized section "{key}" in the turn_delta dict.'.format(key=section))
+            section_records = records[section]
+            for patch in changed:
+                unique_id = patch['unique_id']
+                record = section_records.get(unique_id)
+                if record is None:
+                    # the object moved between sections, e.g. from pirates to dead_pirates
+                    for other_section, other_records in records.iteritems():
+                        record = other_records.pop(unique_id, None)
+                        if record is not None:
+                            break
+                    else:
+                        raise ValueError('Changed object with unknown unique id {id}.'.format(id=unique_id))
+                    # the fields of the section it left are stale, e.g. the turns_to_revive of a revived pirate
+                    for field in SECTION_ONLY_FIELDS.get(other_section, ()):
+                        record.pop(field, None)
+                    section_records[unique_id] = record
+                record.update(patch)
+
+        state = {'players': self.__delta_players}
+        for section, section_records in records.iteritems():
+            state[section] = section_records.values()
+        # islands and cities are not sorted by the update, keep them in the order of a full turn
+        state['islands'].sort(key=lambda island: island['id'])
+        state['cities'].sort(key=lambda city: city['id'])
+
+        self.__update_state(state)
+
+    def __update_state(self, data, decoded=False):
+        """
+        This method updates the game objects from a full state. Objects that already exist are updated in place and
+        keep their identity, only new objects are built and objects that are gone are dropped.
+
+        With lazy sections, only the players are updated here and the records of every other section are kept until
+        the first getter that needs them, see :func:`set_lazy_sections`.
+
+        :param data: The full state, a dictionary of all the sections of a turn.
+        :type data: dict[unicode, any]
+        :param decoded: Whether the records were already turned into game objects while parsing, see
+          :func:`_get_object_hook`.
+        :type decoded: bool
+        """
+        # the islands and cities are kept, they are patched in place by the update
+        self._orders.clear()
         self.__debug_messages = []
         self.__turn += 1
+        # the results of the getters and of the bot's per_turn_cache functions belong to the previous turn
+        self.__turn_cache.new_turn()
+        self.__pending_sections = {}
+        self.__pirates_by_id = {}
+        self.__drones_by_id = {}
 
-        for player in self.__all_players:
-            player.all_pirates = []
-            player.living_pirates = []
-            player.living_drones = []
+        # the objects of this turn, objects of the previous turn that are not in it are dropped
+        registry = {}
+        """:type : dict[int, GameObject]"""
 
         # update map and create new pirate lists
         for key, value in data.iteritems():
@@ -255,91 +503,407 @@ class PirateGame(object):
                     player_id = player['id']
                     player_score = player['score']
                     self.__all_players[player_id].score = player_score
+            elif key not in LAZY_SECTIONS:
+                raise ValueError('Unrecognized key "{key}" in the json dict.'.format(key=key))
+            elif self.__lazy_sections:
+                self.__pending_sections[key] = (value, decoded)
+            else:
+                self.__load_section(key, value, decoded, registry)
+
+        if not self.__lazy_sections:
+            self.__registry = registry
+
+        if self.__event_tracker is not None:
+            self.__track_events()
 
-            elif key == 'pirates':
-                for pirate in value:
-                    pirate_id = pirate['id']
-                    unique_id = pirate['unique_id']
-                    location = Location(*pirate['location'])
-                    owner = self.__get_owner(pirate['owner'])
-                    initial_location = Location(*pirate['initial_location'])
-                    attack_range = pirate['attack_range']
-                    max_speed = pirate['max_speed']
-                    current_health = pirate['current_health']
-                    pirate_object = Pirate(location, owner, pirate_id, unique_id, max_speed, initial_location,
-                                           current_health, attack_range)
-
-                    owner.all_pirates.append(pirate_object)
-                    owner.living_pirates.append(pirate_object)
-
-            elif key == 'dead_pirates':
-                for dead_pirate in value:
-                    pirate_id = dead_pirate['id']
-                    unique_id = dead_pirate['unique_id']
-                    location = Location(*dead_pirate['location'])
-                    owner = self.__get_owner(dead_pirate['owner'])
-                    initial_location = Location(*dead_pirate['initial_location'])
-                    attack_range = dead_pirate['attack_range']
-                    max_speed = dead_pirate['max_speed']
-                    # dead pirates always have 0 health
-                    current_health = 0
-                    pirate_object = Pirate(location, owner, pirate_id, unique_id, max_speed, initial_location,
-                                           current_health, attack_range)
-                    pirate_object.turns_to_revive = dead_pirate['turns_to_revive']
-
-                    owner.all_pirates.append(pirate_object)
-
-            elif key == 'drones':
-                for drone in value:
-                    drone_id = drone['id']
-                    unique_id = drone['unique_id']
-                    initial_location = Location(*drone['initial_location'])
-                    location = Location(*drone['location'])
-                    owner = self.__get_owner(drone['owner'])
-                    max_speed = drone['max_speed']
-                    value = drone['value']
-                    current_health = drone['current_health']
-
-                    drone_object = Drone(location, owner, drone_id, unique_id, max_speed, initial_location,
-                                         current_health, value)
-
-                    owner.living_drones.append(drone_object)
-
-            elif key == 'islands':
-                for island in value:
-                    island_id = island['id']
-                    unique_id = island['unique_id']
-                    location = Location(*island['location'])
-                    owner = self.__get_owner(island['owner'])
-                    control_range = island['control_range']
-                    turns_to_drone_creation = island['turns_to_drone_creation']
-
-                    island_object = Island(location, island_id, unique_id, control_range, turns_to_drone_creation,
-                                           owner)
-
-                    self.__all_islands.append(island_object)
-
-            elif key == 'cities':
-                for city in value:
-                    city_id = city['id']
-                    unique_id = city['unique_id']
-                    location = Location(*city['location'])
-                    owner = self.__get_owner(city['owner'])
-                    unload_range = city['unload_range']
-                    value_multiplier = city['value_multiplier']
-
-                    city_object = City(location, city_id, unique_id, unload_range, value_multiplier, owner)
-
-                    self.__all_cities.append(city_object)
+        if self.__history is not None:
+            self.__record_history()
 
+        if self.__timeline is not None:
+            self.__update_timeline()
+
+        if self.__unit_table is not None:
+            if decoded:
+                self.__fill_unit_table()
             else:
-                raise ValueError('Unrecognized key "{key}" in the json dict.'.format(key=key))
+                self.__unit_table.fill_records(data['pirates'], data['drones'])
+
+    def __load_section(self, section, value, decoded, registry):
+        """
+        Turns the records of a section into game objects, and adds them to their owners' lists.
+
+        :param section: the name of the section.
+        :type section: str
+        :param value: the records of the section, or its objects if it was decoded already.
+        :type value: list[dict[unicode, any]] | list[GameObject]
+        :param decoded: Whether the section holds game objects instead of records.
+        :type decoded: bool
+        :param registry: the objects of this turn by unique id, the loaded objects are added to it.
+        :type registry: dict[int, GameObject]
+        """
+        if section == 'pirates':
+            pirates = value if decoded else map(self.__sync_pirate, value)
+            pirates_by_id = self.__pirates_by_id
+            for pirate_object in pirates:
+                registry[pirate_object.unique_id] = pirate_object
+                pirates_by_id[pirate_object.owner.id, pirate_object.id] = pirate_object
+            self.__update_player_lists(section, pirates)
+
+        elif section == 'dead_pirates':
+            dead_pirates = value if decoded else map(self.__sync_pirate, value)
+            pirates_by_id = self.__pirates_by_id
+            for pirate_object in dead_pirates:
+                registry[pirate_object.unique_id] = pirate_object
+                # dead pirates always have 0 health
+                pirate_object.current_health = 0
+                pirates_by_id[pirate_object.owner.id, pirate_object.id] = pirate_object
+            self.__update_player_lists(section, dead_pirates)
+
+        elif section == 'drones':
+            drones = value if decoded else map(self.__sync_drone, value)
+            drones_by_id = self.__drones_by_id
+            for drone_object in drones:
+                registry[drone_object.unique_id] = drone_object
+                drones_by_id[drone_object.owner.id, drone_object.id] = drone_object
+            self.__update_player_lists(section, drones)
+
+        elif section == 'islands':
+            self.__all_islands = value if decoded else self.__patch_static(self.__all_islands, value,
+                                                                           self.__patch_island, self.__sync_island)
+            for island_object in self.__all_islands:
+                registry[island_object.unique_id] = island_object
+
+        elif section == 'cities':
+            self.__all_cities = value if decoded else self.__patch_static(self.__all_cities, value,
+                                                                          self.__patch_city, self.__sync_city)
+            for city_object in self.__all_cities:
+                registry[city_object.unique_id] = city_object
+
+    def __update_player_lists(self, section, aircrafts):
+        """
+        Updates the players' lists from the aircrafts of a section. Only the aircrafts that joined or left the section,
+        or changed owner, are inserted into or removed from the lists, which stay sorted by id. In most turns nothing
+        changes and the lists are kept as they are.
+
+        :param section: 'pirates', 'dead_pirates' or 'drones'.
+        :type section: str
+        :param aircrafts: the aircrafts of the section in this turn.
+        :type aircrafts: list[Aircraft]
+        """
+        previous_members = self.__section_members.get(section, {})
+        members = {}
+        list_name = SECTION_PLAYER_LISTS.get(section)
+        for aircraft in aircrafts:
+            members[aircraft.unique_id] = aircraft
+            if list_name is not None:
+                self.__move_to_list(list_name, aircraft, aircraft.owner)
+            if section != 'drones':
+                self.__move_to_list('all_pirates', aircraft, aircraft.owner)
+        self.__section_members[section] = members
+
+        # a pirate that left one of the pirate sections is usually in the other, and stays in all_pirates
+        other_members = self.__section_members.get({'pirates': 'dead_pirates', 'dead_pirates': 'pirates'}.get(section),
+                                                   {})
+        for unique_id, aircraft in previous_members.iteritems():
+            if unique_id in members:
+                continue
+            if list_name is not None:
+                self.__move_to_list(list_name, aircraft, None)
+            if section != 'drones' and unique_id not in other_members:
+                self.__move_to_list('all_pirates', aircraft, None)
+
+    def __move_to_list(self, list_name, aircraft, owner):
+        """
+        Moves an aircraft to a list of a player, keeping the list sorted by id.
+
+        :param list_name: the name of the list: 'all_pirates', 'living_pirates' or 'living_drones'.
+        :type list_name: str
+        :param aircraft: the aircraft.
+        :type aircraft: Aircraft
+        :param owner: the player whose list the aircraft should be in, or None to remove it from the lists.
+        :type owner: Player | None
+        """
+        key = (list_name, aircraft.unique_id)
+        listed = self.__listed.get(key)
+        if listed is not None:
+            previous_owner, listed_aircraft = listed
+            if previous_owner is owner and listed_aircraft is aircraft:
+                return
+            aircrafts = getattr(previous_owner, list_name)
+            index = _find_by_id(aircrafts, listed_aircraft.id)
+            while aircrafts[index] is not listed_aircraft:
+                index += 1
+            del aircrafts[index]
+        if owner is None:
+            self.__listed.pop(key, None)
+        else:
+            aircrafts = getattr(owner, list_name)
+            aircrafts.insert(_find_by_id(aircrafts, aircraft.id), aircraft)
+            self.__listed[key] = (owner, aircraft)
+
+    def __materialize(self, *sections):
+        """
+        Builds the game objects of lazy sections that were not built yet in this turn.
+
+        :param sections: the names of the sections the caller needs.
+        :type sections: str
+        """
+        if not self.__pending_sections:
+            return
+        for section in sections:
+            pending = self.__pending_sections.pop(section, None)
+            if pending is None:
+                continue
+            value, decoded = pending
+            objects = {}
+            self.__load_section(section, value, decoded, objects)
+            registry = self.__registry
+            # objects of the section that are gone are dropped. pirates are never gone, they only move between the
+            # living and the dead, so they are kept for whichever of the two sections is built next.
+            if section not in ('pirates', 'dead_pirates'):
+                for unique_id in self.__section_ids.get(section, ()):
+                    if unique_id not in objects:
+                        del registry[unique_id]
+                self.__section_ids[section] = objects.viewkeys()
+            registry.update(objects)
+
+    def __sync_aircraft(self, aircraft, record):
+        """
+        Updates the fields an aircraft and its record may differ in, without replacing locations that didn't change.
+        The record is read in full before the aircraft is changed, so a malformed record leaves it as it was.
+
+        :param aircraft: the aircraft to update.
+        :type aircraft: Aircraft
+        :param record: the aircraft's record.
+        :type record: dict[unicode, any]
+        """
+        row, col = record['location']
+        owner_id = record['owner']
+        owner = aircraft.owner if aircraft.owner.id == owner_id else self.__get_owner(owner_id)
+        max_speed = record['max_speed']
+        location = aircraft.location
+        if location.row != row or location.col != col:
+            aircraft.location = Location(row, col)
+        aircraft.owner = owner
+        aircraft.max_speed = max_speed
 
-        # update player pirate lists
+    def __sync_pirate(self, record):
+        """
+        Updates the pirate with the record's unique id in place, or builds it if it is new.
+
+        :param record: the pirate's record. Dead pirates have turns_to_revive and no current_health in their record.
+        :type record: dict[unicode, any]
+        :rtype: Pirate
+        """
+        pirate_object = self.__registry.get(record['unique_id'])
+        if pirate_object is None:
+            pirate_object = Pirate(Location(*record['location']), self.__get_owner(record['owner']), record['id'],
+                                   record['unique_id'], record['max_speed'], Location(*record['initial_location']),
+                                   record.get('current_health', 0), record['attack_range'])
+            pirate_object.turns_to_revive = record.get('turns_to_revive', 0)
+            return pirate_object
+        # read before the aircraft is changed, see __sync_aircraft
+        current_health = record.get('current_health', 0)
+        attack_range = record['attack_range']
+        turns_to_revive = record.get('turns_to_revive', 0)
+        self.__sync_aircraft(pirate_object, record)
+        pirate_object.current_health = current_health
+        pirate_object.attack_range = attack_range
+        pirate_object.turns_to_revive = turns_to_revive
+        return pirate_object
+
+    def __sync_drone(self, record):
+        """
+        Updates the drone with the record's unique id in place, or builds it if it is new.
+
+        :param record: the drone's record.
+        :type record: dict[unicode, any]
+        :rtype: Drone
+        """
+        drone_object = self.__registry.get(record['unique_id'])
+        if drone_object is None:
+            return Drone(Location(*record['location']), self.__get_owner(record['owner']), record['id'],
+                         record['unique_id'], record['max_speed'], Location(*record['initial_location']),
+                         record['current_health'], record['value'])
+        current_health = record['current_health']
+        value = record['value']
+        self.__sync_aircraft(drone_object, record)
+        drone_object.current_health = current_health
+        drone_object.value = value
+        return drone_object
+
+    def __sync_island(self, record):
+        """
+        Updates the island with the record's unique id in place, or builds it if it is new.
+
+        :param record: the island's record.
+        :type record: dict[unicode, any]
+        :rtype: Island
+        """
+        island_object = self.__registry.get(record['unique_id'])
+        if island_object is None:
+            return Island(Location(*record['location']), record['id'], record['unique_id'], record['control_range'],
+                          record['turns_to_drone_creation'], self.__get_owner(record['owner']))
+        self.__patch_island(island_object, record)
+        return island_object
+
+    def __patch_island(self, island_object, record):
+        """
+        Updates the fields of an island that change during the match. Islands never move and their control range is
+        fixed, so the rest of the record is ignored.
+
+        :param island_object: the island to update.
+        :type island_object: Island
+        :param record: the island's record.
+        :type record: dict[unicode, any]
+        """
+        turns_to_drone_creation = record['turns_to_drone_creation']
+        if island_object.owner.id != record['owner']:
+            island_object.owner = self.__get_owner(record['owner'])
+        island_object.turns_to_drone_creation = turns_to_drone_creation
+
+    def __sync_city(self, record):
+        """
+        Updates the city with the record's unique id in place, or builds it if it is new.
+
+        :param record: the city's record.
+        :type record: dict[unicode, any]
+        :rtype: City
+        """
+        city_object = self.__registry.get(record['unique_id'])
+        if city_object is None:
+            return City(Location(*record['location']), record['id'], record['unique_id'], record['unload_range'],
+                        record['value_multiplier'], self.__get_owner(record['owner']))
+        self.__patch_city(city_object, record)
+        return city_object
+
+    def __patch_city(self, city_object, record):
+        """
+        Updates the fields of a city that change during the match. Cities never move and their unload range and value
+        multiplier are fixed, so only the owner is updated.
+
+        :param city_object: the city to update.
+        :type city_object: City
+        :param record: the city's record.
+        :type record: dict[unicode, any]
+        """
+        if city_object.owner.id != record['owner']:
+            city_object.owner = self.__get_owner(record['owner'])
+
+    @staticmethod
+    def __patch_static(map_objects, records, patch, sync):
+        """
+        Updates the islands or cities of the previous turn from the records of this turn. They are the same objects in
+        the same order in every turn, so normally each record is matched to the object in its place and the list is
+        kept as is.
+
+        :param map_objects: the islands or cities of the previous turn.
+        :type map_objects: list[GameObject]
+        :param records: the records of this turn.
+        :type records: list[dict[unicode, any]]
+        :param patch: updates an object from its record.
+        :type patch: (GameObject, dict[unicode, any]) -> None
+        :param sync: updates or builds the object of a record, for when the objects don't match the records.
+        :type sync: (dict[unicode, any]) -> GameObject
+        :return: the islands or cities of this turn.
+        :rtype: list[GameObject]
+        """
+        if len(map_objects) == len(records):
+            for map_object, record in izip(map_objects, records):
+                if map_object.unique_id != record['unique_id']:
+                    break
+                patch(map_object, record)
+            else:
+                return map_objects
+        return map(sync, records)
+
+    def __decode_record(self, record):
+        """
+        The json object hook used by the single pass decode. Turns every record of a game object into the object itself
+        as soon as the record is parsed, and leaves any other json object as is.
+
+        :param record: a json object, just parsed.
+        :type record: dict[unicode, any]
+        :return: the game object the record describes, or the record itself.
+        :rtype: GameObject | dict[unicode, any]
+        """
+        if 'unique_id' not in record:
+            return record
+        if 'attack_range' in record:
+            return self.__sync_pirate(record)
+        if 'value' in record:
+            return self.__sync_drone(record)
+        if 'control_range' in record:
+            return self.__sync_island(record)
+        if 'unload_range' in record:
+            return self.__sync_city(record)
+        return record
+
+    def _get_object_hook(self):
+        """
+        Gets the json object hook to parse the next message with, if it can be decoded in a single pass.
+
+        Only full turns in json can be decoded this way: the setup comes before the players exist, binary frames have
+        their own decoder, turn_delta messages patch the raw records of the previous turn and lazy sections keep the
+        records until they are needed.
+
+        :return: the object hook, or None if the next message should be parsed into plain dictionaries.
+        :rtype: ((dict) -> any) | None
+        """
+        if (not self._single_pass_decode or not self._initiated or self._binary_frames or self.__turn_delta or
+                self.__lazy_sections):
+            return None
+        return self.__decode_record
+
+    def __track_events(self):
+        """
+        Finds the events of the current turn.
+        """
+        self.__materialize(*LAZY_SECTIONS)
+        self.__events = tuple(self.__event_tracker.update(self.__all_players, self.__all_islands, self.__all_cities))
+
+    def __record_history(self):
+        """
+        Adds the entries of the current turn to the history of the aircrafts.
+        """
+        self.__materialize('pirates', 'drones')
+        aircrafts = []
+        for player in self.__all_players:
+            aircrafts.extend(player.living_pirates)
+            aircrafts.extend(player.living_drones)
+        self.__history.record(self.__turn, aircrafts)
+
+    def __update_timeline(self):
+        """
+        Updates the timeline from the timers of the current turn.
+        """
+        self.__materialize('pirates', 'dead_pirates', 'islands')
+        dead_pirates = [pirate for player in self.__all_players for pirate in player.all_pirates
+                        if not pirate.is_alive()]
+        self.__timeline.update(self.__turn, self.__all_islands, dead_pirates)
+
+    def __fill_unit_table(self):
+        """
+        Fills the unit table from the game objects of the current turn.
+        """
+        self.__materialize('pirates', 'drones')
+        pirates = []
+        drones = []
         for player in self.__all_players:
-            player.all_pirates.sort(key=lambda player_pirate: player_pirate.id)
-            player.living_drones.sort(key=lambda player_drone: player_drone.id)
-            player.living_pirates.sort(key=lambda player_pirate: player_pirate.id)
+            pirates.extend(player.living_pirates)
+            drones.extend(player.living_drones)
+        self.__unit_table.fill_objects(pirates, drones)
+
+    def __get_registered(self, unique_id):
+        """
+        Gets a pirate or drone of the current turn by its unique id.
+
+        :param unique_id: the unique id of the object.
+        :type unique_id: int
+        :rtype: GameObject
+        """
+        self.__materialize('pirates', 'drones')
+        return self.__registry[unique_id]
 
     def __get_owner(self, owner_id):
         """
@@ -396,6 +960,7 @@ class PirateGame(object):
 
     ''' Pirate related API '''
 
+    @per_turn_list_cache
     def get_all_my_pirates(self):
         """
         Returns a list of all friendly pirates.
@@ -403,8 +968,10 @@ class PirateGame(object):
         :return: list of all my pirates sorted by ID.
         :rtype: list[Pirate]
         """
-        return self.__me.all_pirates[:]
+        self.__materialize('pirates', 'dead_pirates')
+        return tuple(self.__me.all_pirates)
 
+    @per_turn_list_cache
     def get_my_living_pirates(self):
         """
         Returns a list of all friendly pirates that are currently in the game (on screen).
@@ -412,8 +979,10 @@ class PirateGame(object):
         :return: list of all friendly pirates that are currently in the game.
         :rtype: list[Pirate]
         """
-        return self.__me.living_pirates[:]
+        self.__materialize('pirates')
+        return tuple(self.__me.living_pirates)
 
+    @per_turn_list_cache
     def get_all_enemy_pirates(self):
         """
         Returns a list of all enemy pirates.
@@ -421,8 +990,10 @@ class PirateGame(object):
         :return: list of all enemy pirates sorted by ID.
         :rtype: list[Pirate]
         """
-        return self.__enemy.all_pirates[:]
+        self.__materialize('pirates', 'dead_pirates')
+        return tuple(self.__enemy.all_pirates)
 
+    @per_turn_list_cache
     def get_enemy_living_pirates(self):
         """
         Returns a list of all enemy pirates that are currently in the game (on screen).
@@ -430,7 +1001,8 @@ class PirateGame(object):
         :return: list of all enemy pirates that are currently in the game.
         :rtype: list[Pirate]
         """
-        return self.__enemy.living_pirates[:]
+        self.__materialize('pirates')
+        return tuple(self.__enemy.living_pirates)
 
     def get_my_pirate_by_id(self, pirate_id):
         """
@@ -438,12 +1010,11 @@ class PirateGame(object):
 
         :param pirate_id: the id of the pirate.
         :type pirate_id: int
-        :return: the friendly pirate that has the given id.
-        :rtype: Pirate
+        :return: the friendly pirate that has the given id, or None if there is no such pirate.
+        :rtype: Pirate | None
         """
-        if pirate_id < 0 or pirate_id >= len(self.get_all_my_pirates()):
-            return None
-        return self.get_all_my_pirates()[pirate_id]
+        self.__materialize('pirates', 'dead_pirates')
+        return self.__pirates_by_id.get((self.__me.id, pirate_id))
 
     def get_enemy_pirate_by_id(self, pirate_id):
         """
@@ -451,12 +1022,11 @@ class PirateGame(object):
 
         :param pirate_id: the id of the pirate.
         :type pirate_id: int
-        :return: the enemy pirate that has the given id.
-        :rtype: Pirate
+        :return: the enemy pirate that has the given id, or None if there is no such pirate.
+        :rtype: Pirate | None
         """
-        if pirate_id < 0 or pirate_id >= len(self.get_all_enemy_pirates()):
-            return None
-        return self.get_all_enemy_pirates()[pirate_id]
+        self.__materialize('pirates', 'dead_pirates')
+        return self.__pirates_by_id.get((self.__enemy.id, pirate_id))
 
     def get_aircrafts_on(self, map_object):
         """
@@ -467,13 +1037,218 @@ class PirateGame(object):
         :return: the list of aircrafts on the location.
         :rtype: list[Aircraft]
         """
-        location = map_object.get_location()
-        aircrafts = [aircraft for aircraft in self.get_my_living_aircrafts() if aircraft.location == location]
-        aircrafts += [aircraft for aircraft in self.get_enemy_living_aircrafts() if aircraft.location == location]
-        return aircrafts
+        objects = self.__get_spatial_index().get_objects_on(map_object.get_location())
+        return [game_object for game_object in objects if isinstance(game_object, Aircraft)]
+
+    def get_objects_in_range(self, map_object, manhattan_range, object_filter=None):
+        """
+        Returns the living aircrafts, islands and cities within a range of a map object. For example, the enemy
+        pirates that can attack a drone::
+
+            game.get_objects_in_range(drone, game.get_attack_range(),
+                                      lambda game_object: isinstance(game_object, Pirate) and
+                                      game_object.owner == game.get_enemy())
+
+        :param map_object: the map object to measure the range from.
+        :type map_object: MapObject
+        :param manhattan_range: the range.
+        :type manhattan_range: int
+        :param object_filter: returns whether to include an object, or None to include every object.
+        :type object_filter: ((GameObject) -> bool) | None
+        :return: the objects, from the nearest to the farthest.
+        :rtype: list[GameObject]
+        """
+        return self.__get_spatial_index().get_objects_in_range(map_object.get_location(), manhattan_range,
+                                                                object_filter)
+
+    def get_nearest(self, map_object, count=1, object_filter=None):
+        """
+        Returns the living aircrafts, islands and cities nearest to a map object.
+
+        :param map_object: the map object to measure the distance from.
+        :type map_object: MapObject
+        :param count: the maximal number of objects to return.
+        :type count: int
+        :param object_filter: returns whether to include an object, or None to include every object.
+        :type object_filter: ((GameObject) -> bool) | None
+        :return: the objects, from the nearest to the farthest.
+        :rtype: list[GameObject]
+        """
+        return self.__get_spatial_index().get_nearest(map_object.get_location(), count, object_filter)
+
+    @per_turn_cache
+    def __get_spatial_index(self):
+        """
+        Gets the spatial index of the living aircrafts, islands and cities, built on the first query of the turn.
+
+        :rtype: SpatialIndex
+        """
+        self.__materialize('pirates', 'drones', 'islands', 'cities')
+        game_objects = []
+        # the aircrafts on a location are in the same order as the other getters, mine first
+        for player in [self.__me] + [player for player in self.__all_players if player is not self.__me]:
+            game_objects.extend(player.living_pirates)
+            game_objects.extend(player.living_drones)
+        game_objects.extend(self.__all_islands)
+        game_objects.extend(self.__all_cities)
+        return SpatialIndex(game_objects, max(1, self.__attack_range))
+
+    def get_bitboard(self):
+        """
+        Gets the bit layout of the map, which turns the masks of :func:`get_attack_mask`, :func:`get_control_mask` and
+        :func:`get_unload_mask` into counts and locations, and makes masks of other shapes. For example, the cells
+        within control range of an island that no enemy pirate can attack::
+
+            bitboard = game.get_bitboard()
+            safe = game.get_control_mask(island) & ~game.get_attack_mask(game.get_enemy(), True)
+            bitboard.count(safe), bitboard.get_locations(safe)
+
+        Masks can only be combined with masks of the same bitboard. The bitboard is replaced on the first call of a
+        turn in which the reach of a pirate grows past its padding, so keep the masks of earlier turns apart.
+
+        :return: the bitboard of the map.
+        :rtype: Bitboard
+        """
+        radius = self.__get_bitboard_radius()
+        if self.__bitboard is None or not self.__bitboard.fits(radius):
+            self.__bitboard = Bitboard(self.__row_count, self.__col_count, radius)
+            # the masks of the previous bitboard don't match the bits of the new one
+            self.__static_masks = {}
+        return self.__bitboard
+
+    @per_turn_cache
+    def __get_bitboard_radius(self):
+        """
+        Gets the largest shape of the turn, an attack after a move or an unload after a move, which the padding of the
+        bitboard should cover.
+
+        :rtype: int
+        """
+        self.__materialize('pirates', 'dead_pirates', 'islands', 'cities')
+        max_speed = max(self.__pirate_max_speed, self.__drone_max_speed)
+        radii = [self.__attack_range + max_speed, self.__island_control_range, self.__city_unload_range + max_speed]
+        radii.extend(pirate.attack_range + pirate.max_speed for player in self.__all_players
+                     for pirate in player.all_pirates)
+        radii.extend(island.control_range for island in self.__all_islands)
+        radii.extend(city.unload_range + max_speed for city in self.__all_cities)
+        return max(radii)
+
+    def get_attack_mask(self, player, with_movement=False):
+        """
+        Gets the mask of the cells the living pirates of a player can attack.
+
+        :param player: the player of the pirates.
+        :type player: Player
+        :param with_movement: whether to include the cells the pirates can attack after moving this turn, i.e. within
+          their attack range plus their max speed. Default is False, only the cells they can attack from where they are.
+        :type with_movement: bool
+        :return: the mask, see :func:`get_bitboard`.
+        :rtype: int
+        """
+        # the cache is keyed by the positional arguments only
+        return self.__get_attack_mask(player, bool(with_movement))
+
+    @per_turn_cache
+    def __get_attack_mask(self, player, with_movement):
+        """
+        Gets the mask of the cells the living pirates of a player can attack, made once per turn.
+
+        :rtype: int
+        """
+        bitboard = self.get_bitboard()
+        self.__materialize('pirates')
+        if with_movement:
+            return bitboard.cover_mask(player.living_pirates, lambda pirate: pirate.attack_range + pirate.max_speed)
+        return bitboard.cover_mask(player.living_pirates, lambda pirate: pirate.attack_range)
+
+    @per_turn_cache
+    def get_influence_map(self):
+        """
+        Gets the threat and the support of every cell for the next turn: the number of enemy pirates and of my pirates
+        that can attack the cell, after moving up to their max speed. For example, whether a drone is safer on one of
+        its sail options::
+
+            influence = game.get_influence_map()
+            influence.get_threat(location), influence.threat[row, col]
+
+        The grids are built in one pass on the first call of the turn, and shared by every other call in the turn.
+
+        :return: the influence map of the turn.
+        :rtype: InfluenceMap
+        """
+        self.__materialize('pirates')
+        enemy_pirates = [pirate for player in self.__all_players if player is not self.__me
+                         for pirate in player.living_pirates]
+        return InfluenceMap(self.__row_count, self.__col_count, enemy_pirates, self.__me.living_pirates)
+
+    def get_control_mask(self, island):
+        """
+        Gets the mask of the cells within control range of an island.
+
+        :param island: the island.
+        :type island: Island
+        :return: the mask, see :func:`get_bitboard`.
+        :rtype: int
+        """
+        return self.__get_static_mask(island, island.control_range)
+
+    def get_unload_mask(self, city):
+        """
+        Gets the mask of the cells within unload range of a city.
+
+        :param city: the city.
+        :type city: City
+        :return: the mask, see :func:`get_bitboard`.
+        :rtype: int
+        """
+        return self.__get_static_mask(city, city.unload_range)
+
+    def __get_static_mask(self, map_object, radius):
+        """
+        Gets the mask of the cells within a range of an island or a city, made once for the whole game.
+
+        :rtype: int
+        """
+        mask = self.__static_masks.get(map_object.unique_id)
+        if mask is None:
+            location = map_object.location
+            mask = self.__static_masks[map_object.unique_id] = self.get_bitboard().diamond_mask(location.row,
+                                                                                                location.col, radius)
+        return mask
+
+    def get_unit_table(self):
+        """
+        Gets the living pirates and drones as a columnar table, for bulk queries over many units. For example, all the
+        enemy drones within range 5 of a location::
+
+            table = game.get_unit_table()
+            table.get_aircrafts(table.in_range(location.row, location.col, 5, game.get_enemy().id, UnitTable.DRONE))
+
+        The table is kept up to date from the first call on, so bots that never ask for it don't pay for it.
+
+        :return: the table of the current turn.
+        :rtype: UnitTable
+        """
+        if self.__unit_table is None:
+            self.__unit_table = UnitTable(self.__get_registered)
+            self.__fill_unit_table()
+        return self.__unit_table
 
     ''' Objects API '''
 
+    def get_object_by_unique_id(self, unique_id):
+        """
+        Gets a game object of the current turn by its unique id, the id orders and the engine refer to it by.
+
+        :param unique_id: the unique id of the object.
+        :type unique_id: int
+        :return: the pirate, drone, island or city with the unique id, or None if there is no such object.
+        :rtype: GameObject | None
+        """
+        self.__materialize(*LAZY_SECTIONS)
+        return self.__registry.get(unique_id)
+
+    @per_turn_list_cache
     def get_my_living_drones(self):
         """
         Gets all the drones of the current player.
@@ -481,8 +1256,10 @@ class PirateGame(object):
         :return: list of all current player's drones.
         :rtype: list[Drone]
         """
-        return self.__me.living_drones[:]
+        self.__materialize('drones')
+        return tuple(self.__me.living_drones)
 
+    @per_turn_list_cache
     def get_enemy_living_drones(self):
         """
         Gets all the drones of the opponent.
@@ -490,7 +1267,8 @@ class PirateGame(object):
         :return: list of all opponent's drones.
         :rtype: list[Drone]
         """
-        return self.__enemy.living_drones[:]
+        self.__materialize('drones')
+        return tuple(self.__enemy.living_drones)
 
     def get_my_drone_by_id(self, drone_id):
         """
@@ -498,13 +1276,11 @@ class PirateGame(object):
 
         :param drone_id: the id of the drone.
         :type drone_id: int
-        :return: the drone with the given id.
-        :rtype: Drone
+        :return: the drone with the given id, or None if there is no such living drone.
+        :rtype: Drone | None
         """
-        for drone in self.get_my_living_drones():
-            if drone.id == drone_id:
-                return drone
-        return None
+        self.__materialize('drones')
+        return self.__drones_by_id.get((self.__me.id, drone_id))
 
     def get_enemy_drone_by_id(self, drone_id):
         """
@@ -512,14 +1288,13 @@ class PirateGame(object):
 
         :param drone_id: the id of the drone.
         :type drone_id: int
-        :return: the drone with the given id.
-        :rtype: Drone
+        :return: the drone with the given id, or None if there is no such living drone.
+        :rtype: Drone | None
         """
-        for drone in self.get_enemy_living_drones():
-            if drone.id == drone_id:
-                return drone
-        return None
+        self.__materialize('drones')
+        return self.__drones_by_id.get((self.__enemy.id, drone_id))
 
+    @per_turn_list_cache
     def get_my_living_aircrafts(self):
         """
         Gets all the living drones and pirates of the current player.
@@ -527,8 +1302,10 @@ class PirateGame(object):
         :return: all the living drones and pirates of the current player.
         :rtype: list[Aircraft]
         """
-        return self.__me.get_living_aircrafts()
+        self.__materialize('pirates', 'drones')
+        return tuple(self.__me.get_living_aircrafts())
 
+    @per_turn_list_cache
     def get_enemy_living_aircrafts(self):
         """
         Gets all the living drones and pirates of the enemy player.
@@ -536,8 +1313,10 @@ class PirateGame(object):
         :return: all the living drones and pirates of the enemy player.
         :rtype: list[Aircraft]
         """
-        return self.__enemy.get_living_aircrafts()
+        self.__materialize('pirates', 'drones')
+        return tuple(self.__enemy.get_living_aircrafts())
 
+    @per_turn_list_cache
     def get_all_islands(self):
         """
         Returns all islands in the game.
@@ -545,8 +1324,10 @@ class PirateGame(object):
         :return: all islands in the game.
         :rtype: list[Island]
         """
-        return self.__all_islands[:]
+        self.__materialize('islands')
+        return tuple(self.__all_islands)
 
+    @per_turn_list_cache
     def get_my_islands(self):
         """
         Returns all islands under the current player's control.
@@ -554,8 +1335,10 @@ class PirateGame(object):
         :return: all islands under the current player's control.
         :rtype: list[Island]
         """
-        return [island for island in self.__all_islands if island.owner == self.__me]
+        self.__materialize('islands')
+        return tuple([island for island in self.__all_islands if island.owner is self.__me])
 
+    @per_turn_list_cache
     def get_enemy_islands(self):
         """
         Returns all islands under the opponent's control.
@@ -563,8 +1346,10 @@ class PirateGame(object):
         :return: all islands under the opponent's control.
         :rtype: list[Island]
         """
-        return [island for island in self.__all_islands if island.owner == self.__enemy]
+        self.__materialize('islands')
+        return tuple([island for island in self.__all_islands if island.owner is self.__enemy])
 
+    @per_turn_list_cache
     def get_neutral_islands(self):
         """
         Returns all islands under no player's control.
@@ -572,8 +1357,10 @@ class PirateGame(object):
         :return: all island's under no player's control.
         :rtype: list[Island]
         """
-        return [island for island in self.__all_islands if island.owner == self.__neutral]
+        self.__materialize('islands')
+        return tuple([island for island in self.__all_islands if island.owner is self.__neutral])
 
+    @per_turn_list_cache
     def get_not_my_islands(self):
         """
         Returns all islands whose not under the current player's control.
@@ -581,8 +1368,10 @@ class PirateGame(object):
         :return: all islands whose not under the current player's control.
         :rtype: list[Island]
         """
-        return [island for island in self.__all_islands if island.owner != self.__me]
+        self.__materialize('islands')
+        return tuple([island for island in self.__all_islands if island.owner is not self.__me])
 
+    @per_turn_list_cache
     def get_all_cities(self):
         """
         Returns all cities in the game.
@@ -590,8 +1379,10 @@ class PirateGame(object):
         :return: all cities in the game.
         :rtype: list[City]
         """
-        return self.__all_cities[:]
+        self.__materialize('cities')
+        return tuple(self.__all_cities)
 
+    @per_turn_list_cache
     def get_my_cities(self):
         """
         Returns all cities under the current player's control.
@@ -599,8 +1390,10 @@ class PirateGame(object):
         :return: all cities under the current player's control.
         :rtype: list[City]
         """
-        return [city for city in self.__all_cities if city.owner == self.__me]
+        self.__materialize('cities')
+        return tuple([city for city in self.__all_cities if city.owner is self.__me])
 
+    @per_turn_list_cache
     def get_enemy_cities(self):
         """
         Returns all cities under the opponent's control.
@@ -608,7 +1401,8 @@ class PirateGame(object):
         :return: all cities under the opponent's control.
         :rtype: list[City]
         """
-        return [city for city in self.__all_cities if city.owner == self.__enemy]
+        self.__materialize('cities')
+        return tuple([city for city in self.__all_cities if city.owner is self.__enemy])
 
     ''' Action API '''
 
@@ -653,6 +1447,87 @@ class PirateGame(object):
 
         return sail_options
 
+    def get_best_sail_option(self, aircraft, destination, danger_penalty=DEFAULT_DANGER_PENALTY):
+        """
+        Returns the location for a given aircraft (pirate or drone) to sail to this turn, on its cheapest route to the
+        destination over the next turns. Unlike :func:`get_sail_options`, the route may go around the cells the enemy
+        pirates can attack: each turn costs 1, plus the danger penalty for each enemy pirate that can attack the cell
+        the aircraft stops on, see :func:`get_influence_map`.
+
+        :param aircraft: the aircraft (pirate or drone) to go to the destination.
+        :type aircraft: Aircraft
+        :param destination: the destination for the aircraft to go to.
+        :type destination: MapObject
+        :param danger_penalty: the cost of stopping on a cell for each enemy pirate that can attack it, in turns.
+          Default is 1, 0 ignores the enemy pirates.
+        :type danger_penalty: float
+        :return: a location within the max speed of the aircraft, or its own location if it is on the destination.
+        :rtype: Location
+        """
+        return self.get_router(danger_penalty).get_next_location(aircraft, destination)
+
+    def get_router(self, danger_penalty=DEFAULT_DANGER_PENALTY):
+        """
+        Gets the router of the turn, which finds the cheapest routes over the threat of the turn. The search of each
+        destination is shared by all the aircrafts of the same max speed that head there, e.g. the drones that stream to
+        the same city.
+
+        :param danger_penalty: the cost of stopping on a cell for each enemy pirate that can attack it, in turns.
+        :type danger_penalty: float
+        :return: the router, the same one for every call of the turn with the same danger penalty.
+        :rtype: Router
+        """
+        # the cache is keyed by the positional arguments only
+        return self.__get_router(danger_penalty)
+
+    @per_turn_cache
+    def __get_router(self, danger_penalty):
+        """
+        Gets the router of the turn for a danger penalty, made once per turn.
+
+        :rtype: Router
+        """
+        return Router(self.__row_count, self.__col_count, self.get_influence_map().threat, danger_penalty)
+
+    # noinspection PyMethodMayBeStatic
+    def distance_matrix(self, sources, targets):
+        """
+        Computes the distance between every source and every target in a single pass, instead of a call to
+        :func:`MapObject.distance` for each pair::
+
+            distances = game.distance_matrix(pirates, targets)
+            distances[i, j]  # pirates[i].distance(targets[j])
+
+        :param sources: the map objects of the rows.
+        :type sources: list[MapObject]
+        :param targets: the map objects of the cols.
+        :type targets: list[MapObject]
+        :return: the distances. A NumPy array when NumPy is installed, a :class:`DistanceMatrix.Matrix` with the same
+          indexing otherwise.
+        :rtype: numpy.ndarray | DistanceMatrix.Matrix
+        """
+        return DistanceMatrix.distance_matrix(sources, targets)
+
+    # noinspection PyMethodMayBeStatic
+    def in_range_matrix(self, sources, targets, manhattan_range):
+        """
+        Computes whether every target is within range of every source in a single pass, e.g. which pirates can attack
+        which targets::
+
+            can_attack = game.in_range_matrix(pirates, targets, [pirate.attack_range for pirate in pirates])
+
+        :param sources: the map objects of the rows.
+        :type sources: list[MapObject]
+        :param targets: the map objects of the cols.
+        :type targets: list[MapObject]
+        :param manhattan_range: the range, either the same for all the sources or a list with the range of each source.
+        :type manhattan_range: int | list[int]
+        :return: whether targets[j] is within range of sources[i] at [i, j]. A NumPy bool array when NumPy is
+          installed, a :class:`DistanceMatrix.Matrix` of 0 and 1 with the same indexing otherwise.
+        :rtype: numpy.ndarray | DistanceMatrix.Matrix
+        """
+        return DistanceMatrix.in_range_matrix(sources, targets, manhattan_range)
+
     def set_sail(self, aircraft, destination):
         """
         Moves a given aircraft to the given destination.
@@ -662,12 +1537,15 @@ class PirateGame(object):
         :param destination: the location to move the pirate to.
         :type destination: MapObject
         """
+        location = destination.get_location()
         # already in destination
-        if aircraft.location == destination.get_location():
+        if aircraft.location == location:
             self.debug("WARNING: %s %d tried to set sail to its current location." % (aircraft.type, aircraft.id))
+            # staying is the last order it got, so it drops any order it already got this turn
+            self._orders.discard(aircraft.unique_id)
             return
-        self._orders.append({'type': 'order', 'order_type': 'move', 'acting_aircraft': aircraft.unique_id,
-                             'order_args': {'destination': destination.get_location().as_tuple}})
+        # an aircraft has a single order, so this replaces any order it already got this turn
+        self._orders.move(aircraft.unique_id, location.row, location.col)
 
     def attack(self, pirate, target):
         """
@@ -678,8 +1556,8 @@ class PirateGame(object):
         :param target: the aircraft that will be attacked.
         :type target: Aircraft
         """
-        self._orders.append({'type': 'order', 'order_type': 'attack', 'acting_aircraft': pirate.unique_id,
-                             'order_args': {'target': target.unique_id}})
+        # a pirate has a single order, so this replaces any order it already got this turn
+        self._orders.attack(pirate.unique_id, target.unique_id)
 
     ''' Debug related API '''
 
@@ -734,6 +1612,16 @@ class PirateGame(object):
         """
         return self.__turn
 
+    def get_turn_cache(self):
+        """
+        Returns the cache of the results of the getters and of the bot's :func:`TurnCache.per_turn_cache` functions in
+        the current turn, with its hit and miss counters.
+
+        :return: the turn cache of the game.
+        :rtype: TurnCache
+        """
+        return self.__turn_cache
+
     def get_max_turns(self):
         """
         Returns the maximum number of turns in this game.
@@ -869,6 +1757,133 @@ class PirateGame(object):
         """
         return self.__enemy.bot_name
 
+    def get_events(self, *event_types):
+        """
+        Gets what changed in the game since the previous turn, as a list of events. For example, the pirates that died
+        and the islands that changed owners::
+
+            game.get_events('died', 'island_captured')
+
+        The event types are 'spawned', 'died', 'revived', 'moved', 'damaged', 'island_captured' and
+        'drone_delivered', see :class:`Event` for their details. Events are found from the first call on, so the
+        first call returns no events.
+
+        :param event_types: the types of events to get, or none to get all the events.
+        :type event_types: str
+        :return: the events of the current turn.
+        :rtype: list[Event]
+        """
+        if self.__event_tracker is None:
+            self.__event_tracker = EventTracker()
+            self.__track_events()
+        if not event_types:
+            return list(self.__events)
+        return [event for event in self.__events if event.type in event_types]
+
+    def get_history(self, aircraft, count=None):
+        """
+        Gets the recent turns of an aircraft, while it is alive. Only the last few turns are kept, and the history is
+        kept from the first call to :func:`get_history`, :func:`get_heading` or :func:`get_speed` on.
+
+        :param aircraft: the pirate or drone.
+        :type aircraft: Aircraft
+        :param count: the maximal number of turns to get, or None for all the kept turns.
+        :type count: int | None
+        :return: (turn, location, health) entries, from the oldest to the current turn.
+        :rtype: list[(int, Location, int)]
+        """
+        return self.__get_history().get_history(aircraft.unique_id, count)
+
+    def get_heading(self, aircraft):
+        """
+        Estimates where an aircraft is heading, from its recent turns.
+
+        :param aircraft: the pirate or drone.
+        :type aircraft: Aircraft
+        :return: the average (rows, cols) it moved per turn, (0, 0) if it has no known history.
+        :rtype: (float, float)
+        """
+        return self.__get_history().get_velocity(aircraft.unique_id)
+
+    def get_speed(self, aircraft):
+        """
+        Estimates the speed of an aircraft, from its recent turns.
+
+        :param aircraft: the pirate or drone.
+        :type aircraft: Aircraft
+        :return: the distance from its oldest kept location to its current location, per turn. 0 if it has no known
+          history.
+        :rtype: float
+        """
+        row_velocity, col_velocity = self.__get_history().get_velocity(aircraft.unique_id)
+        return abs(row_velocity) + abs(col_velocity)
+
+    def __get_history(self):
+        """
+        Gets the history of the aircrafts, starting it with the current turn on the first call.
+
+        :rtype: TrajectoryHistory
+        """
+        if self.__history is None:
+            self.__history = TrajectoryHistory()
+            self.__record_history()
+        return self.__history
+
+    def get_upcoming_events(self, turns):
+        """
+        Gets the drone creations of the islands and the revives of the dead pirates in the next turns, e.g. the turns
+        the islands create their next drones::
+
+            for turn, kind, island in game.get_upcoming_events(10):
+                if kind == 'drone_creation':
+                    ...
+
+        :param turns: the number of turns to look ahead, 0 for only the events of the current turn.
+        :type turns: int
+        :return: (turn, kind, object) events, ordered by the absolute turn they happen at. kind is 'drone_creation'
+          with the island, or 'pirate_revive' with the pirate.
+        :rtype: list[(int, str, GameObject)]
+        """
+        return self.__get_timeline().get_events_until(self.__turn + turns)
+
+    def get_next_event_turn(self, game_object):
+        """
+        Gets the turn of the next event of an island or a pirate, when it creates a drone or revives.
+
+        :param game_object: the island or the pirate.
+        :type game_object: Island | Pirate
+        :return: the absolute turn, or None if it has no known future event (a neutral island or a living pirate).
+        :rtype: int | None
+        """
+        return self.__get_timeline().get_next_turn(game_object)
+
+    def __get_timeline(self):
+        """
+        Gets the timeline, starting it with the current turn on the first call.
+
+        :rtype: Timeline
+        """
+        if self.__timeline is None:
+            self.__timeline = Timeline()
+            self.__update_timeline()
+        return self.__timeline
+
+    def set_lazy_sections(self, lazy=True):
+        """
+        Sets whether the game objects of each section of the state (living pirates, dead pirates, drones, islands and
+        cities) are built only on the first call to a getter that needs them in a turn. Turns that don't touch a
+        section then pay almost nothing for it. Takes effect from the next turn.
+
+        .. warning::
+            The lists of the players (e.g. :attr:`Player.living_drones`) are only updated once the matching section is
+            built, and hold the aircrafts of the previous turn until then, so with lazy sections they should be read
+            through the getters of the game.
+
+        :param lazy: whether to build the sections lazily.
+        :type lazy: bool
+        """
+        self.__lazy_sections = lazy
+
     ''' Terrain API '''
 
     def get_row_count(self):
@@ -897,17 +1912,84 @@ class PirateGame(object):
 
         :param crashed: Whether the bot died due to an exception, and only debug messages should be sent.
         :type crashed: bool
+        :return: The reply, before formatting it.
+        :rtype: dict[str | unicode, any]
         """
-        orders_to_send = self._orders
         if crashed:
             orders_to_send = []
+        elif self.__compact_orders or self._binary_frames:
+            # binary frames pack the compact form directly
+            orders_to_send = self._orders.compact_records()
+        else:
+            orders_to_send = self._orders.records()
         messages_to_send = self.__debug_messages
+        bot_orders = {'type': 'bot_orders',
+                      'data': {'orders': orders_to_send,
+                               'debug_messages': messages_to_send},
+                      'crashed': crashed}
+        # acknowledge the negotiated protocol features in the reply to the setup message
+        if self.__protocol_ack is not None:
+            bot_orders['protocol'] = self.__protocol_ack
+            self.__protocol_ack = None
+        if self.__game_id is not None:
+            bot_orders['game_id'] = self.__game_id
         if self.__out_stream:
-            self.__out_stream.write(format_data({'type': 'bot_orders',
-                                                 'data': {'orders': orders_to_send,
-                                                          'debug_messages': messages_to_send},
-                                                 'crashed': crashed}))
+            if self._binary_frames:
+                self.__out_stream.write(BinaryProtocol.format_frame(bot_orders))
+            else:
+                self.__out_stream.write(format_data(bot_orders))
             self.__out_stream.flush()
+        if self.__switch_to_binary_frames:
+            self.__switch_to_binary_frames = False
+            self._binary_frames = True
+            if self.__out_stream:
+                BinaryProtocol.set_binary_mode(self.__out_stream)
+        return bot_orders
+
+    def _handle_message(self, bot, received_data, decoded=False):
+        """
+        Handles a single message from the engine and sends the reply.
+
+        :param bot: the bot to call do_turn on
+        :type bot: _BotController
+        :param received_data: the message, with its type and data.
+        :type received_data: dict[unicode, any]
+        :param decoded: Whether the message was parsed with the object hook of :func:`_get_object_hook`.
+        :type decoded: bool
+        :return: The reply, before formatting it.
+        :rtype: dict[str | unicode, any]
+        """
+        if 'type' not in received_data.keys():
+            raise TypeError('Missing type parameter from json dictionary.')
+        if 'data' not in received_data.keys():
+            raise TypeError('Missing data parameter from json dictionary.')
+
+        if received_data['type'] == 'setup':
+            self._setup(received_data['data'])
+        elif received_data['type'] in ('turn', 'turn_delta'):
+            # Make sure the runner has been initiated correctly.
+            if not self._initiated:
+                raise Exception('Attempt to run runner without initiating it first.')
+
+            if received_data['type'] == 'turn':
+                self._update(received_data['data'], decoded)
+            else:
+                self._update_delta(received_data['data'])
+            # call the do_turn method of the class passed in
+            if self._recover_errors:
+                # catch all exceptions of the bot
+                # noinspection PyBroadException
+                try:
+                    bot.do_turn(self)
+                except Exception:
+                    error_msg = "Exception occurred during do_turn: \n" + traceback.format_exc()
+                    self.debug(error_msg)
+            else:
+                bot.do_turn(self)
+        else:
+            raise ValueError(
+                'Unrecognized json dictionary type, {type}.'.format(type=received_data['type']))
+        return self._finish_turn()
 
     # static methods are not tied to a class and don't have self passed in
     # this is a python decorator
@@ -925,91 +2007,137 @@ class PirateGame(object):
             sys.stdout = devnull
 
             pirates = PirateGame(old_stdout)
+            # reads big chunks straight from the file descriptor, both for json lines and binary frames
+            reader = FrameReader(sys.stdin)
             while True:
-                received_data = parse_data(sys.stdin.readline())  # string new line char
+                object_hook = pirates._get_object_hook()
                 try:
+                    # parsing may already build game objects, so it is part of handling the message
+                    if pirates._binary_frames:
+                        received_data = BinaryProtocol.read_buffered_frame(reader)
+                    else:
+                        received_data = parse_data(reader.read_line(), object_hook)
                     if not received_data:
                         break
-                    if 'type' not in received_data.keys():
-                        raise TypeError('Missing type parameter from json dictionary.')
-                    if 'data' not in received_data.keys():
-                        raise TypeError('Missing data parameter from json dictionary.')
-
-                    if received_data['type'] == 'setup':
-                        pirates._setup(received_data['data'])
-                    elif received_data['type'] == 'turn':
-                        # Make sure the runner has been initiated correctly.
-                        if not pirates._initiated:
-                            raise Exception('Attempt to run runner without initiating it first.')
-
-                        pirates._update(received_data['data'])
-                        # call the do_turn method of the class passed in
-                        if pirates._recover_errors:
-                            # catch all exceptions of the bot
-                            # noinspection PyBroadException
-                            try:
-                                bot.do_turn(pirates)
-                            except Exception:
-                                error_msg = "Exception occurred during do_turn: \n" + traceback.format_exc()
-                                pirates.debug(error_msg)
-                        else:
-                            bot.do_turn(pirates)
-                    else:
-                        raise ValueError(
-                            'Unrecognized json dictionary type, {type}.'.format(type=received_data['type']))
-                    pirates._finish_turn()
+                    pirates._handle_message(bot, received_data, decoded=object_hook is not None)
                 except:
                     pirates._finish_turn(True)
                     raise
 
+    @staticmethod
+    def _run_multiplexed(bot):
+        """
+        Serves many concurrent games over the same pipe, with a PirateGame for each game and a single bot.
+
+        Every message is a json line tagged with a 'game_id', and so is every reply. A game starts with its setup
+        message and ends with a message of type 'game_over'. A game that crashes gets a crashed reply and is dropped,
+        without stopping the other games.
+
+        .. warning::
+            The bot modules are loaded once and shared by all the games, so bots must not keep the state of a game in
+            module globals.
+
+        :param bot: the bot to call do_turn on
+        :type bot: _BotController
+        """
+        # redirect stdout to null so bots can't use print to kill themselves
+        with open(os.devnull, 'w') as devnull:
+            old_stdout = sys.stdout
+            sys.stdout = devnull
+
+            games = {}
+            """:type : dict[any, PirateGame]"""
+            reader = FrameReader(sys.stdin)
+            while not reader.at_eof:
+                # the object hook depends on the game, which is known only after parsing
+                received_data = parse_data(reader.read_line())
+                if not received_data:
+                    continue
+                game_id = received_data.get('game_id')
+                if game_id is None:
+                    sys.stderr.write('Ignoring a message without a game id.\n')
+                    continue
+                if received_data.get('type') == 'game_over':
+                    games.pop(game_id, None)
+                    continue
+
+                pirates = games.get(game_id)
+                if pirates is None:
+                    pirates = games[game_id] = PirateGame(old_stdout, game_id)
+                # noinspection PyBroadException
+                try:
+                    pirates._handle_message(bot, received_data)
+                except Exception:
+                    pirates._finish_turn(True)
+                    del games[game_id]
+                    sys.stderr.write('Game {id} crashed:\n{error}'.format(id=game_id, error=traceback.format_exc()))
+
 
 class Pirate(BasePirate):
     """
     The Pirate class. Pirates are controlled by the players.
     """
-    pass
+    # the fields stay in the base class slots, and the dictionary for the bot's own attributes is only made once the
+    # bot sets one
+    __slots__ = ('__dict__',)
 
 
 class Drone(BaseDrone):
     """
     Drones are used to gain points by sending them to a city
     """
-    pass
+    # the fields stay in the base class slots, and the dictionary for the bot's own attributes is only made once the
+    # bot sets one
+    __slots__ = ('__dict__',)
 
 
 class Island(BaseIsland):
     """
     Islands create drones for their controller once in a few turns
     """
-    pass
+    # the fields stay in the base class slots, and the dictionary for the bot's own attributes is only made once the
+    # bot sets one
+    __slots__ = ('__dict__',)
 
 
 class City(BaseCity):
     """
     Cities are used to gain points by sending drones to them
     """
-    pass
+    # the fields stay in the base class slots, and the dictionary for the bot's own attributes is only made once the
+    # bot sets one
+    __slots__ = ('__dict__',)
 
 
 class Player(BasePlayer):
     """
     Players are the bots in the game.
     """
-    pass
+    # the fields stay in the base class slots, and the dictionary for the bot's own attributes is only made once the
+    # bot sets one
+    __slots__ = ('__dict__',)
 
 
 class _BotController(object):
     """ Wrapper class for bot. May accept either a file or a directory and will add correct folder to path """
 
-    def __init__(self, runner_bot_path):
-        # add alias for this module (pythonRunner as Pirates)
-        _BotController.load_file_as(__file__, 'Pirates')
+    def __init__(self, runner_bot_path, module_name='bot'):
+        """
+        :param runner_bot_path: the path of the bot file, source or compiled.
+        :type runner_bot_path: unicode
+        :param module_name: the name to load the bot module as, which must differ between bots in the same process.
+        :type module_name: str
+        """
+        # add alias for this module (pythonRunner as Pirates), unless it was already imported as Pirates, like in a
+        # pre-forked RunnerPool worker
+        if 'Pirates' not in sys.modules:
+            _BotController.load_file_as(__file__, 'Pirates')
 
         if runner_bot_path.endswith('.py'):
-            self.bot = _BotController.load_file_as(runner_bot_path, 'bot')
+            self.bot = _BotController.load_file_as(runner_bot_path, module_name)
             """:type : module"""
         else:
-            self.bot = imp.load_compiled('bot', runner_bot_path)
+            self.bot = imp.load_compiled(module_name, runner_bot_path)
             """:type : module"""
 
     def do_turn(self, game):
@@ -1045,6 +2173,72 @@ class _BotController(object):
         return new_module
 
 
+def _find_by_id(game_objects, object_id):
+    """
+    Finds where an id goes in a list of game objects sorted by id.
+
+    :param game_objects: the game objects, sorted by id.
+    :type game_objects: list[GameObject]
+    :param object_id: the id.
+    :type object_id: int
+    :return: the index of the first object whose id is not smaller than the id.
+    :rtype: int
+    """
+    low = 0
+    high = len(game_objects)
+    while low < high:
+        middle = (low + high) // 2
+        if game_objects[middle].id < object_id:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def _add_bot_to_path(bot_file_path):
+    """
+    Adds the folder of the bot to the python path, so the bot can import its own modules.
+
+    :param bot_file_path: the path of the bot file or the bot directory.
+    :type bot_file_path: unicode
+    :return: the path of the bot file to load.
+    :rtype: unicode
+    """
+    if os.path.isdir(bot_file_path):
+        sys.path.append(bot_file_path)
+        return os.path.join(bot_file_path, DEFAULT_BOT_FILE)
+    sys.path.append(os.path.dirname(bot_file_path))
+    return bot_file_path
+
+
+def _echo_frames(binary_frames):
+    """
+    Parses every frame received and sends it back formatted again, until the input ends.
+    Used to test and measure the communication on its own, without a bot.
+
+    :param binary_frames: Whether to use binary frames instead of json lines.
+    :type binary_frames: bool
+    """
+    reader = FrameReader(sys.stdin)
+    if binary_frames:
+        BinaryProtocol.set_binary_mode(sys.stdout)
+    while not reader.at_eof:
+        if binary_frames:
+            data_dict = BinaryProtocol.read_buffered_frame(reader)
+        else:
+            data_dict = parse_data(reader.read_line())
+        if not data_dict:
+            # an incorrect frame is skipped, but a frame cut short by the end of the input ends the echo
+            if reader.at_eof:
+                break
+        else:
+            if binary_frames:
+                sys.stdout.write(BinaryProtocol.format_frame(data_dict))
+            else:
+                sys.stdout.write(format_data(data_dict))
+            sys.stdout.flush()
+
+
 if __name__ == '__main__':
     reload(sys)
     sys.setdefaultencoding('utf8')
@@ -1055,20 +2249,17 @@ if __name__ == '__main__':
             # Check if we are on debug mode.
             debug_option = sys.argv[2]
             if debug_option == 'test_python_runner_json_communication_pipe_data_transfer':
-                while True:
-                    data_dict = parse_data(sys.stdin.readline())
-                    if not data_dict:
-                        continue
-                    sys.stdout.write(format_data(data_dict))
-                    sys.stdout.flush()
+                # the codec to echo with is optional, see ProtocolBenchmark
+                _echo_frames(sys.argv[3] == 'binary' if len(sys.argv) > 3 else False)
+                sys.exit(0)
         except IndexError:
-            pass
+            debug_option = None
 
         # verify we got correct number of arguments
         try:
             bot_file_path = base64.b64decode(sys.argv[1]).decode('utf8')
         except IndexError:
-            sys.stderr.write('Usage: pythonRunner.py <bot_path or bot_directory>\n')
+            sys.stderr.write('Usage: pythonRunner.py <bot_path or bot_directory> [multiplex]\n')
             sys.exit(-1)
         except TypeError:
             sys.stderr.write("Couldn't decode bot's name from base 64: '" + sys.argv[1] + "'\n" +
@@ -1076,15 +2267,13 @@ if __name__ == '__main__':
             sys.exit(-2)
 
         # add python to path and start the BotController
-        if os.path.isdir(bot_file_path):
-            sys.path.append(bot_file_path)
-            bot_path = os.path.join(bot_file_path, DEFAULT_BOT_FILE)
-        else:
-            sys.path.append(os.path.dirname(bot_file_path))
-            bot_path = bot_file_path
+        bot_path = _add_bot_to_path(bot_file_path)
 
         # noinspection PyProtectedMember
-        PirateGame._run(_BotController(bot_path))
+        if debug_option == MULTIPLEX_OPTION:
+            PirateGame._run_multiplexed(_BotController(bot_path))
+        else:
+            PirateGame._run(_BotController(bot_path))
 
     except KeyboardInterrupt:
         print('ctrl-c, leaving ...')
@@ -1107,5 +2296,14 @@ __all__ = [
     'Pirate',
 
     # Game object.
-    'PirateGame'
+    'PirateGame',
+
+    # Bulk queries.
+    'UnitTable',
+
+    # Caching.
+    'per_turn_cache',
+
+    # Events.
+    'Event'
 ]
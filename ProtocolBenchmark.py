@@ -0,0 +1,153 @@
+# !/usr/bin/env python2
+"""
+Measures the communication between the engine and the runner on its own, apart from the engine and any bot.
+
+Synthetic turns are pushed through a pipe into the runner's echo mode, which parses every frame and formats it again.
+For each codec this reports frames per second, the p50 and p99 round trip latency and bytes per second.
+
+Usage: ProtocolBenchmark.py [--units N] [--frames N] [--codec json|binary]
+"""
+from __future__ import division
+import argparse
+import base64
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+import BinaryProtocol
+
+RUNNER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Pirates.py')
+ECHO_OPTION = 'test_python_runner_json_communication_pipe_data_transfer'
+CODECS = ('json', 'binary')
+
+
+def make_turn(units, seed=0):
+    """
+    Makes a synthetic turn with the given number of pirates and drones for each player.
+
+    :param units: the number of pirates and the number of drones each player has.
+    :type units: int
+    :param seed: the seed of the random locations.
+    :type seed: int
+    :return: the turn message.
+    :rtype: dict[str, any]
+    """
+    generator = random.Random(seed)
+    size = max(20, int((units * 4) ** 0.5) * 2)
+    unique_ids = iter(xrange(1, 10 * units + 100))
+
+    def location():
+        return [generator.randrange(size), generator.randrange(size)]
+
+    pirates, dead_pirates, drones = [], [], []
+    for owner in (0, 1):
+        for pirate_id in xrange(units):
+            pirate = {'id': pirate_id, 'unique_id': next(unique_ids), 'location': location(), 'owner': owner,
+                      'initial_location': location(), 'attack_range': 5, 'max_speed': 2}
+            if pirate_id % 10 == 9:
+                pirate['turns_to_revive'] = generator.randrange(1, 10)
+                dead_pirates.append(pirate)
+            else:
+                pirate['current_health'] = generator.randrange(1, 4)
+                pirates.append(pirate)
+        for drone_id in xrange(units):
+            drones.append({'id': drone_id, 'unique_id': next(unique_ids), 'location': location(), 'owner': owner,
+                           'initial_location': location(), 'max_speed': 1, 'current_health': 1, 'value': 1})
+    islands = [{'id': island_id, 'unique_id': next(unique_ids), 'location': location(),
+                'owner': generator.choice((-1, 0, 1)), 'control_range': 2,
+                'turns_to_drone_creation': generator.randrange(10)} for island_id in xrange(max(3, units // 10))]
+    cities = [{'id': city_id, 'unique_id': next(unique_ids), 'location': location(), 'owner': city_id % 2,
+               'unload_range': 1, 'value_multiplier': 1} for city_id in xrange(max(2, units // 20))]
+    return {'type': 'turn', 'data': {'players': [{'id': 0, 'score': 0}, {'id': 1, 'score': 0}],
+                                     'pirates': pirates, 'dead_pirates': dead_pirates, 'drones': drones,
+                                     'islands': islands, 'cities': cities}}
+
+
+def encode(codec, message):
+    """
+    Formats a message the way the engine would send it with the given codec.
+
+    :rtype: str
+    """
+    if codec == 'binary':
+        return BinaryProtocol.format_frame(message)
+    return json.dumps(message) + '\n'
+
+
+def percentile(sorted_values, fraction):
+    """
+    Gets the value below which the given fraction of the sorted values falls.
+
+    :rtype: float
+    """
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_codec(codec, frame, frames):
+    """
+    Sends the frame through the runner's echo mode the given number of times, waiting for each echo before sending the
+    next one.
+
+    :param codec: the codec to use, 'json' or 'binary'.
+    :type codec: str
+    :param frame: the formatted frame to send.
+    :type frame: str
+    :param frames: the number of round trips.
+    :type frames: int
+    :return: the results, frames per second, latencies in milliseconds and bytes per second.
+    :rtype: dict[str, float]
+    """
+    # python 2 pipes are unbuffered by default, which would make readline read a byte at a time
+    runner = subprocess.Popen([sys.executable, RUNNER_PATH, base64.b64encode(b''), ECHO_OPTION, codec],
+                              stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=-1)
+    latencies = []
+    received_bytes = 0
+    try:
+        started = time.time()
+        for _ in xrange(frames):
+            sent = time.time()
+            runner.stdin.write(frame)
+            runner.stdin.flush()
+            if codec == 'binary':
+                header = runner.stdout.read(BinaryProtocol.FRAME_HEADER.size)
+                length, = BinaryProtocol.FRAME_HEADER.unpack(header)
+                reply_size = len(header) + len(runner.stdout.read(length))
+            else:
+                reply_size = len(runner.stdout.readline())
+            latencies.append(time.time() - sent)
+            received_bytes += reply_size
+        elapsed = time.time() - started
+    finally:
+        runner.stdin.close()
+        runner.wait()
+    latencies.sort()
+    return {'frames_per_second': frames / elapsed,
+            'p50_ms': percentile(latencies, 0.5) * 1000,
+            'p99_ms': percentile(latencies, 0.99) * 1000,
+            'bytes_per_second': (len(frame) * frames + received_bytes) / elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures the runner communication throughput.')
+    parser.add_argument('--units', type=int, default=100, help='pirates and drones per player in each frame')
+    parser.add_argument('--frames', type=int, default=500, help='number of round trips per codec')
+    parser.add_argument('--codec', choices=CODECS, action='append', help='codec to measure, default is all of them')
+    arguments = parser.parse_args()
+
+    message = make_turn(arguments.units)
+    print('{:<8} {:>10} {:>12} {:>10} {:>10} {:>14}'.format('codec', 'frame size', 'frames/sec', 'p50 ms', 'p99 ms',
+                                                             'bytes/sec'))
+    for codec in arguments.codec or CODECS:
+        frame = encode(codec, message)
+        results = run_codec(codec, frame, arguments.frames)
+        print('{:<8} {:>10} {:>12.1f} {:>10.3f} {:>10.3f} {:>14.0f}'.format(
+            codec, len(frame), results['frames_per_second'], results['p50_ms'], results['p99_ms'],
+            results['bytes_per_second']))
+
+
+if __name__ == '__main__':
+    main()
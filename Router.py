@@ -0,0 +1,203 @@
+"""
+This module finds the cheapest multi-turn routes to destinations, trading the number of turns against the danger of the
+cells an aircraft stops on.
+"""
+import heapq
+
+from LocationClass import Location
+
+# enable type hinting without causing a real circular imports loop
+# WARNING: THIS DOES NOT ACTUALLY IMPORT THESE CLASSES. EVER!
+if __name__ == '__main__':
+    import Aircraft
+    import DistanceMatrix
+    import MapObject
+
+# the cost of stopping on a cell for each enemy pirate that can attack it, in turns
+DEFAULT_DANGER_PENALTY = 1
+
+
+class DistanceField(object):
+    """
+    The cost of the cheapest route from every cell to a single destination, for aircrafts of a single max speed.
+
+    A turn moves an aircraft to any cell within its max speed, and costs one turn plus the danger penalty of the cell it
+    stops on. The field is a Dijkstra search that starts from the destination, and it only goes as far as the queries
+    need: a query resumes the search until the cell it asks about is settled, so the aircrafts that head to the same
+    destination share a single search.
+    """
+    def __init__(self, row_count, col_count, destination, max_speed, stop_costs):
+        """
+        :param row_count: the number of rows in the map.
+        :type row_count: int
+        :param col_count: the number of cols in the map.
+        :type col_count: int
+        :param destination: the location to route to.
+        :type destination: Location
+        :param max_speed: the max speed of the aircrafts.
+        :type max_speed: int
+        :param stop_costs: the cost of ending a turn on each cell, row after row.
+        :type stop_costs: list[float]
+        """
+        self.__row_count = row_count
+        """:type : int"""
+        self.__col_count = col_count
+        """:type : int"""
+        self.destination = destination
+        """:type : Location"""
+        self.max_speed = max_speed
+        """:type : int"""
+        self.__stop_costs = stop_costs
+        """:type : list[float]"""
+        cell_count = row_count * col_count
+        self.__costs = [float('inf')] * cell_count
+        """:type : list[float]"""
+        self.__settled = bytearray(cell_count)
+        """:type : bytearray"""
+        destination_index = destination.row * col_count + destination.col
+        self.__costs[destination_index] = 0
+        self.__queue = [(0, destination_index)]
+        """:type : list[(float, int)]"""
+
+    def __settle(self, index):
+        """
+        Resumes the search until a cell is settled, or until every cell is.
+        """
+        settled = self.__settled
+        costs = self.__costs
+        queue = self.__queue
+        col_count = self.__col_count
+        row_count = self.__row_count
+        max_speed = self.max_speed
+        while queue and not settled[index]:
+            cost, current = heapq.heappop(queue)
+            if settled[current]:
+                continue
+            settled[current] = 1
+            # every cell within max speed of this one can get here in a turn, and stop here
+            new_cost = cost + self.__stop_costs[current]
+            row, col = divmod(current, col_count)
+            for other_row in xrange(max(0, row - max_speed), min(row_count - 1, row + max_speed) + 1):
+                width = max_speed - abs(other_row - row)
+                row_start = other_row * col_count
+                for other in xrange(row_start + max(0, col - width), row_start + min(col_count - 1, col + width) + 1):
+                    if new_cost < costs[other]:
+                        costs[other] = new_cost
+                        heapq.heappush(queue, (new_cost, other))
+
+    def get_cost(self, location):
+        """
+        Gets the cost of the cheapest route from a location to the destination.
+
+        :param location: the location, which must be on the map.
+        :type location: Location
+        :return: the cost, 0 on the destination itself.
+        :rtype: float
+        """
+        index = location.row * self.__col_count + location.col
+        self.__settle(index)
+        return self.__costs[index]
+
+    def get_next_location(self, location):
+        """
+        Gets the cell to stop on this turn, on the cheapest route from a location to the destination.
+
+        :param location: the location, which must be on the map.
+        :type location: Location
+        :return: the next cell, the location itself if it is the destination or the aircrafts can't move.
+        :rtype: Location
+        """
+        if location is self.destination or self.max_speed <= 0:
+            return location
+        # the best next cell is cheaper than the location, so it is settled once the location is
+        self.get_cost(location)
+        col_count = self.__col_count
+        max_speed = self.max_speed
+        costs = self.__costs
+        settled = self.__settled
+        stop_costs = self.__stop_costs
+        destination = self.destination
+        row = location.row
+        col = location.col
+        best = None
+        best_key = None
+        for other_row in xrange(max(0, row - max_speed), min(self.__row_count - 1, row + max_speed) + 1):
+            width = max_speed - abs(other_row - row)
+            for other_col in xrange(max(0, col - width), min(col_count - 1, col + width) + 1):
+                other = other_row * col_count + other_col
+                if not settled[other] or (other_row == row and other_col == col):
+                    continue
+                # ties go to the cell nearest to the destination
+                key = (costs[other] + stop_costs[other],
+                       abs(destination.row - other_row) + abs(destination.col - other_col), other)
+                if best_key is None or key < best_key:
+                    best_key = key
+                    best = other
+        return location if best is None else Location(*divmod(best, col_count))
+
+
+class Router(object):
+    """
+    Routes aircrafts to destinations over the danger of a turn, keeping a :class:`DistanceField` for every destination
+    and max speed that was asked for.
+    """
+    def __init__(self, row_count, col_count, danger, danger_penalty=DEFAULT_DANGER_PENALTY):
+        """
+        :param row_count: the number of rows in the map.
+        :type row_count: int
+        :param col_count: the number of cols in the map.
+        :type col_count: int
+        :param danger: the danger of every cell, danger[row, col], e.g. the threat of an influence map.
+        :type danger: numpy.ndarray | DistanceMatrix.Matrix
+        :param danger_penalty: the cost of stopping on a cell for each unit of its danger, in turns.
+        :type danger_penalty: float
+        """
+        self.__row_count = row_count
+        """:type : int"""
+        self.__col_count = col_count
+        """:type : int"""
+        self.__stop_costs = [1 + danger_penalty * cell_danger for row in danger.tolist() for cell_danger in row]
+        """:type : list[float]"""
+        self.__fields = {}
+        """:type : dict[(Location, int), DistanceField]"""
+
+    def get_field(self, destination, max_speed):
+        """
+        Gets the distance field of a destination, made on its first use.
+
+        :param destination: the destination.
+        :type destination: MapObject.MapObject
+        :param max_speed: the max speed of the aircrafts.
+        :type max_speed: int
+        :rtype: DistanceField
+        """
+        key = (destination.get_location(), max_speed)
+        field = self.__fields.get(key)
+        if field is None:
+            field = self.__fields[key] = DistanceField(self.__row_count, self.__col_count, key[0], max_speed,
+                                                       self.__stop_costs)
+        return field
+
+    def get_cost(self, aircraft, destination):
+        """
+        Gets the cost of the cheapest route of an aircraft to a destination.
+
+        :param aircraft: the aircraft.
+        :type aircraft: Aircraft.Aircraft
+        :param destination: the destination.
+        :type destination: MapObject.MapObject
+        :rtype: float
+        """
+        return self.get_field(destination, aircraft.max_speed).get_cost(aircraft.get_location())
+
+    def get_next_location(self, aircraft, destination):
+        """
+        Gets the cell an aircraft should sail to this turn, on its cheapest route to a destination.
+
+        :param aircraft: the aircraft.
+        :type aircraft: Aircraft.Aircraft
+        :param destination: the destination.
+        :type destination: MapObject.MapObject
+        :rtype: Location
+        """
+        return self.get_field(destination, aircraft.max_speed).get_next_location(aircraft.get_location())
@@ -0,0 +1,169 @@
+# !/usr/bin/env python2
+"""
+A local daemon that keeps pre-imported runner workers warm, so a match doesn't pay for starting the interpreter and
+importing the runner.
+
+The pool listens on a unix socket and keeps a number of forked workers waiting on it. The engine starts a match by
+connecting to the socket and sending the base64 encoded bot path (the same argument Pirates.py takes) followed by a new
+line. The worker that accepts the connection loads the bot, and from then on the connection is the match's
+stdin/stdout pair, with the usual messages. The worker exits when the match ends, and the pool forks a new one.
+
+Forking and unix sockets are only available on posix systems.
+
+Usage: RunnerPool.py <socket_path> [--workers N]
+"""
+import argparse
+import base64
+import os
+import signal
+import socket
+import sys
+import traceback
+
+import Pirates
+
+DEFAULT_WORKERS = 4
+LISTEN_BACKLOG = 64
+
+
+def _read_bot_path(connection):
+    """
+    Reads the bot path line that starts a match. Reads a byte at a time so none of the match's messages are taken.
+
+    :param connection: the match's connection.
+    :type connection: socket.socket
+    :return: the decoded bot path, or None if the connection closed first.
+    :rtype: unicode | None
+    """
+    line = []
+    while True:
+        char = connection.recv(1)
+        if not char:
+            return None
+        if char == b'\n':
+            break
+        line.append(char)
+    return base64.b64decode(b''.join(line)).decode('utf8')
+
+
+def _serve_match(listener):
+    """
+    The body of a worker: accepts a single match, connects it to stdin and stdout, loads the bot and runs it.
+
+    :param listener: the pool's listening socket.
+    :type listener: socket.socket
+    """
+    connection, _ = listener.accept()
+    listener.close()
+    bot_file_path = _read_bot_path(connection)
+    if bot_file_path is None:
+        return
+    os.dup2(connection.fileno(), sys.stdin.fileno())
+    os.dup2(connection.fileno(), sys.stdout.fileno())
+    connection.close()
+
+    # the bot is loaded only after the fork, so every match gets a fresh copy of its module globals
+    bot_path = Pirates._add_bot_to_path(bot_file_path)
+    # noinspection PyProtectedMember
+    Pirates.PirateGame._run(Pirates._BotController(bot_path))
+
+
+def _fork_worker(listener):
+    """
+    Forks a new worker waiting for a match.
+
+    :param listener: the pool's listening socket.
+    :type listener: socket.socket
+    :return: the pid of the worker.
+    :rtype: int
+    """
+    # don't let the worker write out whatever the pool buffered
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid:
+        return pid
+
+    exit_code = 0
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    # noinspection PyBroadException
+    try:
+        _serve_match(listener)
+    except BaseException:
+        sys.stderr.write(traceback.format_exc())
+        exit_code = 1
+    finally:
+        # never return into the pool's code, and skip its cleanup, which belongs to the parent
+        os._exit(exit_code)
+
+
+def serve(socket_path, workers=DEFAULT_WORKERS):
+    """
+    Runs the pool until it is interrupted or terminated.
+
+    :param socket_path: the path of the unix socket to listen on.
+    :type socket_path: str
+    :param workers: the number of workers to keep waiting for matches.
+    :type workers: int
+    """
+    # the same setup Pirates.py does when it runs as the main module
+    reload(sys)
+    sys.setdefaultencoding('utf8')
+
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(LISTEN_BACKLOG)
+
+    def terminate(signal_number, frame):
+        raise KeyboardInterrupt()
+    signal.signal(signal.SIGTERM, terminate)
+
+    worker_pids = set(_fork_worker(listener) for _ in xrange(workers))
+    try:
+        while True:
+            pid, _ = os.wait()
+            if pid in worker_pids:
+                worker_pids.remove(pid)
+                worker_pids.add(_fork_worker(listener))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+        listener.close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+def connect(socket_path, bot_file_path):
+    """
+    Starts a match on a running pool, for harnesses written in python.
+
+    :param socket_path: the path of the pool's unix socket.
+    :type socket_path: str
+    :param bot_file_path: the path of the bot file or the bot directory.
+    :type bot_file_path: unicode
+    :return: the match's connection, to send the messages to and read the replies from.
+    :rtype: socket.socket
+    """
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.connect(socket_path)
+    connection.sendall(base64.b64encode(bot_file_path.encode('utf8')) + b'\n')
+    return connection
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Keeps pre-imported runner workers warm.')
+    parser.add_argument('socket_path', help='the unix socket to listen on')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='number of workers kept waiting')
+    arguments = parser.parse_args()
+    serve(arguments.socket_path, arguments.workers)
+
+
+if __name__ == '__main__':
+    main()
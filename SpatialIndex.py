@@ -0,0 +1,173 @@
+"""
+This module holds the uniform grid of the objects on the map, for occupancy and range queries.
+"""
+import heapq
+
+# enable type hinting without causing a real circular imports loop
+# WARNING: THIS DOES NOT ACTUALLY IMPORT THESE CLASSES. EVER!
+if __name__ == '__main__':
+    import GameObject
+    import LocationClass
+    import MapObject
+
+DEFAULT_CELL_SIZE = 8
+
+
+class SpatialIndex(object):
+    """
+    Buckets the game objects of a turn by the square cell of the grid they are in, and by their exact location.
+
+    A range query only checks the objects of the cells that overlap the range, and a nearest query goes over the cells
+    in growing rings around the point, stopping once no farther cell can have a closer object. All the distances are
+    manhattan distances.
+    """
+    def __init__(self, game_objects, cell_size=DEFAULT_CELL_SIZE):
+        """
+        :param game_objects: the objects to index.
+        :type game_objects: list[GameObject.GameObject]
+        :param cell_size: the size of the side of each cell.
+        :type cell_size: int
+        """
+        self.__cell_size = cell_size
+        """:type : int"""
+        self.__cells = {}
+        """:type : dict[(int, int), list[GameObject.GameObject]]"""
+        self.__by_location = {}
+        """:type : dict[LocationClass.Location, list[GameObject.GameObject]]"""
+        cells = self.__cells
+        by_location = self.__by_location
+        for game_object in game_objects:
+            location = game_object.location
+            cell = (location.row // cell_size, location.col // cell_size)
+            cell_objects = cells.get(cell)
+            if cell_objects is None:
+                cells[cell] = [game_object]
+            else:
+                cell_objects.append(game_object)
+            location_objects = by_location.get(location)
+            if location_objects is None:
+                by_location[location] = [game_object]
+            else:
+                location_objects.append(game_object)
+        # the bounds of the cells that have objects, to know when a nearest query can stop
+        if cells:
+            self.__cell_rows = (min(cell[0] for cell in cells), max(cell[0] for cell in cells))
+            self.__cell_cols = (min(cell[1] for cell in cells), max(cell[1] for cell in cells))
+        else:
+            self.__cell_rows = self.__cell_cols = (0, 0)
+
+    def get_objects_on(self, location):
+        """
+        Gets the objects on a location.
+
+        :param location: the location.
+        :type location: LocationClass.Location
+        :return: the objects on the location, in the order they were indexed.
+        :rtype: list[GameObject.GameObject]
+        """
+        return list(self.__by_location.get(location, ()))
+
+    def get_objects_in_range(self, location, manhattan_range, object_filter=None):
+        """
+        Gets the objects within a range of a location.
+
+        :param location: the location.
+        :type location: LocationClass.Location
+        :param manhattan_range: the range from the location.
+        :type manhattan_range: int
+        :param object_filter: returns whether to include an object, or None to include every object.
+        :type object_filter: ((GameObject.GameObject) -> bool) | None
+        :return: the objects, from the nearest to the farthest.
+        :rtype: list[GameObject.GameObject]
+        """
+        cell_size = self.__cell_size
+        row = location.row
+        col = location.col
+        cells = self.__cells
+        found = []
+        for cell_row in xrange((row - manhattan_range) // cell_size, (row + manhattan_range) // cell_size + 1):
+            # the distance from the point to the nearest row of this cell row, to skip cells out of the range
+            row_gap = max(cell_row * cell_size - row, row - (cell_row * cell_size + cell_size - 1), 0)
+            col_range = manhattan_range - row_gap
+            if col_range < 0:
+                continue
+            for cell_col in xrange((col - col_range) // cell_size, (col + col_range) // cell_size + 1):
+                cell_objects = cells.get((cell_row, cell_col))
+                if cell_objects is None:
+                    continue
+                for game_object in cell_objects:
+                    other = game_object.location
+                    distance = abs(other.row - row) + abs(other.col - col)
+                    if distance <= manhattan_range and (object_filter is None or object_filter(game_object)):
+                        found.append((distance, len(found), game_object))
+        found.sort()
+        return [game_object for _, _, game_object in found]
+
+    def get_nearest(self, location, count=1, object_filter=None):
+        """
+        Gets the objects nearest to a location.
+
+        :param location: the location.
+        :type location: LocationClass.Location
+        :param count: the number of objects to get.
+        :type count: int
+        :param object_filter: returns whether to include an object, or None to include every object.
+        :type object_filter: ((GameObject.GameObject) -> bool) | None
+        :return: up to count objects, from the nearest to the farthest.
+        :rtype: list[GameObject.GameObject]
+        """
+        if count <= 0:
+            return []
+        cell_size = self.__cell_size
+        row = location.row
+        col = location.col
+        center_row = row // cell_size
+        center_col = col // cell_size
+        cells = self.__cells
+        # the number of rings that cover every cell with objects
+        last_ring = max(abs(center_row - self.__cell_rows[0]), abs(center_row - self.__cell_rows[1]),
+                        abs(center_col - self.__cell_cols[0]), abs(center_col - self.__cell_cols[1]))
+        # a max heap of the nearest objects so far, by (-distance, -order)
+        nearest = []
+        order = 0
+        for ring in xrange(last_ring + 1):
+            for cell in self.__ring_cells(center_row, center_col, ring):
+                cell_objects = cells.get(cell)
+                if cell_objects is None:
+                    continue
+                for game_object in cell_objects:
+                    other = game_object.location
+                    distance = abs(other.row - row) + abs(other.col - col)
+                    if len(nearest) == count and distance > -nearest[0][0]:
+                        continue
+                    if object_filter is not None and not object_filter(game_object):
+                        continue
+                    order += 1
+                    entry = (-distance, -order, game_object)
+                    if len(nearest) < count:
+                        heapq.heappush(nearest, entry)
+                    elif entry > nearest[0]:
+                        heapq.heapreplace(nearest, entry)
+            # objects in farther rings are more than ring * cell_size away
+            if len(nearest) == count and -nearest[0][0] <= ring * cell_size:
+                break
+        nearest.sort(reverse=True)
+        return [game_object for _, _, game_object in nearest]
+
+    @staticmethod
+    def __ring_cells(center_row, center_col, ring):
+        """
+        Gets the cells at a chebyshev distance of ring cells from the center cell.
+
+        :rtype: list[(int, int)]
+        """
+        if ring == 0:
+            return [(center_row, center_col)]
+        cells = []
+        for cell_col in xrange(center_col - ring, center_col + ring + 1):
+            cells.append((center_row - ring, cell_col))
+            cells.append((center_row + ring, cell_col))
+        for cell_row in xrange(center_row - ring + 1, center_row + ring):
+            cells.append((cell_row, center_col - ring))
+            cells.append((cell_row, center_col + ring))
+        return cells
@@ -0,0 +1,123 @@
+"""
+This module keeps the known future events of the game ordered by the turn they happen at.
+"""
+import heapq
+from itertools import count
+
+# enable type hinting without causing a real circular imports loop
+# WARNING: THIS DOES NOT ACTUALLY IMPORT THESE CLASSES. EVER!
+if __name__ == '__main__':
+    import GameObject
+    import IslandClass
+    import PirateClass
+
+# the kinds of future events
+DRONE_CREATION = 'drone_creation'
+PIRATE_REVIVE = 'pirate_revive'
+
+
+class Timeline(object):
+    """
+    A priority queue of the future drone creations of the islands and revives of the dead pirates, keyed by the absolute
+    turn they happen at.
+
+    A timer that counts down as expected keeps the same absolute turn, so an update only touches the entries whose
+    timers changed. Entries that changed or ended are left in the queue and skipped, and the queue is rebuilt once they
+    take most of it.
+    """
+    def __init__(self):
+        # the queue of (turn, sequence, unique id) entries, some of which may be out of date
+        self.__queue = []
+        """:type : list[(int, int, int)]"""
+        # the current entry of every object with a future event: unique id to (turn, kind, object)
+        self.__entries = {}
+        """:type : dict[int, (int, str, GameObject.GameObject)]"""
+        self.__sequence = count()
+
+    def update(self, turn, islands, dead_pirates):
+        """
+        Updates the timeline from the timers of the current turn.
+
+        :param turn: the current turn.
+        :type turn: int
+        :param islands: all the islands. Only islands with an owner create drones.
+        :type islands: list[IslandClass.BaseIsland]
+        :param dead_pirates: the dead pirates.
+        :type dead_pirates: list[PirateClass.BasePirate]
+        """
+        old_entries = self.__entries
+        entries = {}
+        for island in islands:
+            if island.owner.id != -1:
+                self.__set(entries, old_entries, turn + island.turns_to_drone_creation, DRONE_CREATION, island)
+        for pirate in dead_pirates:
+            self.__set(entries, old_entries, turn + pirate.turns_to_revive, PIRATE_REVIVE, pirate)
+        self.__entries = entries
+
+        # drop the entries that are in the past, and rebuild the queue when it is mostly made of entries out of date
+        queue = self.__queue
+        while queue and queue[0][0] < turn:
+            heapq.heappop(queue)
+        if len(queue) > 2 * len(entries) + 16:
+            self.__queue = [(entry_turn, next(self.__sequence), unique_id)
+                            for unique_id, (entry_turn, _, _) in entries.iteritems()]
+            heapq.heapify(self.__queue)
+
+    def __set(self, entries, old_entries, event_turn, kind, game_object):
+        """
+        Sets the next event of an object, queueing it only if it changed.
+        """
+        unique_id = game_object.unique_id
+        entry = (event_turn, kind, game_object)
+        old_entry = old_entries.get(unique_id)
+        if old_entry is None or old_entry[0] != event_turn or old_entry[1] != kind:
+            heapq.heappush(self.__queue, (event_turn, next(self.__sequence), unique_id))
+        entries[unique_id] = entry
+
+    def get_next_turn(self, game_object):
+        """
+        Gets the turn of the next event of an object.
+
+        :param game_object: an island or a pirate.
+        :type game_object: GameObject.GameObject
+        :return: the absolute turn, or None if the object has no known future event.
+        :rtype: int | None
+        """
+        entry = self.__entries.get(game_object.unique_id)
+        return None if entry is None else entry[0]
+
+    def get_events_until(self, last_turn):
+        """
+        Gets the events up to a turn, without going over the later events.
+
+        :param last_turn: the last turn to include.
+        :type last_turn: int
+        :return: (turn, kind, object) events, ordered by turn.
+        :rtype: list[(int, str, GameObject.GameObject)]
+        """
+        queue = self.__queue
+        entries = self.__entries
+        events = []
+        # walk the heap from its root, a node that is too late means all of its children are too late as well
+        pending = [0] if queue else []
+        while pending:
+            index = pending.pop()
+            event_turn, sequence, unique_id = queue[index]
+            if event_turn > last_turn:
+                continue
+            entry = entries.get(unique_id)
+            if entry is not None and entry[0] == event_turn:
+                events.append((event_turn, sequence, entry))
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(queue):
+                    pending.append(child)
+        events.sort()
+        # an entry can be queued more than once if its timer changed back, keep one event for it
+        seen = set()
+        result = []
+        for event_turn, _, entry in events:
+            unique_id = entry[2].unique_id
+            if unique_id not in seen:
+                seen.add(unique_id)
+                result.append(entry)
+        return result
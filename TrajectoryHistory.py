@@ -0,0 +1,128 @@
+"""
+This module keeps the recent locations and health of every living aircraft, in bounded ring buffers.
+"""
+from __future__ import division
+from array import array
+
+from LocationClass import Location
+
+# enable type hinting without causing a real circular imports loop
+# WARNING: THIS DOES NOT ACTUALLY IMPORT THESE CLASSES. EVER!
+if __name__ == '__main__':
+    import Aircraft
+
+DEFAULT_HISTORY_SIZE = 8
+
+# the fields of each entry, stored next to each other in the ring buffer
+TURN, ROW, COL, HEALTH = range(4)
+ENTRY_SIZE = 4
+
+
+class _Track(object):
+    """
+    The ring buffer of a single aircraft.
+    """
+    __slots__ = ('values', 'count', 'next')
+
+    def __init__(self, size):
+        self.values = array('i', [0]) * (size * ENTRY_SIZE)
+        """:type : array"""
+        # the number of entries in the buffer, and the place of the next entry
+        self.count = 0
+        """:type : int"""
+        self.next = 0
+        """:type : int"""
+
+
+class TrajectoryHistory(object):
+    """
+    Holds the last entries of each living pirate and drone by its unique id, each entry with the turn, the location and
+    the health. Each aircraft has a fixed size buffer, where new entries replace the oldest ones, and its buffer is
+    dropped once it is no longer alive, so the memory stays bounded for any number of turns.
+    """
+    def __init__(self, size=DEFAULT_HISTORY_SIZE):
+        """
+        :param size: the number of entries kept for each aircraft.
+        :type size: int
+        """
+        self.__size = size
+        """:type : int"""
+        self.__tracks = {}
+        """:type : dict[int, _Track]"""
+
+    def record(self, turn, aircrafts):
+        """
+        Adds the entries of a turn. Aircrafts that are not in the turn are dropped, and a pirate that revives starts
+        with an empty history.
+
+        :param turn: the turn of the entries.
+        :type turn: int
+        :param aircrafts: all the living aircrafts of the turn.
+        :type aircrafts: list[Aircraft.Aircraft]
+        """
+        size = self.__size
+        old_tracks = self.__tracks
+        tracks = {}
+        for aircraft in aircrafts:
+            unique_id = aircraft.unique_id
+            track = old_tracks.get(unique_id)
+            if track is None:
+                track = _Track(size)
+            index = track.next * ENTRY_SIZE
+            values = track.values
+            location = aircraft.location
+            values[index + TURN] = turn
+            values[index + ROW] = location.row
+            values[index + COL] = location.col
+            values[index + HEALTH] = aircraft.current_health
+            track.next = (track.next + 1) % size
+            if track.count < size:
+                track.count += 1
+            tracks[unique_id] = track
+        self.__tracks = tracks
+
+    def get_history(self, unique_id, count=None):
+        """
+        Gets the last entries of an aircraft.
+
+        :param unique_id: the unique id of the aircraft.
+        :type unique_id: int
+        :param count: the maximal number of entries to get, or None for all the kept entries.
+        :type count: int | None
+        :return: (turn, location, health) entries, from the oldest to the newest. Empty if the aircraft has none.
+        :rtype: list[(int, Location, int)]
+        """
+        track = self.__tracks.get(unique_id)
+        if track is None:
+            return []
+        available = track.count if count is None else max(0, min(count, track.count))
+        size = self.__size
+        values = track.values
+        history = []
+        for place in xrange(track.next - available, track.next):
+            index = (place % size) * ENTRY_SIZE
+            history.append((values[index + TURN], Location(values[index + ROW], values[index + COL]),
+                            values[index + HEALTH]))
+        return history
+
+    def get_velocity(self, unique_id):
+        """
+        Estimates the movement of an aircraft per turn, from its oldest and newest kept entries.
+
+        :param unique_id: the unique id of the aircraft.
+        :type unique_id: int
+        :return: the average (rows, cols) moved per turn, (0, 0) if it has less than two entries.
+        :rtype: (float, float)
+        """
+        track = self.__tracks.get(unique_id)
+        if track is None or track.count < 2:
+            return 0.0, 0.0
+        size = self.__size
+        values = track.values
+        newest = ((track.next - 1) % size) * ENTRY_SIZE
+        oldest = ((track.next - track.count) % size) * ENTRY_SIZE
+        turns = values[newest + TURN] - values[oldest + TURN]
+        if turns <= 0:
+            return 0.0, 0.0
+        return ((values[newest + ROW] - values[oldest + ROW]) / turns,
+                (values[newest + COL] - values[oldest + COL]) / turns)
@@ -0,0 +1,113 @@
+"""
+This module holds the per turn cache, for functions whose result doesn't change during a turn.
+"""
+import functools
+
+
+class TurnCache(object):
+    """
+    The results of the per turn cached functions of a single game in the current turn, by the function and its
+    arguments. Each game has its own cache, so games that run in the same process never drop each other's results, and
+    the results of a game go away with it.
+    """
+    def __init__(self):
+        self.__results = {}
+        """:type : dict[(function, tuple), any]"""
+        # the number of turns the cache was cleared for, so a result can be told apart from a result of another turn
+        self.generation = 0
+        """:type : int"""
+        # the number of calls that were answered from the cache, and that were not
+        self.hits = 0
+        """:type : int"""
+        self.misses = 0
+        """:type : int"""
+
+    def new_turn(self):
+        """
+        Drops the results of the previous turn. Called by the game at the beginning of every turn.
+        """
+        self.__results = {}
+        self.generation += 1
+
+    def get_results(self):
+        """
+        Gets the results of the current turn.
+
+        :return: the results by (function, arguments).
+        :rtype: dict[(function, tuple), any]
+        """
+        return self.__results
+
+    def clear(self):
+        """
+        Drops the results of the current turn.
+        """
+        self.__results = {}
+
+    def reset_counters(self):
+        """
+        Sets the hit and miss counters back to 0.
+        """
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return '{{TurnCache hits: {hits}, misses: {misses}}}'.format(hits=self.hits, misses=self.misses)
+
+
+def per_turn_cache(function):
+    """
+    Caches the results of a function for the rest of the turn, by its arguments. The function is called at most once
+    per turn for the same arguments, as long as they are hashable. The first argument is the game, which keeps the
+    results, see :func:`Pirates.PirateGame.get_turn_cache`::
+
+        @per_turn_cache
+        def get_targets(game, pirate):
+            ...
+
+    Methods of the game are cached the same way, with self as the game. Results should not be modified by the callers,
+    since every call in the turn gets the same object.
+
+    :param function: the function to cache.
+    :type function: function
+    :return: the cached function.
+    :rtype: function
+    """
+    @functools.wraps(function)
+    def cached_function(game, *args):
+        cache = game.get_turn_cache()
+        key = (function, args)
+        results = cache.get_results()
+        try:
+            result = results[key]
+        except KeyError:
+            cache.misses += 1
+            result = results[key] = function(game, *args)
+        except TypeError:
+            # unhashable arguments can't be cached
+            cache.misses += 1
+            return function(game, *args)
+        else:
+            cache.hits += 1
+        return result
+
+    return cached_function
+
+
+def per_turn_list_cache(function):
+    """
+    Caches the sequence a function returns for the rest of the turn, like :func:`per_turn_cache`, and gives every call
+    a new list of it. The callers may change their list without changing the cached sequence.
+
+    :param function: the function to cache, which returns a sequence.
+    :type function: function
+    :return: the cached function, which returns a list.
+    :rtype: function
+    """
+    cached_function = per_turn_cache(function)
+
+    @functools.wraps(function)
+    def list_function(game, *args):
+        return list(cached_function(game, *args))
+
+    return list_function
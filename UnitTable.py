@@ -0,0 +1,180 @@
+"""
+This module holds the columnar table of the living aircrafts, for bulk queries over many units.
+
+The table is a side index, not the state of the game: the pirates and drones are still game objects, and the table is
+a copy of their columns that is filled every turn once a bot asked for it. With lazy sections the table is filled from
+the records, so the pirates and drones of a turn are only built once a bot looks up a unit it found.
+"""
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    # the queries fall back to plain loops over the arrays
+    numpy = None
+
+# enable type hinting without causing a real circular imports loop
+# WARNING: THIS DOES NOT ACTUALLY IMPORT THESE CLASSES. EVER!
+if __name__ == '__main__':
+    import Aircraft
+
+# the names of the columns, each is an array('i') attribute of the table
+COLUMNS = ('unique_ids', 'ids', 'kinds', 'owners', 'rows', 'cols', 'healths', 'max_speeds')
+
+
+class UnitTable(object):
+    """
+    Holds the state of all the living pirates and drones of a turn as parallel arrays, a row per unit.
+
+    Each column is an array('i'), so a query over all the units runs as a tight loop over contiguous memory, or as
+    NumPy when it is installed. The game objects of the units are only looked up for the rows a query returns.
+    """
+    # the kinds of units in the kinds column
+    PIRATE = 0
+    DRONE = 1
+
+    def __init__(self, get_aircraft):
+        """
+        :param get_aircraft: gets the game object of a unit of the current turn by its unique id.
+        :type get_aircraft: (int) -> Aircraft.Aircraft
+        """
+        self.__get_aircraft = get_aircraft
+        self.unique_ids = array('i')
+        """:type : array"""
+        self.ids = array('i')
+        """:type : array"""
+        self.kinds = array('i')
+        """:type : array"""
+        self.owners = array('i')
+        """:type : array"""
+        self.rows = array('i')
+        """:type : array"""
+        self.cols = array('i')
+        """:type : array"""
+        self.healths = array('i')
+        """:type : array"""
+        self.max_speeds = array('i')
+        """:type : array"""
+        # numpy views of the columns, made on the first numpy query of the turn
+        self.__numpy_columns = None
+        """:type : dict[str, numpy.ndarray] | None"""
+
+    def __len__(self):
+        return len(self.unique_ids)
+
+    def fill_records(self, pirates, drones):
+        """
+        Replaces the content of the table with the units of a turn, from their records.
+
+        :param pirates: the records of the living pirates.
+        :type pirates: list[dict[unicode, any]]
+        :param drones: the records of the drones.
+        :type drones: list[dict[unicode, any]]
+        """
+        records = list(pirates) + list(drones)
+        self.unique_ids = array('i', [record['unique_id'] for record in records])
+        self.ids = array('i', [record['id'] for record in records])
+        self.kinds = array('i', [UnitTable.PIRATE]) * len(pirates) + array('i', [UnitTable.DRONE]) * len(drones)
+        self.owners = array('i', [record['owner'] for record in records])
+        self.rows = array('i', [record['location'][0] for record in records])
+        self.cols = array('i', [record['location'][1] for record in records])
+        self.healths = array('i', [record['current_health'] for record in records])
+        self.max_speeds = array('i', [record['max_speed'] for record in records])
+        self.__numpy_columns = None
+
+    def fill_objects(self, pirates, drones):
+        """
+        Replaces the content of the table with the units of a turn, from their game objects.
+
+        :param pirates: the living pirates.
+        :type pirates: list[Aircraft.Aircraft]
+        :param drones: the drones.
+        :type drones: list[Aircraft.Aircraft]
+        """
+        aircrafts = list(pirates) + list(drones)
+        self.unique_ids = array('i', [aircraft.unique_id for aircraft in aircrafts])
+        self.ids = array('i', [aircraft.id for aircraft in aircrafts])
+        self.kinds = array('i', [UnitTable.PIRATE]) * len(pirates) + array('i', [UnitTable.DRONE]) * len(drones)
+        self.owners = array('i', [aircraft.owner.id for aircraft in aircrafts])
+        self.rows = array('i', [aircraft.location.row for aircraft in aircrafts])
+        self.cols = array('i', [aircraft.location.col for aircraft in aircrafts])
+        self.healths = array('i', [aircraft.current_health for aircraft in aircrafts])
+        self.max_speeds = array('i', [aircraft.max_speed for aircraft in aircrafts])
+        self.__numpy_columns = None
+
+    def get_aircraft(self, index):
+        """
+        Gets the game object of a unit.
+
+        :param index: the unit's row in the table.
+        :type index: int
+        :return: the pirate or drone.
+        :rtype: Aircraft.Aircraft
+        """
+        return self.__get_aircraft(self.unique_ids[index])
+
+    def get_aircrafts(self, indexes):
+        """
+        Gets the game objects of units.
+
+        :param indexes: the units' rows in the table.
+        :type indexes: list[int]
+        :return: the pirates and drones, in the order of the indexes.
+        :rtype: list[Aircraft.Aircraft]
+        """
+        get_aircraft = self.__get_aircraft
+        unique_ids = self.unique_ids
+        return [get_aircraft(unique_ids[index]) for index in indexes]
+
+    def in_range(self, row, col, manhattan_range, owner=None, kind=None):
+        """
+        Finds the units within a manhattan range of a point, e.g. all the enemy drones within range R of a city.
+
+        :param row: the row of the point.
+        :type row: int
+        :param col: the col of the point.
+        :type col: int
+        :param manhattan_range: the range from the point.
+        :type manhattan_range: int
+        :param owner: the id of the owner to keep only the units of, or None for every owner.
+        :type owner: int | None
+        :param kind: UnitTable.PIRATE or UnitTable.DRONE to keep only the units of this kind, or None for both.
+        :type kind: int | None
+        :return: the rows in the table of the units, in table order.
+        :rtype: list[int]
+        """
+        if numpy is not None:
+            columns = self.as_numpy()
+            mask = numpy.abs(columns['rows'] - row) + numpy.abs(columns['cols'] - col) <= manhattan_range
+            if owner is not None:
+                mask &= columns['owners'] == owner
+            if kind is not None:
+                mask &= columns['kinds'] == kind
+            return numpy.flatnonzero(mask).tolist()
+
+        rows = self.rows
+        cols = self.cols
+        indexes = [index for index in xrange(len(rows))
+                   if abs(rows[index] - row) + abs(cols[index] - col) <= manhattan_range]
+        if owner is not None:
+            owners = self.owners
+            indexes = [index for index in indexes if owners[index] == owner]
+        if kind is not None:
+            kinds = self.kinds
+            indexes = [index for index in indexes if kinds[index] == kind]
+        return indexes
+
+    def as_numpy(self):
+        """
+        Gets the columns as NumPy arrays. The arrays share the memory of the columns and are valid until the next turn.
+
+        :return: column name to its array.
+        :rtype: dict[str, numpy.ndarray]
+        """
+        if numpy is None:
+            raise ImportError('NumPy is not installed, use the array columns instead.')
+        if self.__numpy_columns is None:
+            dtype = numpy.dtype('i{size}'.format(size=self.rows.itemsize))
+            self.__numpy_columns = dict((name, numpy.frombuffer(getattr(self, name), dtype=dtype) if len(self) else
+                                         numpy.zeros(0, dtype=dtype)) for name in COLUMNS)
+        return self.__numpy_columns
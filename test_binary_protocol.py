@@ -0,0 +1,113 @@
+"""
+Tests the binary frames: every message comes back from its frame as the same dictionary the json would give.
+"""
+import json
+import unittest
+from StringIO import StringIO
+
+import BinaryProtocol
+from OrderBuffer import OrderBuffer
+from Pirates import PirateGame
+from test_support import city, drone, island, make_setup, pirate, play, turn
+
+TURN = {'type': 'turn', 'data': turn([pirate(1, [5, 5], current_health=3), pirate(2, [20, 20], owner=1,
+                                                                               current_health=2)],
+                                     [pirate(3, [8, 8], turns_to_revive=4)],
+                                     [drone(10, [6, 7], owner=1, value=3)],
+                                     [island(100, [10, 20]), island(101, [3, 4], owner=1, turns_to_drone_creation=7)],
+                                     [city(200, [30, 5]), city(201, [0, 39], owner=1, value_multiplier=2)],
+                                     scores=(4, 11))}
+
+
+def _json_round_trip(message):
+    """
+    Gets the message as it would be parsed from json, where tuples become lists.
+    """
+    return json.loads(json.dumps(message))
+
+
+class BinaryProtocolTest(unittest.TestCase):
+    def _round_trip(self, message):
+        frame = BinaryProtocol.format_frame(message)
+        length, = BinaryProtocol.FRAME_HEADER.unpack_from(frame)
+        self.assertEqual(length, len(frame) - BinaryProtocol.FRAME_HEADER.size)
+        return BinaryProtocol.parse_frame(frame[BinaryProtocol.FRAME_HEADER.size:])
+
+    def test_turn(self):
+        frame = BinaryProtocol.format_frame(TURN)
+        self.assertEqual(frame[BinaryProtocol.FRAME_HEADER.size],
+                         BinaryProtocol.MESSAGE_KIND.pack(BinaryProtocol.TURN_MESSAGE))
+        self.assertEqual(self._round_trip(TURN), _json_round_trip(TURN))
+
+    def test_bot_orders(self):
+        orders = OrderBuffer()
+        orders.move(1, 6, 7)
+        orders.attack(2, 3)
+        message = {'type': 'bot_orders', 'crashed': False,
+                   'data': {'orders': orders.records(),
+                            'debug_messages': [{'type': 'message', 'message': 'aGVsbG8='}]}}
+        self.assertEqual(self._round_trip(message), _json_round_trip(message))
+        # the compact orders give the same frame as the dictionaries
+        compact_message = dict(message, data=dict(message['data'], orders=orders.compact_records()))
+        self.assertEqual(BinaryProtocol.format_frame(compact_message), BinaryProtocol.format_frame(message))
+
+    def test_other_messages_are_json(self):
+        setup = {'type': 'setup', 'data': make_setup(protocol={'binary_frames': True})}
+        frame = BinaryProtocol.format_frame(setup)
+        self.assertEqual(frame[BinaryProtocol.FRAME_HEADER.size],
+                         BinaryProtocol.MESSAGE_KIND.pack(BinaryProtocol.JSON_MESSAGE))
+        self.assertEqual(self._round_trip(setup), _json_round_trip(setup))
+        # a turn with extra keys can't use the layout
+        tagged_turn = dict(TURN, protocol={'binary_frames': True})
+        self.assertEqual(self._round_trip(tagged_turn), _json_round_trip(tagged_turn))
+
+    def test_incorrect_payload(self):
+        frame = BinaryProtocol.format_frame(TURN)
+        self.assertEqual(BinaryProtocol.parse_frame(frame[BinaryProtocol.FRAME_HEADER.size:-3]), {})
+        self.assertEqual(BinaryProtocol.parse_frame(BinaryProtocol.MESSAGE_KIND.pack(BinaryProtocol.JSON_MESSAGE) +
+                                                    '{"type": '), {})
+        self.assertEqual(BinaryProtocol.parse_frame(''), {})
+
+    def test_read_frame(self):
+        frames = BinaryProtocol.format_frame(TURN) + BinaryProtocol.format_frame({'type': 'end', 'data': {}})
+        stream = StringIO(frames + frames[:10])
+        self.assertEqual(BinaryProtocol.read_frame(stream), _json_round_trip(TURN))
+        self.assertEqual(BinaryProtocol.read_frame(stream), {'type': 'end', 'data': {}})
+        # a frame cut short by the end of the stream
+        self.assertEqual(BinaryProtocol.read_frame(stream), {})
+        self.assertEqual(BinaryProtocol.read_frame(stream), {})
+
+
+class NegotiationTest(unittest.TestCase):
+    def _setup(self, protocol):
+        stream = StringIO()
+        game = PirateGame(stream)
+        game._setup(make_setup(protocol=protocol))
+        return game, stream
+
+    def test_binary_codec(self):
+        game, stream = self._setup({'codec': 'binary'})
+        self.assertFalse(game._binary_frames)
+        game._finish_turn()
+        # the reply to the setup is still json, and acknowledges the codec
+        self.assertEqual(json.loads(stream.getvalue())['protocol'], {'codec': 'binary'})
+        self.assertTrue(game._binary_frames)
+        stream.seek(0)
+        stream.truncate()
+        play(game, TURN['data'])
+        game.set_sail(game.get_my_pirate_by_id(1), game.get_my_pirate_by_id(1).location.replace(col=6))
+        game._finish_turn()
+        stream.seek(0)
+        self.assertEqual(BinaryProtocol.read_frame(stream)['data']['orders'],
+                         [{'type': 'order', 'order_type': 'move', 'acting_aircraft': 1,
+                           'order_args': {'destination': [5, 6]}}])
+
+    def test_unknown_codec(self):
+        game, stream = self._setup({'codec': 'msgpack'})
+        game._finish_turn()
+        self.assertEqual(json.loads(stream.getvalue())['protocol'], {'codec': 'json'})
+        self.assertFalse(game._binary_frames)
+
+
+if __name__ == '__main__':
+    unittest.main()
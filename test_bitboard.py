@@ -0,0 +1,105 @@
+"""
+Tests the bitboard masks, on their own and as the game makes them.
+"""
+import unittest
+
+from Bitboard import Bitboard
+from LocationClass import Location
+from test_support import make_game, pirate, play, turn
+
+
+def _diamond(row_count, col_count, row, col, radius):
+    """
+    Gets the locations of the cells of the map within a range of a cell, ordered by row and then by col.
+    """
+    return [Location(other_row, other_col) for other_row in xrange(row_count) for other_col in xrange(col_count)
+            if abs(other_row - row) + abs(other_col - col) <= radius]
+
+
+class BitboardTest(unittest.TestCase):
+    def setUp(self):
+        Location.set_map_size(6, 9)
+        self.bitboard = Bitboard(6, 9, 4)
+
+    def test_diamonds_at_the_edges(self):
+        for row, col in [(0, 0), (0, 8), (5, 0), (5, 8), (0, 4), (3, 0), (2, 5)]:
+            for radius in xrange(5):
+                mask = self.bitboard.diamond_mask(row, col, radius)
+                self.assertEqual(self.bitboard.get_locations(mask), _diamond(6, 9, row, col, radius))
+                self.assertEqual(Bitboard.count(mask), len(_diamond(6, 9, row, col, radius)))
+
+    def test_diamonds_around_cells_off_the_map(self):
+        for row, col in [(-2, 3), (7, 7), (3, -4), (2, 11)]:
+            mask = self.bitboard.diamond_mask(row, col, 4)
+            self.assertEqual(self.bitboard.get_locations(mask), _diamond(6, 9, row, col, 4))
+
+    def test_padding(self):
+        self.assertTrue(self.bitboard.fits(4))
+        self.assertFalse(self.bitboard.fits(5))
+        with self.assertRaises(ValueError):
+            self.bitboard.diamond_mask(2, 2, 5)
+        self.assertEqual(self.bitboard.diamond_mask(2, 2, -1), 0)
+
+    def test_full_radius(self):
+        # a diamond past the largest distance on the map covers the map, so the padding never needs to be larger
+        bitboard = Bitboard(6, 9, 100)
+        self.assertEqual(bitboard.max_radius, 13)
+        self.assertTrue(bitboard.fits(1000))
+        self.assertEqual(bitboard.diamond_mask(5, 0, 1000), bitboard.board_mask)
+        self.assertEqual(Bitboard.count(bitboard.board_mask), 6 * 9)
+
+    def test_cells_and_cover(self):
+        locations = [Location(0, 0), Location(5, 8)]
+        self.assertEqual(self.bitboard.get_locations(self.bitboard.cells_mask(locations)), locations)
+        cover = self.bitboard.cover_mask(locations, lambda location: location.row // 5 + 1)
+        self.assertEqual(self.bitboard.get_locations(cover), sorted(set(_diamond(6, 9, 0, 0, 1) +
+                                                                       _diamond(6, 9, 5, 8, 2)),
+                                                                   key=lambda location: location.as_tuple))
+        self.assertTrue(self.bitboard.contains(cover, 4, 8))
+        self.assertFalse(self.bitboard.contains(cover, 3, 3))
+        self.assertFalse(self.bitboard.contains(cover, -1, 0))
+
+
+class GameMasksTest(unittest.TestCase):
+    def setUp(self):
+        # attack range 5 and pirate max speed 2
+        self.game = make_game()
+
+    def _attack_locations(self, pirates, radius):
+        locations = set()
+        for my_pirate in pirates:
+            location = my_pirate.location
+            locations.update(_diamond(40, 40, location.row, location.col, radius))
+        return sorted(locations, key=lambda location: location.as_tuple)
+
+    def test_attack_mask_at_the_edges(self):
+        play(self.game, turn([pirate(1, [0, 0], current_health=3), pirate(2, [39, 39], current_health=3),
+                              pirate(3, [0, 38], current_health=3), pirate(4, [20, 0], owner=1, current_health=3)]))
+        bitboard = self.game.get_bitboard()
+        myself = self.game.get_myself()
+        pirates = myself.living_pirates
+        self.assertEqual(bitboard.get_locations(self.game.get_attack_mask(myself)),
+                         self._attack_locations(pirates, 5))
+        self.assertEqual(bitboard.get_locations(self.game.get_attack_mask(myself, with_movement=True)),
+                         self._attack_locations(pirates, 7))
+        self.assertEqual(bitboard.get_locations(self.game.get_attack_mask(self.game.get_enemy(), True)),
+                         self._attack_locations(self.game.get_enemy().living_pirates, 7))
+
+    def test_padding_covers_the_reach_of_the_pirates(self):
+        play(self.game, turn([pirate(1, [0, 0], current_health=3)]))
+        bitboard = self.game.get_bitboard()
+        self.assertGreaterEqual(bitboard.max_radius, 2 + 5)
+        # a pirate that reaches further than the setup says grows the padding
+        play(self.game, turn([pirate(1, [0, 0], current_health=3, attack_range=9, max_speed=3)]))
+        grown_bitboard = self.game.get_bitboard()
+        self.assertIsNot(grown_bitboard, bitboard)
+        self.assertGreaterEqual(grown_bitboard.max_radius, 9 + 3)
+        self.assertEqual(grown_bitboard.get_locations(self.game.get_attack_mask(self.game.get_myself(), True)),
+                         _diamond(40, 40, 0, 0, 12))
+        # the same reach in the next turn keeps the bitboard
+        play(self.game, turn([pirate(1, [1, 0], current_health=3, attack_range=9, max_speed=3)]))
+        self.assertIs(self.game.get_bitboard(), grown_bitboard)
+
+
+if __name__ == '__main__':
+    unittest.main()
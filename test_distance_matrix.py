@@ -0,0 +1,67 @@
+"""
+Tests the distance and range matrices, with the plain array fallback and with NumPy when it is installed.
+"""
+import unittest
+
+import DistanceMatrix
+from DistanceMatrix import Matrix
+from LocationClass import Location
+
+SOURCES = [Location(0, 0), Location(5, 5), Location(2, 7)]
+TARGETS = [Location(1, 1), Location(5, 9)]
+DISTANCES = [[2, 14], [8, 4], [7, 5]]
+
+
+class _MatrixTests(object):
+    """
+    The tests of the matrices, run by the subclasses with and without NumPy.
+    """
+    numpy = None
+
+    def setUp(self):
+        self.original_numpy = DistanceMatrix.numpy
+        DistanceMatrix.numpy = self.numpy
+
+    def tearDown(self):
+        DistanceMatrix.numpy = self.original_numpy
+
+    def test_distances(self):
+        distances = DistanceMatrix.distance_matrix(SOURCES, TARGETS)
+        self.assertEqual(distances.shape, (3, 2))
+        self.assertEqual(distances.tolist(), DISTANCES)
+        self.assertEqual(distances[1, 0], 8)
+        self.assertEqual(list(distances[2]), [7, 5])
+
+    def test_negative_indexes(self):
+        distances = DistanceMatrix.distance_matrix(SOURCES, TARGETS)
+        self.assertEqual(list(distances[-1]), [7, 5])
+        self.assertEqual(distances[-3, -1], 14)
+        for index in [3, -4, (0, 2), (0, -3), (3, 0)]:
+            with self.assertRaises(IndexError):
+                distances[index]
+
+    def test_in_range(self):
+        self.assertEqual(DistanceMatrix.in_range_matrix(SOURCES, TARGETS, 4).tolist(),
+                         [[True, False], [False, True], [False, False]])
+        self.assertEqual(DistanceMatrix.in_range_matrix(SOURCES, TARGETS, [14, 0, 7]).tolist(),
+                         [[True, True], [False, False], [True, True]])
+
+    def test_empty(self):
+        self.assertEqual(DistanceMatrix.distance_matrix([], TARGETS).shape, (0, 2))
+        self.assertEqual(DistanceMatrix.in_range_matrix(SOURCES, [], 3).shape, (3, 0))
+
+
+class ArrayMatrixTest(_MatrixTests, unittest.TestCase):
+    numpy = None
+
+    def test_fallback_matrix(self):
+        self.assertIsInstance(DistanceMatrix.distance_matrix(SOURCES, TARGETS), Matrix)
+
+
+@unittest.skipIf(DistanceMatrix.numpy is None, 'NumPy is not installed')
+class NumpyMatrixTest(_MatrixTests, unittest.TestCase):
+    numpy = DistanceMatrix.numpy
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Tests the events found between consecutive turns.
+"""
+import unittest
+
+from test_support import drone, island, make_game, pirate, play, turn
+
+FIRST = turn([pirate(1, [5, 5], current_health=3), pirate(2, [20, 20], owner=1, current_health=3)],
+             [pirate(3, [0, 3], turns_to_revive=1)],
+             [drone(10, [30, 7]), drone(11, [12, 12]), drone(12, [1, 1], owner=1)])
+
+
+def _describe(events):
+    return sorted((event.type, event.game_object.unique_id, event.before, event.after) for event in events)
+
+
+class EventsTest(unittest.TestCase):
+    def setUp(self):
+        self.game = make_game()
+        play(self.game, FIRST)
+        # events are only found from the first call on
+        self.assertEqual(self.game.get_events(), [])
+
+    def test_events(self):
+        play(self.game, turn([pirate(1, [5, 6], current_health=2), pirate(3, [0, 3], current_health=3)],
+                             [pirate(2, [20, 20], owner=1, turns_to_revive=5)],
+                             [drone(11, [12, 12]), drone(13, [4, 4], owner=1)],
+                             [island(100, [10, 20], owner=0)], scores=(1, 0)))
+        game = self.game
+        location = game.get_my_pirate_by_id(1).location
+        self.assertEqual(_describe(game.get_events()), sorted([
+            ('moved', 1, location.replace(col=5), location),
+            ('damaged', 1, 3, 2),
+            ('revived', 3, None, location.replace(row=0, col=3)),
+            ('died', 2, location.replace(row=20, col=20), None),
+            ('spawned', 13, None, location.replace(row=4, col=4)),
+            ('island_captured', 100, game.get_neutral(), game.get_myself()),
+            # drone 10 was next to the city of its owner, who scored
+            ('drone_delivered', 10, location.replace(row=30, col=7), game.get_all_cities()[0]),
+            # drone 12 has no city to be unloaded at
+            ('died', 12, location.replace(row=1, col=1), None)]))
+        self.assertEqual(_describe(game.get_events('died', 'revived')),
+                         _describe(event for event in game.get_events() if event.type in ('died', 'revived')))
+
+    def test_drone_gone_without_score(self):
+        play(self.game, turn([pirate(1, [5, 5], current_health=3), pirate(2, [20, 20], owner=1, current_health=3)],
+                             [pirate(3, [0, 3], turns_to_revive=1)], [drone(11, [12, 12]), drone(12, [1, 1], owner=1)]))
+        self.assertEqual([(event.type, event.game_object.unique_id) for event in self.game.get_events()],
+                         [('died', 10)])
+
+    def test_unchanged_turn(self):
+        play(self.game, FIRST)
+        self.assertEqual(self.game.get_events(), [])
+
+    def test_lazy_sections(self):
+        self.game.set_lazy_sections(True)
+        play(self.game, turn([pirate(1, [5, 6], current_health=3), pirate(2, [20, 20], owner=1, current_health=3)],
+                             [pirate(3, [0, 3], turns_to_revive=1)],
+                             [drone(10, [30, 7]), drone(11, [12, 12]), drone(12, [1, 1], owner=1)]))
+        self.assertEqual([(event.type, event.game_object.unique_id) for event in self.game.get_events()],
+                         [('moved', 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests the buffered frame reader, with a small chunk size so lines and frames are split between reads.
+"""
+import os
+import threading
+import unittest
+
+import BinaryProtocol
+from FrameReader import FrameReader
+from test_support import pirate, turn
+
+TURN = {'type': 'turn', 'data': turn([pirate(unique_id, [unique_id, 5], current_health=3)
+                                      for unique_id in xrange(1, 30)])}
+
+
+class FrameReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.streams = []
+
+    def tearDown(self):
+        for stream in self.streams:
+            stream.close()
+
+    def _reader(self, data, chunk_size=16):
+        """
+        Makes a reader of a pipe that the data is written to, from another thread so the pipe never fills up.
+        """
+        read_fd, write_fd = os.pipe()
+        in_stream = os.fdopen(read_fd, 'rb')
+        self.streams.append(in_stream)
+
+        def write():
+            with os.fdopen(write_fd, 'wb') as out_stream:
+                out_stream.write(data)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        self.addCleanup(writer.join)
+        return FrameReader(in_stream, chunk_size)
+
+    def test_lines(self):
+        long_line = 'x' * 100
+        reader = self._reader('first\n{long}\n\nlast'.format(long=long_line))
+        self.assertEqual(reader.read_line(), 'first')
+        self.assertEqual(reader.read_line(), long_line)
+        self.assertEqual(reader.read_line(), '')
+        self.assertFalse(reader.at_eof)
+        # the last line has no new line
+        self.assertEqual(reader.read_line(), 'last')
+        self.assertTrue(reader.at_eof)
+        self.assertEqual(reader.read_line(), '')
+
+    def test_frames(self):
+        end = {'type': 'end', 'data': {}}
+        reader = self._reader(BinaryProtocol.format_frame(TURN) + BinaryProtocol.format_frame(end) +
+                              BinaryProtocol.format_frame(TURN))
+        turn_message = BinaryProtocol.parse_frame(BinaryProtocol.format_frame(TURN)[BinaryProtocol.FRAME_HEADER.size:])
+        self.assertEqual(BinaryProtocol.read_buffered_frame(reader), turn_message)
+        self.assertEqual(BinaryProtocol.read_buffered_frame(reader), end)
+        self.assertEqual(BinaryProtocol.read_buffered_frame(reader), turn_message)
+        # the end of the stream is only known once a read finds it
+        self.assertFalse(reader.at_eof)
+        self.assertEqual(BinaryProtocol.read_buffered_frame(reader), {})
+        self.assertTrue(reader.at_eof)
+
+    def test_incorrect_frame_is_skipped(self):
+        bad_frame = BinaryProtocol.FRAME_HEADER.pack(4) + BinaryProtocol.MESSAGE_KIND.pack(BinaryProtocol.JSON_MESSAGE)
+        bad_frame += '{"a'
+        end = {'type': 'end', 'data': {}}
+        reader = self._reader(bad_frame + BinaryProtocol.format_frame(end))
+        self.assertEqual(BinaryProtocol.read_buffered_frame(reader), {})
+        self.assertFalse(reader.at_eof)
+        self.assertEqual(BinaryProtocol.read_buffered_frame(reader), end)
+        self.assertEqual(BinaryProtocol.read_buffered_frame(reader), {})
+        self.assertTrue(reader.at_eof)
+
+    def test_truncated_frame(self):
+        frame = BinaryProtocol.format_frame(TURN)
+        for cut in [2, BinaryProtocol.FRAME_HEADER.size + 3, len(frame) // 2, len(frame) - 1]:
+            reader = self._reader(frame + frame[:cut])
+            self.assertTrue(BinaryProtocol.read_buffered_frame(reader))
+            # the partial frame is dropped, so the reader ends instead of waiting for the rest of it
+            self.assertEqual(BinaryProtocol.read_buffered_frame(reader), {})
+            self.assertTrue(reader.at_eof)
+
+    def test_lines_after_frames(self):
+        reader = self._reader(BinaryProtocol.format_frame(TURN) + 'line\n')
+        self.assertTrue(BinaryProtocol.read_buffered_frame(reader))
+        self.assertEqual(reader.read_line(), 'line')
+        self.assertEqual(reader.read_line(), '')
+        self.assertTrue(reader.at_eof)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+"""
+Tests the layout of the game objects the bots get.
+"""
+import unittest
+
+from test_support import drone, make_game, pirate, play, turn
+
+
+class BotAttributesTest(unittest.TestCase):
+    def setUp(self):
+        self.game = make_game()
+        play(self.game, turn([pirate(1, [5, 5], current_health=3)], drones=[drone(2, [7, 7])]))
+
+    def test_fields_are_not_in_the_dictionary(self):
+        my_pirate = self.game.get_my_living_pirates()[0]
+        self.assertEqual(vars(my_pirate), {})
+        self.assertEqual((my_pirate.location.row, my_pirate.current_health), (5, 3))
+
+    def test_bot_attributes_are_kept_between_turns(self):
+        my_pirate = self.game.get_my_living_pirates()[0]
+        my_pirate.target = self.game.get_all_islands()[0]
+        self.game.get_my_living_drones()[0].plan = 'deliver'
+        self.game.get_all_islands()[0].claimed = True
+        self.game.get_all_cities()[0].visits = 1
+        self.game.get_myself().strategy = 'defend'
+
+        play(self.game, turn([pirate(1, [5, 6], current_health=3)], drones=[drone(2, [8, 7])]))
+        my_pirate = self.game.get_my_pirate_by_id(1)
+        self.assertIs(my_pirate.target, self.game.get_all_islands()[0])
+        self.assertEqual(my_pirate.location.col, 6)
+        self.assertEqual(self.game.get_my_living_drones()[0].plan, 'deliver')
+        self.assertTrue(self.game.get_all_islands()[0].claimed)
+        self.assertEqual(self.game.get_all_cities()[0].visits, 1)
+        self.assertEqual(self.game.get_myself().strategy, 'defend')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests the counts of the pirates that can attack every cell next turn, with and without NumPy.
+"""
+import unittest
+
+import InfluenceMap
+from LocationClass import Location
+from test_support import make_game, pirate, play, turn
+
+ROW_COUNT = 12
+COL_COUNT = 15
+
+
+class _Pirate(object):
+    def __init__(self, row, col, attack_range=2, max_speed=1):
+        self.location = Location(row, col)
+        self.attack_range = attack_range
+        self.max_speed = max_speed
+
+
+PIRATES = [_Pirate(5, 5), _Pirate(5, 6, attack_range=1), _Pirate(0, 0), _Pirate(11, 14, max_speed=3),
+           _Pirate(3, 13, attack_range=4)]
+
+
+def _count(pirates, row, col):
+    return sum(1 for pirate in pirates
+               if abs(pirate.location.row - row) + abs(pirate.location.col - col) <=
+               pirate.attack_range + pirate.max_speed)
+
+
+class _InfluenceMapTests(object):
+    """
+    The tests of the influence map, run by the subclasses with and without NumPy.
+    """
+    numpy = None
+
+    def setUp(self):
+        self.original_numpy = InfluenceMap.numpy
+        InfluenceMap.numpy = self.numpy
+
+    def tearDown(self):
+        InfluenceMap.numpy = self.original_numpy
+
+    def test_reach_grid(self):
+        for pirates in ([], PIRATES[:1], PIRATES):
+            grid = InfluenceMap.reach_grid(ROW_COUNT, COL_COUNT, pirates)
+            for row in xrange(ROW_COUNT):
+                for col in xrange(COL_COUNT):
+                    self.assertEqual(grid[row, col], _count(pirates, row, col), (row, col))
+
+    def test_influence_map(self):
+        influence = InfluenceMap.InfluenceMap(ROW_COUNT, COL_COUNT, PIRATES[:2], PIRATES[2:])
+        self.assertEqual(influence.get_threat(Location(5, 4)), 2)
+        self.assertEqual(influence.get_threat(Location(5, 3)), 1)
+        self.assertEqual(influence.get_support(Location(5, 4)), 0)
+        self.assertEqual(influence.get_support(Location(1, 2)), 1)
+
+    def test_game(self):
+        game = make_game()
+        play(game, turn([pirate(1, [5, 5], current_health=3), pirate(2, [20, 20], owner=1, current_health=3)],
+                        [pirate(3, [20, 21], owner=1, turns_to_revive=2)]))
+        influence = game.get_influence_map()
+        # the attack range is 5 and the max speed is 2, and dead pirates don't count
+        self.assertEqual(influence.get_threat(Location(20, 27)), 1)
+        self.assertEqual(influence.get_threat(Location(20, 28)), 0)
+        self.assertEqual(influence.get_support(game.get_my_pirate_by_id(1)), 1)
+        self.assertEqual(influence.get_threat(game.get_my_pirate_by_id(1)), 0)
+
+
+class ArrayInfluenceMapTest(_InfluenceMapTests, unittest.TestCase):
+    numpy = None
+
+
+@unittest.skipIf(InfluenceMap.numpy is None, 'NumPy is not installed')
+class NumpyInfluenceMapTest(_InfluenceMapTests, unittest.TestCase):
+    numpy = InfluenceMap.numpy
+
+
+if __name__ == '__main__':
+    unittest.main()
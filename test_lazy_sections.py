@@ -0,0 +1,82 @@
+"""
+Tests the lazy sections, which build the objects of a section on the first getter that needs them in a turn.
+"""
+import unittest
+
+from test_support import city, drone, island, make_game, pirate, play, turn
+
+TURNS = [
+    turn([pirate(1, [5, 5], current_health=3), pirate(2, [20, 20], owner=1, current_health=3)],
+         [pirate(3, [0, 3], turns_to_revive=2)],
+         [drone(10, [6, 7]), drone(11, [30, 30], owner=1)],
+         [island(100, [10, 20]), island(101, [3, 4], owner=1, turns_to_drone_creation=4)],
+         [city(200, [30, 5]), city(201, [0, 39], owner=1)]),
+    turn([pirate(1, [5, 6], current_health=2), pirate(3, [0, 3], current_health=3)],
+         [pirate(2, [20, 20], owner=1, turns_to_revive=5)],
+         [drone(10, [6, 8]), drone(12, [10, 20])],
+         [island(100, [10, 20], owner=0), island(101, [3, 4], owner=1, turns_to_drone_creation=3)],
+         [city(200, [30, 5]), city(201, [0, 39], owner=1)]),
+]
+
+
+def _snapshot(game):
+    """
+    Gets what the getters of every section return, as plain values.
+    """
+    def describe(game_objects):
+        return [(game_object.unique_id, game_object.owner.id, game_object.location) for game_object in game_objects]
+
+    return (describe(game.get_all_my_pirates()), describe(game.get_enemy_living_pirates()),
+            describe(game.get_all_enemy_pirates()), describe(game.get_my_living_drones()),
+            describe(game.get_enemy_living_drones()), describe(game.get_all_islands()),
+            [island_object.turns_to_drone_creation for island_object in game.get_all_islands()],
+            describe(game.get_all_cities()), describe(game.get_aircrafts_on(game.get_my_pirate_by_id(1))))
+
+
+class LazySectionsTest(unittest.TestCase):
+    def setUp(self):
+        self.game = make_game()
+        self.game.set_lazy_sections(True)
+
+    def test_same_state_as_eager(self):
+        eager_game = make_game()
+        for data in TURNS:
+            play(self.game, data)
+            play(eager_game, data)
+            self.assertEqual(_snapshot(self.game), _snapshot(eager_game))
+
+    def test_sections_are_built_on_demand(self):
+        # the records of a section are only read by the getters that need it
+        broken = turn([pirate(1, [5, 5], current_health=3)], [{'unique_id': 3}], [{'unique_id': 10}])
+        play(self.game, broken)
+        self.assertEqual(len(self.game.get_my_living_pirates()), 1)
+        self.assertEqual(len(self.game.get_all_islands()), 1)
+        with self.assertRaises(KeyError):
+            self.game.get_my_living_drones()
+        with self.assertRaises(KeyError):
+            self.game.get_all_my_pirates()
+
+    def test_objects_are_kept_between_turns(self):
+        play(self.game, TURNS[0])
+        first_pirate = self.game.get_my_pirate_by_id(1)
+        first_island = self.game.get_all_islands()[0]
+        # a turn that never builds its sections
+        play(self.game, TURNS[0])
+        play(self.game, TURNS[1])
+        self.assertIs(self.game.get_my_pirate_by_id(1), first_pirate)
+        self.assertEqual(first_pirate.location.as_tuple, (5, 6))
+        self.assertIs(self.game.get_all_islands()[0], first_island)
+        self.assertEqual(first_island.owner, self.game.get_myself())
+        # drone 11 is gone, and drone 12 is new
+        self.assertEqual([drone_object.unique_id for drone_object in self.game.get_my_living_drones()], [10, 12])
+        self.assertIsNone(self.game.get_object_by_unique_id(11))
+
+    def test_eager_again(self):
+        play(self.game, TURNS[0])
+        self.game.set_lazy_sections(False)
+        play(self.game, TURNS[1])
+        self.assertEqual(len(self.game.get_myself().living_drones), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
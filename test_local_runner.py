@@ -0,0 +1,125 @@
+"""
+Tests driving bots in process with LocalRunner and run_local_match.
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from LocalRunner import LocalRunner, run_local_match
+from Pirates import parse_data
+from test_support import make_setup, pirate, turn
+
+MOVE_BOT = '''
+def do_turn(game):
+    for my_pirate in game.get_my_living_pirates():
+        game.set_sail(my_pirate, my_pirate.location.replace(row=my_pirate.location.row + 1))
+'''
+
+
+class _MoveBot(object):
+    def do_turn(self, game):
+        for my_pirate in game.get_my_living_pirates():
+            game.set_sail(my_pirate, my_pirate.location.replace(row=my_pirate.location.row + 1))
+
+
+class _Bot(object):
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def do_turn(self, game):
+        if self.fail:
+            raise RuntimeError('the bot failed')
+        for my_pirate in game.get_my_living_pirates():
+            game.attack(my_pirate, game.get_enemy_living_pirates()[0])
+
+
+class _Engine(object):
+    """
+    Plays pirates that move down a row every turn they are ordered to, for a given number of turns.
+    """
+    def __init__(self, turn_count):
+        self.turns_left = turn_count
+        self.rows = [5, 20]
+        self.orders = []
+
+    def get_setup(self, player_id):
+        return make_setup(player_id=player_id)
+
+    def get_turn(self, player_id):
+        return turn([pirate(1, [self.rows[0], 5], current_health=3), pirate(2, [self.rows[1], 5], owner=1,
+                                                                             current_health=3)])
+
+    def play_turn(self, orders):
+        self.orders.append(orders)
+        for player_id, player_orders in enumerate(orders):
+            for order in player_orders:
+                if order['order_type'] == 'move':
+                    self.rows[player_id] = order['order_args']['destination'][0]
+        self.turns_left -= 1
+
+    def is_over(self):
+        return self.turns_left == 0
+
+
+class LocalRunnerTest(unittest.TestCase):
+    def test_turn(self):
+        runner = LocalRunner(_Bot())
+        runner.setup(make_setup())
+        orders = runner.turn(turn([pirate(1, [5, 5], current_health=3), pirate(2, [6, 6], owner=1,
+                                                                              current_health=3)]))
+        self.assertEqual(orders, [{'type': 'order', 'order_type': 'attack', 'acting_aircraft': 1,
+                                   'order_args': {'target': 2}}])
+        self.assertIs(runner.last_reply['data']['orders'], orders)
+        self.assertFalse(runner.last_reply['crashed'])
+        self.assertEqual(runner.game.get_turn(), 1)
+
+    def test_decoded_turn(self):
+        runner = LocalRunner(_Bot())
+        runner.setup(make_setup())
+        data = parse_data(json.dumps(turn([pirate(1, [5, 5], current_health=3),
+                                           pirate(2, [6, 6], owner=1, current_health=3)])),
+                          runner.game._get_object_hook())
+        orders = runner.turn(data, decoded=True)
+        self.assertEqual(orders[0]['order_args'], {'target': 2})
+        self.assertIs(runner.game.get_my_pirate_by_id(1), data['pirates'][0])
+
+    def test_bot_errors(self):
+        runner = LocalRunner(_Bot(fail=True))
+        runner.setup(make_setup())
+        # the errors of the bot are sent as debug messages when the game recovers from them
+        self.assertEqual(runner.turn(turn([pirate(1, [5, 5], current_health=3)])), [])
+        self.assertEqual(len(runner.last_reply['data']['debug_messages']), 1)
+
+        runner = LocalRunner(_Bot(fail=True))
+        runner.setup(make_setup(recover_errors=False))
+        with self.assertRaises(RuntimeError):
+            runner.turn(turn([pirate(1, [5, 5], current_health=3)]))
+        self.assertTrue(runner.last_reply['crashed'])
+
+    def test_bot_file(self):
+        directory = tempfile.mkdtemp()
+        try:
+            bot_path = os.path.join(directory, 'local_bot.py')
+            with open(bot_path, 'w') as bot_file:
+                bot_file.write(MOVE_BOT)
+            runner = LocalRunner(bot_path.decode('utf8'), 'local_bot')
+            runner.setup(make_setup())
+            self.assertEqual(runner.turn(turn([pirate(1, [5, 5], current_health=3)])),
+                             [{'type': 'order', 'order_type': 'move', 'acting_aircraft': 1,
+                               'order_args': {'destination': (6, 5)}}])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_run_local_match(self):
+        engine = _Engine(3)
+        runners = run_local_match([_MoveBot(), _Bot()], engine)
+        self.assertEqual(len(engine.orders), 3)
+        self.assertEqual(engine.rows, [8, 20])
+        self.assertEqual([runner.game.get_myself().id for runner in runners], [0, 1])
+        self.assertEqual([player_orders[1][0]['order_type'] for player_orders in engine.orders], ['attack'] * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
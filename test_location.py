@@ -0,0 +1,73 @@
+"""
+Tests the interned, immutable locations and their hash.
+"""
+import copy
+import pickle
+import unittest
+
+from LocationClass import Location
+from test_support import make_game, pirate, play, turn
+
+
+class _Cell(Location):
+    __slots__ = ()
+
+
+class LocationTest(unittest.TestCase):
+    def setUp(self):
+        Location.set_map_size(40, 40)
+
+    def test_interned(self):
+        self.assertIs(Location(3, 4), Location(3, 4))
+        self.assertIs(Location(3, 4).replace(col=5), Location(3, 5))
+        self.assertIs(copy.deepcopy(Location(3, 4)), Location(3, 4))
+        self.assertIs(pickle.loads(pickle.dumps(Location(3, 4))), Location(3, 4))
+
+    def test_immutable(self):
+        location = Location(3, 4)
+        with self.assertRaises(AttributeError):
+            location.row = 5
+        with self.assertRaises(AttributeError):
+            del location.col
+
+    def test_subclasses_are_interned_apart(self):
+        cell = _Cell(3, 4)
+        self.assertIs(type(cell), _Cell)
+        self.assertIs(_Cell(3, 4), cell)
+        self.assertIs(type(Location(3, 4)), Location)
+        self.assertIs(copy.copy(cell), cell)
+
+    def test_hash_is_unique_on_large_maps(self):
+        Location.set_map_size(150, 230)
+        hashes = set(hash(Location(row, col)) for row in xrange(150) for col in xrange(230))
+        self.assertEqual(len(hashes), 150 * 230)
+
+    def test_locations_made_before_the_map_size(self):
+        Location.set_map_size(10, 10)
+        on_map = Location(2, 150)
+        before = Location(2, 3)
+        Location.set_map_size(5, 200)
+        # locations on the new map stay interned, and every location hashes like a new one of the same cell
+        self.assertIs(Location(2, 3), before)
+        self.assertEqual(hash(before), 2 * 200 + 3)
+        self.assertEqual(hash(Location(2, 150)), hash(on_map))
+        self.assertIn(Location(2, 150), set([on_map]))
+
+    def test_locations_off_the_map_are_dropped(self):
+        off_map = Location(-1, 50)
+        Location.set_map_size(40, 40)
+        self.assertIsNot(Location(-1, 50), off_map)
+        self.assertEqual(Location(-1, 50), off_map)
+        self.assertEqual(hash(Location(-1, 50)), hash(off_map))
+
+    def test_game_locations_are_interned(self):
+        game = make_game(rows=120, cols=130)
+        play(game, turn([pirate(1, [110, 125], current_health=3)]))
+        my_pirate = game.get_my_pirate_by_id(1)
+        self.assertIs(my_pirate.location, Location(110, 125))
+        self.assertIs(my_pirate.initial_location, Location(0, 1))
+        self.assertEqual(hash(my_pirate.location), 110 * 130 + 125)
+
+
+if __name__ == '__main__':
+    unittest.main()
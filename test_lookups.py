@@ -0,0 +1,52 @@
+"""
+Tests the lookups of game objects by id and by unique id.
+"""
+import unittest
+
+from test_support import city, drone, island, make_game, pirate, play, turn
+
+TURN = turn([pirate(1, [5, 5], current_health=3), pirate(7, [20, 20], owner=1, current_health=3)],
+            [pirate(2, [0, 2], turns_to_revive=3), pirate(8, [20, 21], owner=1, turns_to_revive=1)],
+            [drone(10, [6, 7], id=0), drone(11, [30, 30], owner=1, id=0)],
+            [island(100, [10, 20])], [city(200, [30, 5])])
+
+
+class LookupsTest(unittest.TestCase):
+    def setUp(self):
+        self.game = make_game()
+        play(self.game, TURN)
+
+    def test_pirates_by_id(self):
+        # the pirate ids are the unique ids in these records
+        self.assertEqual(self.game.get_my_pirate_by_id(1).location.as_tuple, (5, 5))
+        self.assertFalse(self.game.get_my_pirate_by_id(2).is_alive())
+        self.assertEqual(self.game.get_enemy_pirate_by_id(8).owner, self.game.get_enemy())
+        self.assertIsNone(self.game.get_my_pirate_by_id(7))
+        self.assertIsNone(self.game.get_enemy_pirate_by_id(1))
+
+    def test_drones_by_id(self):
+        # both players have a drone with id 0
+        self.assertEqual(self.game.get_my_drone_by_id(0).unique_id, 10)
+        self.assertEqual(self.game.get_enemy_drone_by_id(0).unique_id, 11)
+        self.assertIsNone(self.game.get_my_drone_by_id(1))
+
+    def test_objects_by_unique_id(self):
+        for unique_id, expected in [(1, self.game.get_my_pirate_by_id(1)), (8, self.game.get_enemy_pirate_by_id(8)),
+                                    (11, self.game.get_enemy_drone_by_id(0)), (100, self.game.get_all_islands()[0]),
+                                    (200, self.game.get_all_cities()[0])]:
+            self.assertIs(self.game.get_object_by_unique_id(unique_id), expected)
+        self.assertIsNone(self.game.get_object_by_unique_id(99))
+
+    def test_indexes_follow_the_turns(self):
+        play(self.game, turn([pirate(1, [5, 6], current_health=3), pirate(2, [0, 2], current_health=3)],
+                             [pirate(7, [20, 20], owner=1, turns_to_revive=5)], [drone(12, [1, 1], id=1)]))
+        self.assertTrue(self.game.get_my_pirate_by_id(2).is_alive())
+        self.assertFalse(self.game.get_enemy_pirate_by_id(7).is_alive())
+        self.assertIsNone(self.game.get_enemy_pirate_by_id(8))
+        self.assertIsNone(self.game.get_my_drone_by_id(0))
+        self.assertIsNone(self.game.get_object_by_unique_id(11))
+        self.assertIs(self.game.get_object_by_unique_id(12), self.game.get_my_drone_by_id(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
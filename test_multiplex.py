@@ -0,0 +1,98 @@
+"""
+Tests the multiplexed runner, which serves many games over the same pipe.
+"""
+import json
+import sys
+import tempfile
+import unittest
+from StringIO import StringIO
+
+from LocationClass import Location
+from Pirates import PirateGame
+from test_support import make_setup, pirate, turn
+
+
+class _Bot(object):
+    """
+    Moves the first pirate one col to the right, and fails in the games where it has no pirate.
+    """
+    def __init__(self):
+        self.games = []
+
+    def do_turn(self, game):
+        self.games.append(game)
+        my_pirate = game.get_my_living_pirates()[0]
+        game.set_sail(my_pirate, my_pirate.location.replace(col=my_pirate.location.col + 1))
+
+
+def _turn_message(game_id, col):
+    return {'type': 'turn', 'game_id': game_id, 'data': turn([pirate(1, [5, col], current_health=3)])}
+
+
+class MultiplexTest(unittest.TestCase):
+    def _serve(self, messages):
+        """
+        Serves the messages, one json line each.
+
+        :return: the replies by game id, in the order they were sent.
+        :rtype: dict[any, list[dict]]
+        """
+        bot = _Bot()
+        with tempfile.TemporaryFile() as in_stream:
+            in_stream.write(''.join(line if isinstance(line, str) else json.dumps(line) + '\n' for line in messages))
+            in_stream.seek(0)
+            out_stream = StringIO()
+            streams = sys.stdin, sys.stdout, sys.stderr
+            sys.stdin, sys.stdout, sys.stderr = in_stream, out_stream, StringIO()
+            try:
+                PirateGame._run_multiplexed(bot)
+            finally:
+                sys.stdin, sys.stdout, sys.stderr = streams
+        replies = {}
+        for line in out_stream.getvalue().splitlines():
+            reply = json.loads(line)
+            replies.setdefault(reply['game_id'], []).append(reply)
+        return replies, bot
+
+    def test_games_are_apart(self):
+        replies, bot = self._serve([
+            {'type': 'setup', 'game_id': 'a', 'data': make_setup()},
+            {'type': 'setup', 'game_id': 7, 'data': make_setup(player_id=1)},
+            _turn_message('a', 5),
+            'not json\n',
+            {'type': 'turn', 'data': turn()},
+            _turn_message(7, 10),
+            {'type': 'game_over', 'game_id': 'a', 'data': {}},
+            _turn_message('a', 6),
+        ])
+        # the game was over, so the last turn is the turn of a new game that was never set up
+        self.assertEqual([reply['crashed'] for reply in replies['a']], [False, False, True])
+        self.assertEqual(replies['a'][1]['data']['orders'], [{'type': 'order', 'order_type': 'move',
+                                                               'acting_aircraft': 1,
+                                                               'order_args': {'destination': [5, 6]}}])
+        # game 7 plays player 1, who has no pirates, so its bot failed and the error was sent as a debug message
+        self.assertEqual(len(replies[7]), 2)
+        self.assertEqual(replies[7][1]['data']['orders'], [])
+        self.assertEqual(len(replies[7][1]['data']['debug_messages']), 1)
+        self.assertIsNot(bot.games[0], bot.games[1])
+        self.assertIs(bot.games[0].get_my_living_pirates()[0].location, Location(5, 5))
+
+    def test_crashed_game_is_dropped(self):
+        replies, _ = self._serve([
+            {'type': 'setup', 'game_id': 'a', 'data': make_setup(recover_errors=False, player_id=1)},
+            {'type': 'setup', 'game_id': 'b', 'data': make_setup()},
+            _turn_message('a', 5),
+            _turn_message('b', 5),
+            _turn_message('b', 6),
+        ])
+        self.assertEqual(len(replies['a']), 2)
+        self.assertTrue(replies['a'][1]['crashed'])
+        self.assertEqual([reply['crashed'] for reply in replies['b']], [False, False, False])
+
+    def test_turn_before_setup(self):
+        replies, _ = self._serve([_turn_message('a', 5), {'type': 'setup', 'game_id': 'a', 'data': make_setup()}])
+        self.assertEqual([reply['crashed'] for reply in replies['a']], [True, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
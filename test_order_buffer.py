@@ -0,0 +1,84 @@
+"""
+Tests the buffer of the orders of a turn, and the orders the game sends.
+"""
+import unittest
+
+import BinaryProtocol
+from LocationClass import Location
+from OrderBuffer import OrderBuffer, expand_order
+from test_support import drone, make_game, pirate, play, turn
+
+MOVE = BinaryProtocol.MOVE_ORDER
+ATTACK = BinaryProtocol.ATTACK_ORDER
+
+
+class OrderBufferTest(unittest.TestCase):
+    def setUp(self):
+        self.orders = OrderBuffer()
+
+    def test_emission_order(self):
+        self.orders.move(3, 1, 2)
+        self.orders.attack(1, 7)
+        self.orders.move(2, 4, 4)
+        self.assertEqual(len(self.orders), 3)
+        self.assertEqual(self.orders.compact_records(), [[MOVE, 3, 1, 2], [ATTACK, 1, 7], [MOVE, 2, 4, 4]])
+        self.assertEqual(self.orders.records(), [expand_order(order) for order in self.orders.compact_records()])
+
+    def test_replacement_keeps_the_first_place(self):
+        self.orders.move(3, 1, 2)
+        self.orders.move(1, 0, 0)
+        self.orders.attack(3, 9)
+        self.assertEqual(self.orders.compact_records(), [[ATTACK, 3, 9], [MOVE, 1, 0, 0]])
+        self.assertEqual(self.orders.get(3), [ATTACK, 3, 9])
+
+    def test_discard(self):
+        self.orders.move(3, 1, 2)
+        self.orders.move(1, 0, 0)
+        self.orders.discard(3)
+        self.orders.discard(5)
+        self.assertEqual(len(self.orders), 1)
+        self.assertIsNone(self.orders.get(3))
+        # an order after the discard goes last
+        self.orders.attack(3, 9)
+        self.assertEqual(self.orders.compact_records(), [[MOVE, 1, 0, 0], [ATTACK, 3, 9]])
+
+    def test_clear(self):
+        self.orders.move(3, 1, 2)
+        self.orders.clear()
+        self.assertEqual(len(self.orders), 0)
+        self.assertEqual(self.orders.records(), [])
+
+    def test_expand_order(self):
+        self.assertEqual(expand_order([MOVE, 3, 1, 2]), {'type': 'order', 'order_type': 'move', 'acting_aircraft': 3,
+                                                         'order_args': {'destination': (1, 2)}})
+        self.assertEqual(expand_order([ATTACK, 3, 9]), {'type': 'order', 'order_type': 'attack', 'acting_aircraft': 3,
+                                                        'order_args': {'target': 9}})
+
+
+class GameOrdersTest(unittest.TestCase):
+    def setUp(self):
+        self.game = make_game()
+        play(self.game, turn([pirate(1, [5, 5], current_health=3), pirate(2, [6, 6], owner=1, current_health=3)],
+                             drones=[drone(10, [9, 9])]))
+        self.pirate = self.game.get_my_pirate_by_id(1)
+
+    def test_last_order_wins(self):
+        enemy = self.game.get_enemy_pirate_by_id(2)
+        self.game.set_sail(self.pirate, Location(5, 7))
+        self.game.attack(self.pirate, enemy)
+        self.game.set_sail(self.game.get_my_drone_by_id(10), Location(9, 10))
+        self.assertEqual(self.game._orders.compact_records(), [[ATTACK, 1, 2], [MOVE, 10, 9, 10]])
+
+    def test_sailing_to_the_current_location_drops_the_order(self):
+        self.game.set_sail(self.pirate, Location(5, 7))
+        self.game.set_sail(self.pirate, self.pirate)
+        self.assertEqual(len(self.game._orders), 0)
+
+    def test_orders_are_cleared_every_turn(self):
+        self.game.set_sail(self.pirate, Location(5, 7))
+        play(self.game, turn([pirate(1, [5, 7], current_health=3)]))
+        self.assertEqual(len(self.game._orders), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Tests that the players' lists follow the pirates and drones between turns, and stay sorted by id.
+"""
+import unittest
+
+from test_support import drone, make_game, pirate, play, turn
+
+TURNS = [
+    turn([pirate(2, [5, 5], current_health=3), pirate(1, [6, 6], current_health=3),
+          pirate(3, [20, 20], owner=1, current_health=3)],
+         [pirate(4, [0, 4], turns_to_revive=2)],
+         [drone(11, [7, 7]), drone(10, [8, 8]), drone(12, [30, 30], owner=1)]),
+    # pirate 1 dies, pirate 4 revives, drone 10 is gone and drone 13 is new
+    turn([pirate(2, [5, 6], current_health=3), pirate(4, [0, 4], current_health=3),
+          pirate(3, [20, 21], owner=1, current_health=3)],
+         [pirate(1, [6, 6], turns_to_revive=5)],
+         [drone(11, [7, 8]), drone(13, [10, 10]), drone(12, [30, 31], owner=1)]),
+    # drone 11 changes owner, drone 10 comes back
+    turn([pirate(2, [5, 7], current_health=3), pirate(4, [0, 5], current_health=3),
+          pirate(3, [20, 22], owner=1, current_health=3)],
+         [pirate(1, [6, 6], turns_to_revive=4)],
+         [drone(10, [1, 1]), drone(11, [7, 9], owner=1), drone(13, [10, 11]), drone(12, [30, 32], owner=1)]),
+]
+
+
+def _expected_lists(data, owner):
+    """
+    Gets the unique ids of the lists of a player from the data of a turn, sorted by id.
+    """
+    def ids(records):
+        return [record['unique_id'] for record in sorted(records, key=lambda record: record['id'])
+                if record['owner'] == owner]
+    return ids(data['pirates'] + data['dead_pirates']), ids(data['pirates']), ids(data['drones'])
+
+
+def _lists(player):
+    return ([aircraft.unique_id for aircraft in player.all_pirates],
+            [aircraft.unique_id for aircraft in player.living_pirates],
+            [aircraft.unique_id for aircraft in player.living_drones])
+
+
+class PlayerListsTest(unittest.TestCase):
+    def _check_turns(self, game):
+        for data in TURNS:
+            play(game, data)
+            # with lazy sections the lists are updated by the getters that build the sections
+            game.get_all_my_pirates()
+            game.get_my_living_drones()
+            self.assertEqual(_lists(game.get_myself()), _expected_lists(data, 0))
+            self.assertEqual(_lists(game.get_enemy()), _expected_lists(data, 1))
+
+    def test_lists_follow_the_turns(self):
+        self._check_turns(make_game())
+
+    def test_lazy_sections(self):
+        game = make_game()
+        game.set_lazy_sections(True)
+        self._check_turns(game)
+
+    def test_unchanged_lists_are_kept(self):
+        game = make_game()
+        play(game, TURNS[0])
+        myself = game.get_myself()
+        living_pirates = myself.living_pirates
+        first_pirate = myself.living_pirates[0]
+        play(game, turn([pirate(2, [5, 6], current_health=3), pirate(1, [6, 7], current_health=2)],
+                        [pirate(4, [0, 4], turns_to_revive=1)], [drone(11, [7, 8]), drone(10, [8, 9])]))
+        self.assertIs(myself.living_pirates, living_pirates)
+        self.assertIs(myself.living_pirates[0], first_pirate)
+        self.assertEqual(_lists(myself), ([1, 2, 4], [1, 2], [10, 11]))
+        self.assertEqual(_lists(game.get_enemy()), ([], [], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests the runner's echo mode and the protocol benchmark built on it.
+"""
+import base64
+import json
+import subprocess
+import sys
+import threading
+import unittest
+
+import BinaryProtocol
+import ProtocolBenchmark
+
+# the longest an echo is allowed to run, a runner that doesn't stop at the end of its input is killed
+ECHO_TIMEOUT = 30
+
+
+def _echo(codec, data):
+    """
+    Runs the runner's echo mode on the data.
+
+    :return: the output, and whether the runner stopped on its own.
+    :rtype: (str, bool)
+    """
+    runner = subprocess.Popen([sys.executable, ProtocolBenchmark.RUNNER_PATH, base64.b64encode(b''),
+                               ProtocolBenchmark.ECHO_OPTION, codec], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    timer = threading.Timer(ECHO_TIMEOUT, runner.kill)
+    timer.start()
+    try:
+        output, _ = runner.communicate(data)
+    finally:
+        timer.cancel()
+    return output, runner.returncode == 0
+
+
+class EchoTest(unittest.TestCase):
+    def setUp(self):
+        self.message = ProtocolBenchmark.make_turn(5)
+
+    def test_json(self):
+        line = ProtocolBenchmark.encode('json', self.message)
+        output, stopped = _echo('json', line + 'not json\n' + line + line[:20])
+        self.assertTrue(stopped)
+        self.assertEqual([json.loads(echoed) for echoed in output.splitlines()], [self.message] * 2)
+
+    def test_binary(self):
+        frame = ProtocolBenchmark.encode('binary', self.message)
+        # the last frame is cut short by the end of the input
+        output, stopped = _echo('binary', frame + frame + frame[:len(frame) // 2])
+        self.assertTrue(stopped)
+        self.assertEqual(output, frame + frame)
+
+    def test_empty_input(self):
+        for codec in ProtocolBenchmark.CODECS:
+            self.assertEqual(_echo(codec, ''), ('', True))
+
+
+class BenchmarkTest(unittest.TestCase):
+    def test_make_turn(self):
+        message = ProtocolBenchmark.make_turn(20, seed=3)
+        self.assertEqual(message, ProtocolBenchmark.make_turn(20, seed=3))
+        data = message['data']
+        self.assertEqual(len(data['pirates']) + len(data['dead_pirates']), 40)
+        self.assertEqual(len(data['drones']), 40)
+        unique_ids = [record['unique_id'] for section in ('pirates', 'dead_pirates', 'drones', 'islands', 'cities')
+                      for record in data[section]]
+        self.assertEqual(len(unique_ids), len(set(unique_ids)))
+        # every record fits the binary layouts
+        self.assertEqual(BinaryProtocol.parse_frame(
+            ProtocolBenchmark.encode('binary', message)[BinaryProtocol.FRAME_HEADER.size:]),
+            json.loads(json.dumps(message)))
+
+    def test_percentile(self):
+        values = range(1, 101)
+        self.assertEqual(ProtocolBenchmark.percentile(values, 0.5), 51)
+        self.assertEqual(ProtocolBenchmark.percentile(values, 0.99), 99)
+        self.assertEqual(ProtocolBenchmark.percentile([7], 0.99), 7)
+
+    def test_run_codec(self):
+        for codec in ProtocolBenchmark.CODECS:
+            frame = ProtocolBenchmark.encode(codec, ProtocolBenchmark.make_turn(5))
+            results = ProtocolBenchmark.run_codec(codec, frame, 5)
+            self.assertGreater(results['frames_per_second'], 0)
+            self.assertLessEqual(results['p50_ms'], results['p99_ms'])
+            self.assertGreater(results['bytes_per_second'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
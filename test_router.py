@@ -0,0 +1,91 @@
+"""
+Tests the cheapest routes over the danger of the cells.
+"""
+from array import array
+import unittest
+
+from DistanceMatrix import Matrix
+from LocationClass import Location
+from Router import Router
+from test_support import make_game, pirate, play, turn
+
+ROW_COUNT = 5
+COL_COUNT = 9
+
+
+class _Aircraft(object):
+    def __init__(self, row, col, max_speed):
+        self.location = Location(row, col)
+        self.max_speed = max_speed
+
+    def get_location(self):
+        return self.location
+
+
+def _danger(cells, value=10):
+    values = array('i', [0]) * (ROW_COUNT * COL_COUNT)
+    for row, col in cells:
+        values[row * COL_COUNT + col] = value
+    return Matrix(ROW_COUNT, COL_COUNT, values)
+
+
+class RouterTest(unittest.TestCase):
+    def test_without_danger(self):
+        router = Router(ROW_COUNT, COL_COUNT, _danger([]))
+        destination = Location(2, 6)
+        for max_speed in (1, 2, 3):
+            for row in xrange(ROW_COUNT):
+                for col in xrange(COL_COUNT):
+                    aircraft = _Aircraft(row, col, max_speed)
+                    distance = aircraft.location.distance(destination)
+                    # every turn costs 1
+                    self.assertEqual(router.get_cost(aircraft, destination), -(-distance // max_speed))
+                    next_location = router.get_next_location(aircraft, destination)
+                    self.assertEqual(next_location.distance(destination), max(0, distance - max_speed))
+                    self.assertLessEqual(next_location.distance(aircraft.location), max_speed)
+
+    def test_danger_is_avoided(self):
+        # a wall of danger with a gap on the bottom row
+        wall = [(row, 4) for row in xrange(ROW_COUNT - 1)]
+        router = Router(ROW_COUNT, COL_COUNT, _danger(wall))
+        destination = Location(2, 8)
+        aircraft = _Aircraft(2, 0, 1)
+        self.assertEqual(router.get_cost(aircraft, destination), 12)
+        route = []
+        while aircraft.location != destination and len(route) < 20:
+            aircraft.location = router.get_next_location(aircraft, destination)
+            route.append(aircraft.location)
+        self.assertEqual(len(route), 12)
+        self.assertFalse(set(route) & set(Location(row, col) for row, col in wall))
+
+        # going through the wall is cheaper once the penalty is low enough
+        router = Router(ROW_COUNT, COL_COUNT, _danger(wall), danger_penalty=0.1)
+        self.assertEqual(router.get_cost(_Aircraft(2, 0, 1), destination), 9)
+        self.assertEqual(router.get_next_location(_Aircraft(2, 0, 1), destination), Location(2, 1))
+
+    def test_shared_fields(self):
+        router = Router(ROW_COUNT, COL_COUNT, _danger([]))
+        destination = Location(0, 0)
+        self.assertIs(router.get_field(destination, 2), router.get_field(Location(0, 0), 2))
+        self.assertIsNot(router.get_field(destination, 2), router.get_field(destination, 1))
+        self.assertEqual(router.get_next_location(_Aircraft(0, 0, 2), destination), destination)
+        self.assertEqual(router.get_next_location(_Aircraft(3, 3, 0), destination), Location(3, 3))
+
+
+class GameRouterTest(unittest.TestCase):
+    def test_best_sail_option(self):
+        game = make_game()
+        play(game, turn([pirate(1, [5, 5], current_health=3), pirate(2, [5, 20], owner=1, current_health=3)]))
+        my_pirate = game.get_my_pirate_by_id(1)
+        destination = Location(5, 35)
+        self.assertIs(game.get_router(), game.get_router())
+        self.assertIsNot(game.get_router(0), game.get_router())
+        # the enemy pirate threatens every cell within 7 of it, which the straight route crosses
+        self.assertEqual(game.get_router(0).get_cost(my_pirate, destination), 15)
+        self.assertGreater(game.get_router().get_cost(my_pirate, destination), 15)
+        self.assertEqual(game.get_best_sail_option(my_pirate, destination, 0), Location(5, 7))
+        self.assertEqual(game.get_best_sail_option(my_pirate, my_pirate), my_pirate.location)
+
+
+if __name__ == '__main__':
+    unittest.main()
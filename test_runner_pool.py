@@ -0,0 +1,93 @@
+"""
+Tests the pool of warm runner workers, with a real pool process and bot file.
+"""
+import json
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+import RunnerPool
+from test_support import make_setup, pirate, turn
+
+BOT = '''
+moves = []
+
+
+def do_turn(game):
+    # the module globals of every match start fresh
+    moves.append(game.get_turn())
+    my_pirate = game.get_my_living_pirates()[0]
+    game.set_sail(my_pirate, my_pirate.location.replace(col=my_pirate.location.col + len(moves)))
+'''
+# the longest the pool may take to start listening
+START_TIMEOUT = 10
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), 'the pool needs fork')
+class RunnerPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.socket_path = os.path.join(self.directory, 'pool.socket')
+        self.bot_path = os.path.join(self.directory, 'pool_bot.py')
+        with open(self.bot_path, 'w') as bot_file:
+            bot_file.write(BOT)
+        pool_path = os.path.splitext(RunnerPool.__file__)[0] + '.py'
+        with open(os.devnull, 'w') as devnull:
+            self.pool = subprocess.Popen([sys.executable, pool_path, self.socket_path, '--workers', '2'],
+                                         stderr=devnull)
+        deadline = time.time() + START_TIMEOUT
+        while not os.path.exists(self.socket_path):
+            self.assertLess(time.time(), deadline, 'the pool did not start')
+            time.sleep(0.01)
+
+    def tearDown(self):
+        self.pool.send_signal(signal.SIGTERM)
+        self.pool.wait()
+        shutil.rmtree(self.directory)
+
+    def _play(self, turns):
+        """
+        Plays a match on the pool.
+
+        :return: the orders of every turn.
+        :rtype: list[list[dict]]
+        """
+        connection = RunnerPool.connect(self.socket_path, self.bot_path.decode('utf8'))
+        replies = connection.makefile('r')
+        try:
+            connection.sendall(json.dumps({'type': 'setup', 'data': make_setup()}) + '\n')
+            self.assertFalse(json.loads(replies.readline())['crashed'])
+            orders = []
+            for data in turns:
+                connection.sendall(json.dumps({'type': 'turn', 'data': data}) + '\n')
+                orders.append(json.loads(replies.readline())['data']['orders'])
+        finally:
+            replies.close()
+            connection.close()
+        return orders
+
+    def test_matches(self):
+        turns = [turn([pirate(1, [5, 5], current_health=3)]), turn([pirate(1, [5, 6], current_health=3)])]
+        expected = [[{'type': 'order', 'order_type': 'move', 'acting_aircraft': 1,
+                      'order_args': {'destination': [5, 6]}}],
+                    [{'type': 'order', 'order_type': 'move', 'acting_aircraft': 1,
+                      'order_args': {'destination': [5, 8]}}]]
+        # more matches than workers, so the pool has to replace the workers that finished
+        for _ in xrange(3):
+            self.assertEqual(self._play(turns), expected)
+
+    def test_connection_closed_before_the_bot_path(self):
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(self.socket_path)
+        connection.close()
+        self.assertEqual(len(self._play([turn([pirate(1, [5, 5], current_health=3)])])), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Tests the single pass decode, which builds the game objects while the json of a turn is parsed.
+"""
+import json
+import unittest
+
+from Pirates import parse_data
+from test_support import drone, make_game, pirate, play, turn
+
+TURN = turn([pirate(1, [5, 5], current_health=3), pirate(2, [20, 20], owner=1, current_health=2)],
+            [pirate(3, [8, 8], turns_to_revive=4)], [drone(10, [6, 7], owner=1)])
+
+
+def _state(game):
+    """
+    Gets the fields of all the aircrafts, by unique id.
+    """
+    aircrafts = (game.get_all_my_pirates() + game.get_all_enemy_pirates() + game.get_my_living_drones() +
+                 game.get_enemy_living_drones())
+    return dict((aircraft.unique_id, (aircraft.location, aircraft.owner.id, aircraft.max_speed,
+                                      aircraft.current_health, getattr(aircraft, 'turns_to_revive', None)))
+                for aircraft in aircrafts)
+
+
+class SinglePassDecodeTest(unittest.TestCase):
+    def setUp(self):
+        self.game = make_game()
+
+    def _decode(self, message):
+        return parse_data(json.dumps(message), self.game._get_object_hook())
+
+    def test_same_state_as_two_passes(self):
+        two_pass_game = make_game()
+        play(two_pass_game, TURN)
+        self.game._update(self._decode(TURN), decoded=True)
+        self.assertEqual(_state(self.game), _state(two_pass_game))
+        self.assertIs(self.game.get_my_pirate_by_id(1), self._decode(TURN)['pirates'][0])
+
+    def test_invalid_json_is_no_message(self):
+        self.assertEqual(parse_data('{"type": ', self.game._get_object_hook()), {})
+        self.assertEqual(parse_data(''), {})
+
+    def test_malformed_turn_raises(self):
+        self.game._update(self._decode(TURN), decoded=True)
+        state = _state(self.game)
+        bad_location = turn([pirate(1, [6], owner=1, current_health=1)])
+        with self.assertRaises(ValueError):
+            self._decode(bad_location)
+        with self.assertRaises(TypeError):
+            self._decode({'type': 'turn', 'data': turn(drones=[drone(10, 7, owner=0, value=2)])})
+        missing_field = turn(dead_pirates=[pirate(3, [9, 9])])
+        del missing_field['dead_pirates'][0]['max_speed']
+        with self.assertRaises(KeyError):
+            self._decode(missing_field)
+        # the records that failed left their objects as they were
+        self.assertEqual(_state(self.game), state)
+
+
+if __name__ == '__main__':
+    unittest.main()
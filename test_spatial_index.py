@@ -0,0 +1,97 @@
+"""
+Tests the grid of the objects on the map against scanning every object.
+"""
+import random
+import unittest
+
+from LocationClass import Location
+from SpatialIndex import SpatialIndex
+from test_support import drone, island, make_game, pirate, play, turn
+
+
+class _Object(object):
+    def __init__(self, number, row, col):
+        self.number = number
+        self.location = Location(row, col)
+
+    def __repr__(self):
+        return '<_Object {number} at {location}>'.format(number=self.number, location=self.location)
+
+
+def _distance(game_object, location):
+    return abs(game_object.location.row - location.row) + abs(game_object.location.col - location.col)
+
+
+class SpatialIndexTest(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(7)
+        self.objects = [_Object(number, generator.randrange(40), generator.randrange(40)) for number in xrange(60)]
+        # a few objects on the same location
+        self.objects.extend(_Object(number, 12, 12) for number in xrange(60, 63))
+        self.points = [Location(generator.randrange(-5, 45), generator.randrange(-5, 45)) for _ in xrange(40)]
+        self.points.append(Location(12, 12))
+
+    def test_objects_on(self):
+        index = SpatialIndex(self.objects, 5)
+        self.assertEqual([game_object.number for game_object in index.get_objects_on(Location(12, 12))][-3:],
+                         [60, 61, 62])
+        self.assertEqual(index.get_objects_on(Location(-1, -1)), [])
+
+    def test_objects_in_range(self):
+        even = lambda game_object: game_object.number % 2 == 0
+        for cell_size in (1, 5, 8, 100):
+            index = SpatialIndex(self.objects, cell_size)
+            for location in self.points:
+                for manhattan_range, object_filter in [(0, None), (3, None), (10, even), (90, None)]:
+                    expected = [game_object for game_object in self.objects
+                                if _distance(game_object, location) <= manhattan_range and
+                                (object_filter is None or object_filter(game_object))]
+                    found = index.get_objects_in_range(location, manhattan_range, object_filter)
+                    self.assertEqual(sorted(found), sorted(expected))
+                    distances = [_distance(game_object, location) for game_object in found]
+                    self.assertEqual(distances, sorted(distances))
+
+    def test_nearest(self):
+        odd = lambda game_object: game_object.number % 2 == 1
+        for cell_size in (1, 5, 8, 100):
+            index = SpatialIndex(self.objects, cell_size)
+            for location in self.points:
+                for count, object_filter in [(1, None), (4, odd), (100, None)]:
+                    candidates = [game_object for game_object in self.objects
+                                  if object_filter is None or object_filter(game_object)]
+                    expected = sorted(_distance(game_object, location) for game_object in candidates)[:count]
+                    found = index.get_nearest(location, count, object_filter)
+                    # objects at the same distance may come in any order
+                    self.assertEqual([_distance(game_object, location) for game_object in found], expected)
+                    self.assertEqual(len(set(found)), len(found))
+
+    def test_empty(self):
+        index = SpatialIndex([])
+        self.assertEqual(index.get_nearest(Location(3, 3), 2), [])
+        self.assertEqual(index.get_objects_in_range(Location(3, 3), 10), [])
+        self.assertEqual(SpatialIndex(self.objects).get_nearest(Location(3, 3), 0), [])
+
+
+class GameQueriesTest(unittest.TestCase):
+    def test_queries(self):
+        game = make_game()
+        play(game, turn([pirate(1, [5, 5], current_health=3), pirate(2, [5, 5], owner=1, current_health=3),
+                         pirate(4, [8, 7], owner=1, current_health=3)],
+                        [pirate(3, [5, 6], turns_to_revive=2)], [drone(10, [5, 5]), drone(11, [5, 7], owner=1)],
+                        [island(100, [5, 5])]))
+        my_pirate = game.get_my_pirate_by_id(1)
+        # mine first, and no islands
+        self.assertEqual([aircraft.unique_id for aircraft in game.get_aircrafts_on(my_pirate)], [1, 10, 2])
+        # dead pirates are not on the map
+        self.assertEqual([game_object.unique_id for game_object in game.get_objects_in_range(my_pirate, 2)],
+                         [1, 10, 2, 100, 11])
+        self.assertEqual([game_object.unique_id for game_object in game.get_objects_in_range(
+            my_pirate, game.get_attack_range(), lambda game_object: game_object.owner == game.get_enemy())],
+            [2, 11, 4])
+        self.assertEqual([game_object.unique_id for game_object in game.get_nearest(
+            game.get_all_cities()[0], 2, lambda game_object: game_object.owner == game.get_enemy())], [4, 2])
+        self.assertEqual(game.get_nearest(my_pirate, 0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Tests that the islands and cities are built once and only their changing fields are updated every turn.
+"""
+import unittest
+
+from test_support import city, island, make_game, play, turn
+
+ISLANDS = [island(100, [10, 20]), island(101, [3, 4], owner=1, turns_to_drone_creation=4)]
+CITIES = [city(200, [30, 5]), city(201, [0, 39], owner=1)]
+
+
+class StaticMapTest(unittest.TestCase):
+    def setUp(self):
+        self.game = make_game()
+        play(self.game, turn(islands=ISLANDS, cities=CITIES))
+        self.islands = self.game.get_all_islands()
+        self.cities = self.game.get_all_cities()
+
+    def test_objects_are_patched_in_place(self):
+        play(self.game, turn(islands=[island(100, [10, 20], owner=0, turns_to_drone_creation=9),
+                                      island(101, [3, 4], owner=-1, turns_to_drone_creation=3)],
+                             cities=[city(200, [30, 5], owner=1), city(201, [0, 39], owner=1)]))
+        islands = self.game.get_all_islands()
+        cities = self.game.get_all_cities()
+        for game_object, first_object in zip(islands + cities, self.islands + self.cities):
+            self.assertIs(game_object, first_object)
+        self.assertEqual([(island_object.owner, island_object.turns_to_drone_creation) for island_object in islands],
+                         [(self.game.get_myself(), 9), (self.game.get_neutral(), 3)])
+        self.assertEqual([city_object.owner for city_object in cities], [self.game.get_enemy()] * 2)
+        self.assertEqual(self.game.get_my_islands(), [islands[0]])
+        self.assertEqual(self.game.get_neutral_islands(), [islands[1]])
+        self.assertEqual(self.game.get_my_cities(), [])
+        self.assertIs(islands[1].location, self.islands[1].location)
+
+    def test_fixed_fields_are_kept(self):
+        play(self.game, turn(islands=[island(100, [10, 20], control_range=7), ISLANDS[1]],
+                             cities=[city(200, [30, 5], unload_range=4, value_multiplier=3), CITIES[1]]))
+        self.assertEqual(self.game.get_all_islands()[0].control_range, 2)
+        self.assertEqual((self.game.get_all_cities()[0].unload_range, self.game.get_all_cities()[0].value_multiplier),
+                         (1, 1))
+
+    def test_changed_map_is_rebuilt(self):
+        # records that don't match the objects in their place are synced by unique id, and new objects are built
+        play(self.game, turn(islands=[ISLANDS[1], island(102, [7, 7]), ISLANDS[0]], cities=CITIES[:1]))
+        islands = self.game.get_all_islands()
+        self.assertEqual([island_object.unique_id for island_object in islands], [101, 102, 100])
+        self.assertIs(islands[0], self.islands[1])
+        self.assertIs(islands[2], self.islands[0])
+        self.assertEqual(self.game.get_all_cities(), self.cities[:1])
+        self.assertIsNone(self.game.get_object_by_unique_id(201))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+This module builds the games and the engine messages the tests feed to the runner.
+"""
+import copy
+from StringIO import StringIO
+
+from Pirates import PirateGame
+
+SETUP = {'cols': 40, 'rows': 40, 'spawn_turns': 5, 'turn_time': 100, 'attack_range': 5, 'max_turns': 200,
+         'max_points': 100, 'max_drones': 10, 'turn': 0, 'num_players': 2, 'bot_names': ['a', 'b'],
+         'recover_errors': True, 'drone_max_speed': 1, 'pirate_max_speed': 2, 'island_control_range': 2,
+         'drone_creation_turns': 10, 'city_unload_range': 1, 'player_id': 0, 'pirate_max_health': 3,
+         'drone_max_health': 1}
+
+
+def make_setup(**changes):
+    """
+    Makes the data of a setup message.
+
+    :param changes: the setup keys to change, e.g. protocol={'turn_delta': True}.
+    :rtype: dict
+    """
+    setup = copy.deepcopy(SETUP)
+    setup.update(changes)
+    return setup
+
+
+def make_game(**changes):
+    """
+    Makes a game that went through its setup, which writes its replies to a string.
+
+    :param changes: the setup keys to change.
+    :rtype: PirateGame
+    """
+    game = PirateGame(StringIO())
+    game._setup(make_setup(**changes))
+    return game
+
+
+def pirate(unique_id, location, owner=0, **fields):
+    """
+    Makes the record of a pirate, with the fields of its section: current_health for a living pirate, turns_to_revive
+    for a dead one.
+    """
+    record = {'id': unique_id, 'unique_id': unique_id, 'location': location, 'owner': owner,
+              'initial_location': [0, unique_id], 'attack_range': 5, 'max_speed': 2}
+    record.update(fields)
+    return record
+
+
+def drone(unique_id, location, owner=0, **fields):
+    """
+    Makes the record of a drone.
+    """
+    record = {'id': unique_id, 'unique_id': unique_id, 'location': location, 'owner': owner,
+              'initial_location': location, 'max_speed': 1, 'current_health': 1, 'value': 1}
+    record.update(fields)
+    return record
+
+
+def island(unique_id, location, owner=-1, **fields):
+    """
+    Makes the record of an island.
+    """
+    record = {'id': unique_id, 'unique_id': unique_id, 'location': location, 'owner': owner, 'control_range': 2,
+              'turns_to_drone_creation': 0}
+    record.update(fields)
+    return record
+
+
+def city(unique_id, location, owner=0, **fields):
+    """
+    Makes the record of a city.
+    """
+    record = {'id': unique_id, 'unique_id': unique_id, 'location': location, 'owner': owner, 'unload_range': 1,
+              'value_multiplier': 1}
+    record.update(fields)
+    return record
+
+
+def turn(pirates=(), dead_pirates=(), drones=(), islands=None, cities=None, scores=(0, 0)):
+    """
+    Makes the data of a full turn. By default the map has a neutral island at (10, 20) and a city of player 0 at
+    (30, 5).
+    """
+    return {'players': [{'id': player_id, 'score': score} for player_id, score in enumerate(scores)],
+            'pirates': list(pirates), 'dead_pirates': list(dead_pirates), 'drones': list(drones),
+            'islands': [island(100, [10, 20])] if islands is None else list(islands),
+            'cities': [city(200, [30, 5])] if cities is None else list(cities)}
+
+
+def play(game, *turns):
+    """
+    Updates a game with full turns, as the runner does when it receives them.
+    """
+    for data in turns:
+        game._update(copy.deepcopy(data))
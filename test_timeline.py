@@ -0,0 +1,97 @@
+"""
+Tests the timeline of the future drone creations and pirate revives.
+"""
+import unittest
+
+from Timeline import Timeline
+from test_support import island, make_game, pirate, play, turn
+
+
+class _Owner(object):
+    def __init__(self, owner_id):
+        self.id = owner_id
+
+
+class _Island(object):
+    def __init__(self, unique_id, turns_to_drone_creation, owner_id=0):
+        self.unique_id = unique_id
+        self.turns_to_drone_creation = turns_to_drone_creation
+        self.owner = _Owner(owner_id)
+
+
+class _DeadPirate(object):
+    def __init__(self, unique_id, turns_to_revive):
+        self.unique_id = unique_id
+        self.turns_to_revive = turns_to_revive
+
+
+class TimelineTest(unittest.TestCase):
+    def test_events(self):
+        timeline = Timeline()
+        islands = [_Island(100, 4), _Island(101, 1), _Island(102, 2, owner_id=-1)]
+        dead_pirates = [_DeadPirate(1, 2)]
+        timeline.update(10, islands, dead_pirates)
+        self.assertEqual(timeline.get_events_until(12), [(11, 'drone_creation', islands[1]),
+                                                         (12, 'pirate_revive', dead_pirates[0])])
+        self.assertEqual(timeline.get_events_until(20)[-1], (14, 'drone_creation', islands[0]))
+        self.assertEqual(timeline.get_events_until(9), [])
+        # neutral islands create no drones
+        self.assertIsNone(timeline.get_next_turn(islands[2]))
+
+    def test_changed_timers(self):
+        timeline = Timeline()
+        islands = [_Island(100, 4), _Island(101, 1)]
+        timeline.update(10, islands, [])
+        # island 100 counts down as expected while island 101 created its drone and starts over, and on the turn after
+        # island 100 is delayed
+        islands[0].turns_to_drone_creation = 3
+        islands[1].turns_to_drone_creation = 5
+        timeline.update(11, islands, [])
+        self.assertEqual([(event_turn, game_object.unique_id) for event_turn, _, game_object in
+                          timeline.get_events_until(20)], [(14, 100), (16, 101)])
+        islands[0].turns_to_drone_creation = 6
+        islands[1].turns_to_drone_creation = 4
+        timeline.update(12, islands, [])
+        self.assertEqual([(event_turn, game_object.unique_id) for event_turn, _, game_object in
+                          timeline.get_events_until(20)], [(16, 101), (18, 100)])
+        self.assertEqual(timeline.get_next_turn(islands[0]), 18)
+
+    def test_timer_changed_back(self):
+        timeline = Timeline()
+        islands = [_Island(100, 4)]
+        for turn_number, timer in [(10, 4), (11, 5), (12, 2)]:
+            islands[0].turns_to_drone_creation = timer
+            timeline.update(turn_number, islands, [])
+        # the entry of turn 14 is queued twice, but is a single event
+        self.assertEqual(timeline.get_events_until(20), [(14, 'drone_creation', islands[0])])
+
+    def test_many_updates(self):
+        timeline = Timeline()
+        islands = [_Island(100, 0)]
+        for turn_number in xrange(1, 200):
+            islands[0].turns_to_drone_creation = turn_number % 7
+            timeline.update(turn_number, islands, [])
+        self.assertEqual(timeline.get_events_until(300), [(199 + 199 % 7, 'drone_creation', islands[0])])
+
+
+class GameTimelineTest(unittest.TestCase):
+    def test_upcoming_events(self):
+        game = make_game()
+        play(game, turn(dead_pirates=[pirate(1, [0, 1], turns_to_revive=3)],
+                        islands=[island(100, [10, 20], owner=0, turns_to_drone_creation=5), island(101, [3, 3])]))
+        dead_pirate = game.get_my_pirate_by_id(1)
+        my_island = game.get_my_islands()[0]
+        self.assertEqual(game.get_upcoming_events(3), [(4, 'pirate_revive', dead_pirate)])
+        self.assertEqual(game.get_upcoming_events(10), [(4, 'pirate_revive', dead_pirate),
+                                                        (6, 'drone_creation', my_island)])
+        self.assertEqual(game.get_next_event_turn(my_island), 6)
+        self.assertIsNone(game.get_next_event_turn(game.get_neutral_islands()[0]))
+
+        play(game, turn([pirate(1, [0, 1], current_health=3)],
+                        islands=[island(100, [10, 20], owner=0, turns_to_drone_creation=4), island(101, [3, 3])]))
+        self.assertIsNone(game.get_next_event_turn(dead_pirate))
+        self.assertEqual(game.get_upcoming_events(10), [(6, 'drone_creation', my_island)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Tests the recent turns kept for every living aircraft.
+"""
+import unittest
+
+from LocationClass import Location
+from TrajectoryHistory import TrajectoryHistory
+from test_support import drone, make_game, pirate, play, turn
+
+
+class _Aircraft(object):
+    def __init__(self, unique_id, row, col, health=3):
+        self.unique_id = unique_id
+        self.location = Location(row, col)
+        self.current_health = health
+
+
+class TrajectoryHistoryTest(unittest.TestCase):
+    def test_ring_buffer(self):
+        history = TrajectoryHistory(size=3)
+        for turn_number in xrange(1, 6):
+            history.record(turn_number, [_Aircraft(1, turn_number, 2 * turn_number, health=10 - turn_number)])
+        # only the last 3 turns are kept
+        self.assertEqual(history.get_history(1), [(3, Location(3, 6), 7), (4, Location(4, 8), 6),
+                                                  (5, Location(5, 10), 5)])
+        self.assertEqual(history.get_history(1, 2), [(4, Location(4, 8), 6), (5, Location(5, 10), 5)])
+        self.assertEqual(history.get_history(1, 0), [])
+        self.assertEqual(history.get_velocity(1), (1.0, 2.0))
+
+    def test_aircrafts_that_are_gone(self):
+        history = TrajectoryHistory()
+        history.record(1, [_Aircraft(1, 0, 0), _Aircraft(2, 5, 5)])
+        history.record(2, [_Aircraft(1, 0, 1)])
+        history.record(3, [_Aircraft(1, 0, 2), _Aircraft(2, 9, 9)])
+        # aircraft 2 starts over after the turn it was missing from
+        self.assertEqual(history.get_history(2), [(3, Location(9, 9), 3)])
+        self.assertEqual(history.get_velocity(2), (0.0, 0.0))
+        self.assertEqual(history.get_history(3), [])
+        self.assertEqual(history.get_velocity(3), (0.0, 0.0))
+
+
+class GameHistoryTest(unittest.TestCase):
+    def test_history(self):
+        game = make_game()
+        play(game, turn([pirate(1, [5, 5], current_health=3)], drones=[drone(10, [1, 1])]))
+        my_pirate = game.get_my_pirate_by_id(1)
+        # the history starts on the first call
+        self.assertEqual(game.get_history(my_pirate), [(1, Location(5, 5), 3)])
+        self.assertEqual(game.get_speed(my_pirate), 0)
+        play(game, turn([pirate(1, [5, 7], current_health=2)], drones=[drone(10, [1, 2])]),
+             turn([pirate(1, [3, 9], current_health=2)], drones=[drone(10, [1, 3])]))
+        self.assertEqual(game.get_history(my_pirate), [(1, Location(5, 5), 3), (2, Location(5, 7), 2),
+                                                       (3, Location(3, 9), 2)])
+        self.assertEqual(game.get_history(my_pirate, 1), [(3, Location(3, 9), 2)])
+        self.assertEqual(game.get_heading(my_pirate), (-1.0, 2.0))
+        self.assertEqual(game.get_speed(my_pirate), 3.0)
+        self.assertEqual(game.get_heading(game.get_my_drone_by_id(10)), (0.0, 1.0))
+
+    def test_dead_pirate(self):
+        game = make_game()
+        play(game, turn([pirate(1, [5, 5], current_health=3)]))
+        my_pirate = game.get_my_pirate_by_id(1)
+        game.get_history(my_pirate)
+        play(game, turn(dead_pirates=[pirate(1, [5, 5], turns_to_revive=2)]))
+        self.assertEqual(game.get_history(my_pirate), [])
+        play(game, turn([pirate(1, [0, 1], current_health=3)]))
+        self.assertEqual(game.get_history(my_pirate), [(3, Location(0, 1), 3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests the per turn cache of the getters and of the bot's functions.
+"""
+import gc
+import unittest
+import weakref
+
+from TurnCache import per_turn_cache
+from test_support import make_game, pirate, play, turn
+
+_calls = []
+
+
+@per_turn_cache
+def _count_pirates(game, factor):
+    _calls.append(factor)
+    return len(game.get_my_living_pirates()) * factor
+
+
+class TurnCacheTest(unittest.TestCase):
+    def setUp(self):
+        del _calls[:]
+        self.game = make_game()
+        play(self.game, turn([pirate(1, [5, 5], current_health=3), pirate(2, [6, 6], current_health=3)]))
+
+    def test_hit_and_miss(self):
+        cache = self.game.get_turn_cache()
+        cache.reset_counters()
+        self.assertEqual(_count_pirates(self.game, 2), 4)
+        self.assertEqual(_count_pirates(self.game, 2), 4)
+        self.assertEqual(_count_pirates(self.game, 3), 6)
+        self.assertEqual(_calls, [2, 3])
+        # the getter inside the function is cached as well
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+
+    def test_unhashable_arguments_are_not_cached(self):
+        @per_turn_cache
+        def first(game, values):
+            _calls.append(values)
+            return values[0]
+
+        self.assertEqual(first(self.game, [7]), 7)
+        self.assertEqual(first(self.game, [7]), 7)
+        self.assertEqual(len(_calls), 2)
+
+    def test_new_turn_invalidates(self):
+        self.assertEqual(_count_pirates(self.game, 1), 2)
+        play(self.game, turn([pirate(1, [5, 5], current_health=3)]))
+        self.assertEqual(_count_pirates(self.game, 1), 1)
+        self.assertEqual(_calls, [1, 1])
+
+    def test_games_have_separate_caches(self):
+        other_game = make_game()
+        play(other_game, turn([pirate(1, [5, 5], current_health=3)]))
+        self.assertEqual(_count_pirates(self.game, 1), 2)
+        self.assertEqual(_count_pirates(other_game, 1), 1)
+        # a turn of the other game keeps the results of this game
+        play(other_game, turn())
+        self.assertEqual(_count_pirates(self.game, 1), 2)
+        self.assertEqual(_calls, [1, 1])
+
+    def test_game_is_freed(self):
+        other_game = make_game()
+        play(other_game, turn([pirate(1, [5, 5], current_health=3)]))
+        _count_pirates(other_game, 1)
+        other_game.get_my_living_pirates()
+        game_reference = weakref.ref(other_game)
+        del other_game
+        gc.collect()
+        self.assertIsNone(game_reference())
+
+    def test_getters_return_new_lists(self):
+        pirates = self.game.get_my_living_pirates()
+        self.assertIsInstance(pirates, list)
+        pirates.append(None)
+        pirates.sort()
+        self.assertEqual(len(self.game.get_my_living_pirates()), 2)
+        self.assertIsNot(self.game.get_all_islands(), self.game.get_all_islands())
+        self.assertEqual(self.game.get_all_islands() + [None], self.game.get_all_islands() + [None])
+
+
+if __name__ == '__main__':
+    unittest.main()
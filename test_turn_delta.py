@@ -0,0 +1,53 @@
+"""
+Tests that a turn applied as a turn_delta leaves the game in the same state as the same turn sent in full.
+"""
+import copy
+import unittest
+
+from test_support import make_game, pirate, play, turn
+
+
+def _pirates_state(game):
+    """
+    Gets the state of all my pirates, by unique id.
+    """
+    return dict((my_pirate.unique_id, (my_pirate.location, my_pirate.current_health, my_pirate.turns_to_revive,
+                                       my_pirate.is_alive()))
+                for my_pirate in game.get_all_my_pirates())
+
+
+class TurnDeltaTest(unittest.TestCase):
+    def setUp(self):
+        self.full_game = make_game()
+        self.delta_game = make_game(protocol={'turn_delta': True})
+
+    def _apply(self, full_turn, delta):
+        play(self.full_game, full_turn)
+        self.delta_game._update_delta(copy.deepcopy(delta))
+        self.assertEqual(_pirates_state(self.full_game), _pirates_state(self.delta_game))
+
+    def test_revive(self):
+        first_turn = turn([pirate(1, [5, 5], current_health=3)], [pirate(2, [8, 8], turns_to_revive=1)])
+        play(self.full_game, first_turn)
+        play(self.delta_game, first_turn)
+
+        self._apply(turn([pirate(1, [5, 5], current_health=3), pirate(2, [0, 2], current_health=3)]),
+                    {'changed': {'pirates': [{'unique_id': 2, 'location': [0, 2], 'current_health': 3}]}})
+        revived = self.delta_game.get_my_pirate_by_id(2)
+        self.assertTrue(revived.is_alive())
+        self.assertEqual(revived.turns_to_revive, 0)
+
+    def test_death(self):
+        first_turn = turn([pirate(1, [5, 5], current_health=3), pirate(2, [8, 8], current_health=1)])
+        play(self.full_game, first_turn)
+        play(self.delta_game, first_turn)
+
+        self._apply(turn([pirate(1, [5, 5], current_health=3)], [pirate(2, [8, 8], turns_to_revive=5)]),
+                    {'changed': {'dead_pirates': [{'unique_id': 2, 'turns_to_revive': 5}]}})
+        dead = self.delta_game.get_my_pirate_by_id(2)
+        self.assertFalse(dead.is_alive())
+        self.assertEqual(dead.current_health, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
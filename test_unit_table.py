@@ -0,0 +1,85 @@
+"""
+Tests the columnar table of the living aircrafts, filled from records and from decoded game objects.
+"""
+import json
+import unittest
+
+import UnitTable
+from Pirates import parse_data
+from test_support import drone, make_game, pirate, play, turn
+
+TURN = turn([pirate(1, [5, 5], current_health=3), pirate(2, [20, 20], owner=1, current_health=2)],
+            [pirate(3, [8, 8], turns_to_revive=4)],
+            [drone(10, [6, 7], owner=1), drone(11, [30, 30], owner=1), drone(12, [4, 4])])
+
+
+class UnitTableTest(unittest.TestCase):
+    def setUp(self):
+        self.numpy = UnitTable.numpy
+
+    def tearDown(self):
+        UnitTable.numpy = self.numpy
+
+    def _check_table(self, table):
+        # the units are in the order of the records, or of the players when the table is filled from the objects
+        units = dict((table.unique_ids[index], (table.kinds[index], table.owners[index], table.rows[index],
+                                                table.cols[index], table.healths[index], table.max_speeds[index]))
+                     for index in xrange(len(table)))
+        pirate_kind = UnitTable.UnitTable.PIRATE
+        drone_kind = UnitTable.UnitTable.DRONE
+        self.assertEqual(len(table), 5)
+        self.assertEqual(units, {1: (pirate_kind, 0, 5, 5, 3, 2), 2: (pirate_kind, 1, 20, 20, 2, 2),
+                                 10: (drone_kind, 1, 6, 7, 1, 1), 11: (drone_kind, 1, 30, 30, 1, 1),
+                                 12: (drone_kind, 0, 4, 4, 1, 1)})
+        for index in xrange(len(table)):
+            self.assertEqual(table.get_aircraft(index).unique_id, table.unique_ids[index])
+
+    def test_fill_records(self):
+        game = make_game()
+        table = game.get_unit_table()
+        play(game, TURN)
+        self._check_table(table)
+
+    def test_fill_records_of_lazy_sections(self):
+        game = make_game()
+        game.set_lazy_sections(True)
+        table = game.get_unit_table()
+        play(game, TURN)
+        self._check_table(table)
+        self.assertIs(table.get_aircraft(list(table.unique_ids).index(10)), game.get_enemy_drone_by_id(10))
+
+    def test_fill_decoded_objects(self):
+        game = make_game()
+        table = game.get_unit_table()
+        object_hook = game._get_object_hook()
+        self.assertIsNotNone(object_hook)
+        game._update(parse_data(json.dumps(TURN), object_hook), decoded=True)
+        self._check_table(table)
+        self.assertIs(table.get_aircraft(list(table.unique_ids).index(1)), game.get_my_pirate_by_id(1))
+
+    def test_table_made_mid_game(self):
+        game = make_game()
+        play(game, TURN)
+        self._check_table(game.get_unit_table())
+
+    def _check_in_range(self):
+        game = make_game()
+        table = game.get_unit_table()
+        play(game, TURN)
+        self.assertEqual(table.in_range(5, 5, 3), [0, 2, 4])
+        self.assertEqual(table.in_range(5, 5, 3, owner=1), [2])
+        self.assertEqual(table.in_range(5, 5, 3, kind=UnitTable.UnitTable.DRONE), [2, 4])
+        self.assertEqual(table.in_range(5, 5, 100, owner=1, kind=UnitTable.UnitTable.PIRATE), [1])
+        self.assertEqual(table.get_aircrafts(table.in_range(5, 5, 3, owner=1)), [game.get_enemy_drone_by_id(10)])
+
+    def test_in_range_without_numpy(self):
+        UnitTable.numpy = None
+        self._check_in_range()
+
+    @unittest.skipIf(UnitTable.numpy is None, 'NumPy is not installed')
+    def test_in_range_with_numpy(self):
+        self._check_in_range()
+
+
+if __name__ == '__main__':
+    unittest.main()